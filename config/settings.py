@@ -3,6 +3,7 @@ API 설정 및 키 관리
 """
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Optional
 
 
 class Settings(BaseSettings):
@@ -23,6 +24,62 @@ class Settings(BaseSettings):
     # 위험지역 POI API
     DANGER_INFO_BASE_URL: str = "https://apis.data.go.kr/B553662/dangerInfoService"
 
+    # HTTP 커넥션 풀 (호스트별 공유 클라이언트)
+    HTTP_TIMEOUT: float = 30.0
+    HTTP_POOL_MAX_CONNECTIONS: int = 100
+    HTTP_POOL_MAX_KEEPALIVE: int = 20
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP2_ENABLED: bool = True
+
+    # 업스트림 호스트별 서킷 브레이커 (연속 실패 시 즉시 실패 + 캐시 응답)
+    BREAKER_ENABLED: bool = True
+    BREAKER_FAILURE_THRESHOLD: int = 5
+    BREAKER_RESET_TIMEOUT: float = 30.0  # open 후 시험 요청까지 대기 초
+    # 헤지 요청 (최근 p95 경과 시 동일 요청 1회 추가, 지연 하한/상한 초)
+    HEDGE_ENABLED: bool = False
+    HEDGE_MIN_DELAY: float = 0.2
+    HEDGE_MAX_DELAY: float = 5.0
+
+    # 응답 캐시 (소스별 TTL 초, LRU 최대 항목 수)
+    RESPONSE_CACHE_ENABLED: bool = True
+    STATION_CACHE_TTL: float = 6 * 60 * 60
+    WEATHER_CACHE_TTL: float = 5 * 60
+    DANGER_CACHE_TTL: float = 6 * 60 * 60
+    RESPONSE_CACHE_MAX_ENTRIES: int = 256
+
+    # 산악기상 스냅샷 백그라운드 갱신 (초)
+    WEATHER_REFRESH_ENABLED: bool = True
+    WEATHER_REFRESH_INTERVAL: float = 120.0
+    WEATHER_STALE_AFTER: float = 600.0  # 마지막 정상 갱신 후 경과 시 stale 헤더
+    # 갱신 스냅샷 관측 이력 저장 (미지정 시 data/weather_history)
+    WEATHER_HISTORY_ENABLED: bool = True
+    WEATHER_HISTORY_DIR: Optional[str] = None
+    # 셀 기상 피처용 관측소 등록부 CSV (미지정 시 data/observatories.csv, 없으면 Mock 공원 좌표)
+    OBSERVATORY_REGISTRY_PATH: Optional[str] = None
+
+    # 소스별 수집 타임아웃 (초) - 동시 수집 시 소스 단위로 적용
+    SPECTRUM_SOURCE_TIMEOUT: float = 60.0
+    WEATHER_SOURCE_TIMEOUT: float = 60.0
+    DANGER_SOURCE_TIMEOUT: float = 60.0
+
+    # 생성 데이터 저장 형식 (parquet / feather / json+csv)
+    EXPORT_FORMAT: str = "parquet"
+    EXPORT_COMPRESSION: str = "zstd"
+
+    # 수색 셀 순위 모델 (미지정 시 models/search_ranker.txt)
+    RANKER_MODEL_PATH: Optional[str] = None
+
+    # 작업 실행기 (프로세스 풀: CPU 연산, 스레드 풀: 블로킹 I/O)
+    EXECUTOR_PROCESS_WORKERS: int = 2
+    EXECUTOR_THREAD_WORKERS: int = 8
+    EXECUTOR_MAX_PENDING: int = 32  # 풀별 대기 작업 상한 (초과 시 503)
+    EXECUTOR_JOB_TIMEOUT: float = 120.0  # 작업별 타임아웃 초 (초과 시 504)
+
+    # 백그라운드 작업 큐 (미지정 시 data/jobs.sqlite3)
+    JOB_DB_PATH: Optional[str] = None
+    JOB_WORKERS: int = 2
+    JOB_RETENTION_HOURS: float = 72.0
+
     # 서버 설정
     HOST: str = "0.0.0.0"
     PORT: int = 8000
@@ -0,0 +1,227 @@
+"""
+CPU/블로킹 작업 실행기
+- 프로세스 풀: CPU 연산 (Mock 대량 생성, 피처 계산 등 GIL을 잡는 Python 코드)
+- 스레드 풀: 블로킹 I/O (파일 저장) 및 GIL을 해제하는 네이티브 연산 (LightGBM/NumPy)
+- 풀별 대기열 상한 (초과 시 ExecutorBusy → 503), 작업별 타임아웃 (JobTimeout → 504)
+- 요청 취소/타임아웃 시 시작 전 작업은 취소, 실행 중인 작업은 포기 처리
+  (프로세스 풀은 모든 워커가 포기된 작업에 묶이면 풀을 재생성해 강제 종료)
+
+이벤트 루프에는 작업 제출/대기만 남으므로 무거운 요청이 있어도 /health 지연이 유지된다.
+"""
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.thread import BrokenThreadPool
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Set
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class ExecutorBusy(RuntimeError):
+    """대기열 상한 초과"""
+
+
+class JobTimeout(TimeoutError):
+    """작업 타임아웃"""
+
+
+class BoundedExecutor:
+    """대기열 상한/타임아웃/취소를 지원하는 풀 래퍼
+
+    풀에는 워커 수만큼만 제출하고 나머지는 이벤트 루프 쪽에서 대기시킨다.
+    (풀 내부 큐에 쌓인 작업은 취소/재생성 시 제어가 어려우므로)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        kind: str = "thread",
+        max_workers: int = 4,
+        max_pending: int = 32,
+        timeout: float = 120.0
+    ):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"지원하지 않는 실행기 종류: {kind}")
+        self.name = name
+        self.kind = kind
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+
+        self._pool = self._create_pool()
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._admitted = 0
+        self._running = 0
+        self._abandoned: Set[Future] = set()
+        self._background: Set[asyncio.Task] = set()
+
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.cancelled = 0
+        self.rejected = 0
+        self.recycles = 0
+
+    def _create_pool(self) -> Executor:
+        if self.kind == "process":
+            # fork는 이벤트 루프/스레드 상태를 복제하므로 spawn 사용
+            return ProcessPoolExecutor(self.max_workers, mp_context=multiprocessing.get_context("spawn"))
+        return ThreadPoolExecutor(self.max_workers, thread_name_prefix=f"{self.name}-worker")
+
+    async def run(self, fn: Callable[..., Any], *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """작업 실행 후 결과 반환 (대기 + 실행 시간 합계에 timeout 적용)"""
+        if self._admitted >= self.max_workers + self.max_pending:
+            self.rejected += 1
+            raise ExecutorBusy(f"{self.name} 실행기 대기열 초과 ({self.max_pending})")
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_workers)
+
+        self._admitted += 1
+        self.submitted += 1
+        try:
+            return await asyncio.wait_for(self._execute(fn, args, kwargs), timeout or self.timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise JobTimeout(f"{self.name} 작업 타임아웃 ({timeout or self.timeout:.0f}초)")
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self._admitted -= 1
+
+    async def _execute(self, fn: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        loop = asyncio.get_running_loop()
+        await self._slots.acquire()
+
+        pool = self._pool
+        try:
+            future = pool.submit(fn, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+
+        self._running += 1
+
+        # 슬롯은 워커가 실제로 비었을 때 반환 (포기한 작업이 끝날 때까지 점유)
+        def on_done(_: Future):
+            try:
+                loop.call_soon_threadsafe(self._release, future)
+            except RuntimeError:
+                # 종료된 이벤트 루프
+                pass
+
+        future.add_done_callback(on_done)
+
+        try:
+            result = await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # wrap_future 취소 시 시작 전 작업은 함께 취소됨, 실행 중이면 포기
+            if not future.done():
+                self._abandon(future)
+            raise
+        except (BrokenProcessPool, BrokenThreadPool):
+            # 워커 비정상 종료 → 이후 요청을 위해 풀 재생성
+            self.failed += 1
+            if self._pool is pool:
+                self._recycle()
+            raise
+        except Exception:
+            self.failed += 1
+            raise
+        self.completed += 1
+        return result
+
+    def _release(self, future: Future):
+        self._running -= 1
+        self._abandoned.discard(future)
+        self._slots.release()
+
+    def _abandon(self, future: Future):
+        self._abandoned.add(future)
+        logger.warning(f"{self.name} 실행 중 작업 포기 ({len(self._abandoned)}/{self.max_workers})")
+        if self.kind == "process" and len(self._abandoned) >= self.max_workers:
+            self._recycle()
+
+    def _recycle(self):
+        """포기된 작업만 남은 프로세스 풀 강제 종료 후 재생성"""
+        old_pool = self._pool
+        self._pool = self._create_pool()
+        self.recycles += 1
+        for process in list(getattr(old_pool, "_processes", {}).values()):
+            process.terminate()
+        old_pool.shutdown(wait=False, cancel_futures=True)
+        logger.warning(f"{self.name} 프로세스 풀 재생성 (워커 {self.max_workers}개)")
+
+    def spawn(self, fn: Callable[..., Any], *args, **kwargs) -> asyncio.Task:
+        """결과를 기다리지 않는 작업 제출 (오류는 로그로만 남김)"""
+        task = asyncio.get_running_loop().create_task(self.run(fn, *args, **kwargs))
+        self._background.add(task)
+
+        def done(t: asyncio.Task):
+            self._background.discard(t)
+            if not t.cancelled() and t.exception() is not None:
+                logger.warning(f"{self.name} 백그라운드 작업 실패: {t.exception()}")
+
+        task.add_done_callback(done)
+        return task
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "workers": self.max_workers,
+            "running": self._running,
+            "queued": max(self._admitted - self._running, 0),
+            "max_pending": self.max_pending,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timeouts": self.timeouts,
+            "cancelled": self.cancelled,
+            "rejected": self.rejected,
+            "abandoned": len(self._abandoned),
+            "recycles": self.recycles
+        }
+
+    def shutdown(self, wait: bool = True):
+        for task in list(self._background):
+            task.cancel()
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+class ExecutorManager:
+    """프로세스 풀(CPU) + 스레드 풀(I/O) 묶음"""
+
+    def __init__(self, process: BoundedExecutor, thread: BoundedExecutor):
+        self.process = process
+        self.thread = thread
+
+    def stats(self) -> Dict[str, Any]:
+        return {"process": self.process.stats(), "thread": self.thread.stats()}
+
+    def shutdown(self, wait: bool = True):
+        self.process.shutdown(wait=wait)
+        self.thread.shutdown(wait=wait)
+
+
+def create_executors(settings) -> ExecutorManager:
+    """설정 기반 실행기 생성"""
+    return ExecutorManager(
+        process=BoundedExecutor(
+            "cpu",
+            kind="process",
+            max_workers=settings.EXECUTOR_PROCESS_WORKERS,
+            max_pending=settings.EXECUTOR_MAX_PENDING,
+            timeout=settings.EXECUTOR_JOB_TIMEOUT
+        ),
+        thread=BoundedExecutor(
+            "io",
+            kind="thread",
+            max_workers=settings.EXECUTOR_THREAD_WORKERS,
+            max_pending=settings.EXECUTOR_MAX_PENDING,
+            timeout=settings.EXECUTOR_JOB_TIMEOUT
+        )
+    )
@@ -0,0 +1,300 @@
+"""
+백그라운드 작업 큐 (SQLite 기록)
+- 수집/생성 같은 장시간 요청을 작업으로 등록하고 즉시 작업 ID 반환
+- 프로세스 내 asyncio 큐 + 고정 수의 워커 태스크로 실행
+- 작업 상태/진행률/단계별 소요시간/결과(건수, 파일 경로)를 SQLite에 기록 → /api/v1/jobs/{id} 조회
+- 동일 종류 + 동일 파라미터 작업이 대기/실행 중이면 새로 만들지 않고 기존 작업 ID 반환
+- 재시작 시 완료되지 못한 작업은 interrupted로 표시 (핸들러는 메모리에만 존재)
+- 요청/워커 경로의 SQLite 읽기·쓰기는 스레드 실행기에서 수행 (이벤트 루프 비차단),
+  상태별 건수는 메모리에서 집계해 /health가 DB를 조회하지 않음
+"""
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+import logging
+
+from src.api.executors import BoundedExecutor, ExecutorBusy
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = Path(__file__).parent.parent.parent / "data" / "jobs.sqlite3"
+
+# 작업 상태
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+INTERRUPTED = "interrupted"
+ACTIVE_STATUSES = (QUEUED, RUNNING)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    dedup_key TEXT NOT NULL,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL,
+    progress REAL NOT NULL DEFAULT 0,
+    stage TEXT,
+    timings TEXT NOT NULL DEFAULT '{}',
+    result TEXT,
+    error TEXT,
+    created_at TEXT NOT NULL,
+    started_at TEXT,
+    finished_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs (created_at);
+"""
+
+JSON_FIELDS = ("params", "timings", "result")
+
+
+def dedup_key(kind: str, params: Dict[str, Any]) -> str:
+    """작업 종류 + 정렬된 파라미터 JSON 해시"""
+    payload = json.dumps([kind, params], sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class JobStore:
+    """작업 기록 SQLite 저장소 (WAL, 단일 커넥션 + 잠금)"""
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_DB_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def _execute(self, sql: str, params: Tuple = ()) -> sqlite3.Cursor:
+        with self._lock:
+            return self._conn.execute(sql, params)
+
+    def insert(self, job_id: str, kind: str, key: str, params: Dict[str, Any]):
+        self._execute(
+            "INSERT INTO jobs (id, kind, dedup_key, params, status, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (job_id, kind, key, json.dumps(params, ensure_ascii=False, default=str), QUEUED, datetime.now().isoformat())
+        )
+
+    def update(self, job_id: str, **fields):
+        """지정 컬럼 갱신 (params/timings/result는 JSON 직렬화)"""
+        for name in JSON_FIELDS:
+            if name in fields:
+                fields[name] = json.dumps(fields[name], ensure_ascii=False, default=str)
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        self._execute(f"UPDATE jobs SET {columns} WHERE id = ?", (*fields.values(), job_id))
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        row = self._execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_dict(row) if row else None
+
+    def list(self, limit: int = 50, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        if status:
+            rows = self._execute(
+                "SELECT * FROM jobs WHERE status = ? ORDER BY created_at DESC LIMIT ?", (status, limit)
+            ).fetchall()
+        else:
+            rows = self._execute("SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,)).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def mark_interrupted(self) -> int:
+        """이전 프로세스에서 끝나지 못한 작업 정리"""
+        return self._execute(
+            "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE status IN (?, ?)",
+            (INTERRUPTED, "서버 재시작으로 중단됨", datetime.now().isoformat(), *ACTIVE_STATUSES)
+        ).rowcount
+
+    def purge(self, older_than: timedelta) -> int:
+        """보존 기간이 지난 완료 작업 삭제"""
+        cutoff = (datetime.now() - older_than).isoformat()
+        return self._execute(
+            "DELETE FROM jobs WHERE status NOT IN (?, ?) AND created_at < ?", (*ACTIVE_STATUSES, cutoff)
+        ).rowcount
+
+    def counts(self) -> Dict[str, int]:
+        rows = self._execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status").fetchall()
+        return {row["status"]: row["n"] for row in rows}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        job = dict(row)
+        for name in JSON_FIELDS:
+            if job.get(name) is not None:
+                job[name] = json.loads(job[name])
+        job.pop("dedup_key", None)
+        return job
+
+
+class JobContext:
+    """핸들러에 전달되는 진행 상황 기록기"""
+
+    def __init__(self, queue: "JobQueue", job_id: str, params: Dict[str, Any]):
+        self.queue = queue
+        self.job_id = job_id
+        self.params = params
+        self.timings: Dict[str, float] = {}
+        self._stage: Optional[str] = None
+        self._stage_started = time.perf_counter()
+
+    async def stage(self, name: str, progress: float):
+        """새 단계 시작 (이전 단계 소요시간 기록)"""
+        self.close_stage()
+        self._stage = name
+        self._stage_started = time.perf_counter()
+        await self.queue.call_store(
+            self.queue.store.update, self.job_id, stage=name, progress=round(progress, 3), timings=dict(self.timings)
+        )
+
+    def close_stage(self):
+        if self._stage is not None:
+            self.timings[f"{self._stage}_ms"] = round((time.perf_counter() - self._stage_started) * 1000, 1)
+            self._stage = None
+
+
+JobHandler = Callable[[JobContext], Awaitable[Dict[str, Any]]]
+
+
+class JobQueue:
+    """프로세스 내 작업 큐 (asyncio 워커 태스크 + SQLite 기록)"""
+
+    def __init__(
+        self,
+        store: JobStore,
+        workers: int = 2,
+        retention_hours: float = 72.0,
+        executor: Optional[BoundedExecutor] = None
+    ):
+        self.store = store
+        self.workers = workers
+        self.retention = timedelta(hours=retention_hours)
+        self.executor = executor
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._active: Dict[str, str] = {}  # dedup_key → job_id
+        self._counts: Dict[str, int] = {}  # 상태별 건수 (DB와 동기화된 메모리 집계)
+        self.deduplicated = 0
+
+    def start(self):
+        """시작 시 1회 정리 + 건수 적재 (요청 처리 전이므로 동기 실행)"""
+        interrupted = self.store.mark_interrupted()
+        if interrupted:
+            logger.warning(f"이전 실행에서 중단된 작업 {interrupted}건 interrupted 처리")
+        purged = self.store.purge(self.retention)
+        if purged:
+            logger.info(f"보존 기간 지난 작업 {purged}건 삭제")
+        self._counts = self.store.counts()
+        self._queue = asyncio.Queue()
+        self._tasks = [asyncio.create_task(self._worker(i)) for i in range(self.workers)]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def call_store(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """저장소 호출을 스레드 실행기에서 실행 (실행기 미설정/대기열 초과 시 직접 호출)"""
+        if self.executor is None:
+            return fn(*args, **kwargs)
+        try:
+            return await self.executor.run(fn, *args, **kwargs)
+        except ExecutorBusy:
+            # 상태 기록이 누락되지 않도록 짧은 쿼리는 직접 실행
+            return fn(*args, **kwargs)
+
+    def _transition(self, old: Optional[str], new: str):
+        if old is not None:
+            self._counts[old] = self._counts.get(old, 0) - 1
+        self._counts[new] = self._counts.get(new, 0) + 1
+
+    async def submit(self, kind: str, params: Dict[str, Any], handler: JobHandler) -> Tuple[str, bool]:
+        """작업 등록 → (작업 ID, 중복 여부)"""
+        key = dedup_key(kind, params)
+        existing = self._active.get(key)
+        if existing is not None:
+            self.deduplicated += 1
+            return existing, True
+
+        job_id = uuid.uuid4().hex
+        # 기록 대기 중 같은 작업이 들어와도 중복 등록되지 않도록 먼저 예약
+        self._active[key] = job_id
+        try:
+            await self.call_store(self.store.insert, job_id, kind, key, params)
+        except BaseException:
+            self._active.pop(key, None)
+            raise
+        self._transition(None, QUEUED)
+        self._queue.put_nowait((job_id, key, params, handler))
+        return job_id, False
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return await self.call_store(self.store.get, job_id)
+
+    async def list(self, limit: int = 50, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        return await self.call_store(self.store.list, limit, status)
+
+    async def _worker(self, index: int):
+        while True:
+            job_id, key, params, handler = await self._queue.get()
+            try:
+                await self._run(job_id, params, handler)
+            finally:
+                self._active.pop(key, None)
+                self._queue.task_done()
+
+    async def _run(self, job_id: str, params: Dict[str, Any], handler: JobHandler):
+        context = JobContext(self, job_id, params)
+        started = time.perf_counter()
+        await self.call_store(self.store.update, job_id, status=RUNNING, started_at=datetime.now().isoformat())
+        self._transition(QUEUED, RUNNING)
+        try:
+            result = await handler(context)
+        except asyncio.CancelledError:
+            context.close_stage()
+            # 종료 중에는 실행기도 정리되므로 직접 기록
+            self.store.update(
+                job_id, status=INTERRUPTED, error="서버 종료로 중단됨",
+                timings=context.timings, finished_at=datetime.now().isoformat()
+            )
+            self._transition(RUNNING, INTERRUPTED)
+            raise
+        except Exception as e:
+            logger.warning(f"작업 실패 {job_id}: {e}")
+            context.close_stage()
+            await self.call_store(
+                self.store.update, job_id, status=FAILED, error=str(e) or type(e).__name__,
+                timings=context.timings, finished_at=datetime.now().isoformat()
+            )
+            self._transition(RUNNING, FAILED)
+            return
+
+        context.close_stage()
+        context.timings["total_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        await self.call_store(
+            self.store.update, job_id, status=SUCCEEDED, progress=1.0, stage="done", timings=context.timings,
+            result=result, finished_at=datetime.now().isoformat()
+        )
+        self._transition(RUNNING, SUCCEEDED)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "queued": self._queue.qsize() if self._queue else 0,
+            "active": len(self._active),
+            "deduplicated": self.deduplicated,
+            "by_status": {status: n for status, n in self._counts.items() if n > 0}
+        }
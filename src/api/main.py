@@ -9,26 +9,44 @@ from pathlib import Path
 # 프로젝트 루트 추가
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
-import json
+import asyncio
+import time
 from datetime import datetime
-from typing import Optional
-import pandas as pd
+from typing import Optional, Dict, Any, Awaitable
 
 from src.data.api_clients import (
+    PagedResult,
     SpectrumMapClient,
     MountainWeatherClient,
     DangerInfoClient
 )
-from src.data.mock_data import MockDataGenerator
+from src.data.http_pool import HTTPClientPool, create_http_pool
+from src.data.cache import ResponseCache
+from src.data.circuit_breaker import BreakerRegistry, create_breakers
+from src.data.station_index import StationIndex
+from src.data.feature_store import FeatureStore, refresh_coverage, refresh_weather
+from src.data.observatories import ObservatoryRegistry, DEFAULT_REGISTRY_PATH
+from src.models.ranker import SearchRanker, DEFAULT_MODEL_PATH
+from src.data.export import write_datasets
+from src.data.weather_snapshot import WeatherRefresher, WeatherSnapshot
+from src.data.weather_history import WeatherHistoryStore, DEFAULT_HISTORY_DIR
+from src.api.executors import ExecutorManager, ExecutorBusy, JobTimeout, create_executors
+from src.api.workers import mock_records, mock_all_test_data
+from src.api.jobs import JobContext, JobQueue, JobStore, DEFAULT_DB_PATH as DEFAULT_JOB_DB_PATH
+from src.api.streaming import wants_ndjson, ndjson_response, iter_frame_batches
+from src.api.serialization import list_response
 from src.api.schemas import (
     APIResponse,
     BaseStationRequest, BaseStationResponse, BaseStation,
     MountainWeatherRequest, MountainWeatherResponse, MountainWeather,
     DangerInfoRequest, DangerInfoResponse, DangerInfo,
     GenerateTestDataRequest, GenerateTestDataResponse,
+    SearchRankRequest, SearchRankResponse,
+    JobSubmitResponse, JobStatusResponse,
     ParkType, CarrierType
 )
 from config.settings import get_settings
@@ -36,24 +54,138 @@ from config.settings import get_settings
 settings = get_settings()
 
 # API 클라이언트 인스턴스
+http_pool: Optional[HTTPClientPool] = None
+breakers: Optional[BreakerRegistry] = None
 spectrum_client: Optional[SpectrumMapClient] = None
 weather_client: Optional[MountainWeatherClient] = None
 danger_client: Optional[DangerInfoClient] = None
+response_caches: Dict[str, ResponseCache] = {}
+station_index = StationIndex()
+feature_store: Optional[FeatureStore] = None
+search_ranker: Optional[SearchRanker] = None
+executors: Optional[ExecutorManager] = None
+job_queue: Optional[JobQueue] = None
+weather_refresher: Optional[WeatherRefresher] = None
+weather_history: Optional[WeatherHistoryStore] = None
+observatory_registry: Optional[ObservatoryRegistry] = None
+
+
+def create_response_caches() -> Dict[str, ResponseCache]:
+    """소스별 응답 캐시 생성 (비활성화 시 빈 dict)"""
+    if not settings.RESPONSE_CACHE_ENABLED:
+        return {}
+    max_entries = settings.RESPONSE_CACHE_MAX_ENTRIES
+    return {
+        "spectrum_map": ResponseCache("spectrum_map", settings.STATION_CACHE_TTL, max_entries),
+        "mountain_weather": ResponseCache("mountain_weather", settings.WEATHER_CACHE_TTL, max_entries),
+        "danger_info": ResponseCache("danger_info", settings.DANGER_CACHE_TTL, max_entries)
+    }
+
+
+def on_station_cache_update(key, stations: list):
+    """기지국 캐시 리스너 - 색인 갱신 후 영향 셀 coverage 재계산 (스레드 풀)"""
+    changed = station_index.on_cache_update(key, stations)
+    if feature_store is None or len(changed) == 0:
+        return
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        refresh_coverage(feature_store, station_index, changed[:, 0], changed[:, 1])
+        return
+    executors.thread.spawn(refresh_coverage, feature_store, station_index, changed[:, 0], changed[:, 1])
+
+
+def on_weather_snapshot(snapshot: WeatherSnapshot):
+    """기상 스냅샷 리스너 - 관측 이력 추가 + 저장된 셀 weather 피처 재계산 (스레드 풀)"""
+    if weather_history is not None:
+        executors.thread.spawn(weather_history.append, snapshot.records)
+    if feature_store is not None and observatory_registry is not None:
+        executors.thread.spawn(refresh_weather, feature_store, observatory_registry, snapshot.records, snapshot.fetched_at)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 시작/종료 시 실행"""
-    global spectrum_client, weather_client, danger_client
+    global http_pool, breakers, spectrum_client, weather_client, danger_client, response_caches, feature_store, search_ranker, executors, job_queue, weather_refresher, weather_history, observatory_registry
+
+    # CPU 작업(프로세스 풀) / 블로킹 I/O(스레드 풀) 실행기
+    executors = create_executors(settings)
+
+    # 장시간 수집/생성 작업 큐 (SQLite 기록)
+    job_queue = JobQueue(
+        JobStore(settings.JOB_DB_PATH or DEFAULT_JOB_DB_PATH),
+        workers=settings.JOB_WORKERS,
+        retention_hours=settings.JOB_RETENTION_HOURS,
+        executor=executors.thread
+    )
+    job_queue.start()
+
+    # 호스트별 공유 커넥션 풀
+    http_pool = create_http_pool(settings)
+    breakers = create_breakers(settings)
+    response_caches = create_response_caches()
+
+    # 기지국 캐시 갱신 시 기지국 색인 + 주변 셀 coverage 피처 증분 반영
+    feature_store = FeatureStore()
+    if "spectrum_map" in response_caches:
+        response_caches["spectrum_map"].add_listener(on_station_cache_update)
 
     # 클라이언트 초기화
-    spectrum_client = SpectrumMapClient(api_key=settings.SPECTRUM_MAP_API_KEY)
-    weather_client = MountainWeatherClient(service_key=settings.PUBLIC_DATA_API_KEY)
-    danger_client = DangerInfoClient(service_key=settings.PUBLIC_DATA_API_KEY)
+    spectrum_client = SpectrumMapClient(
+        api_key=settings.SPECTRUM_MAP_API_KEY,
+        base_url=settings.SPECTRUM_MAP_BASE_URL,
+        http_pool=http_pool,
+        cache=response_caches.get("spectrum_map"),
+        breakers=breakers
+    )
+    weather_client = MountainWeatherClient(
+        service_key=settings.PUBLIC_DATA_API_KEY,
+        base_url=settings.MOUNTAIN_WEATHER_BASE_URL,
+        http_pool=http_pool,
+        cache=response_caches.get("mountain_weather"),
+        breakers=breakers
+    )
+    danger_client = DangerInfoClient(
+        service_key=settings.PUBLIC_DATA_API_KEY,
+        base_url=settings.DANGER_INFO_BASE_URL,
+        http_pool=http_pool,
+        cache=response_caches.get("danger_info"),
+        breakers=breakers
+    )
+
+    # 산악기상 전국 스냅샷 주기 갱신 (요청은 스냅샷에서 응답)
+    if settings.WEATHER_REFRESH_ENABLED:
+        weather_refresher = WeatherRefresher(
+            weather_client,
+            interval=settings.WEATHER_REFRESH_INTERVAL,
+            stale_after=settings.WEATHER_STALE_AFTER
+        )
+        # 폴링한 스냅샷을 관측소별 시계열로 누적 (사고 시점 기상 피처용)
+        if settings.WEATHER_HISTORY_ENABLED:
+            weather_history = WeatherHistoryStore(settings.WEATHER_HISTORY_DIR or DEFAULT_HISTORY_DIR)
+        # 스냅샷마다 저장된 셀의 weather 피처 패밀리만 재계산
+        observatory_registry = ObservatoryRegistry.load(settings.OBSERVATORY_REGISTRY_PATH or DEFAULT_REGISTRY_PATH)
+        weather_refresher.add_listener(on_weather_snapshot)
+        weather_refresher.start()
+
+    # 수색 셀 순위 모델 (1회 로드)
+    model_path = Path(settings.RANKER_MODEL_PATH or DEFAULT_MODEL_PATH)
+    if model_path.exists():
+        search_ranker = SearchRanker.load(model_path, feature_store=feature_store)
+    else:
+        print(f"순위 모델 없음 (순위 API 비활성): {model_path}")
 
     print("API 클라이언트 초기화 완료")
-    yield
-    print("애플리케이션 종료")
+    try:
+        yield
+    finally:
+        if weather_refresher is not None:
+            await weather_refresher.stop()
+        await job_queue.stop()
+        job_queue.store.close()
+        await http_pool.aclose()
+        executors.shutdown(wait=False)
+        print("애플리케이션 종료")
 
 
 app = FastAPI(
@@ -73,6 +205,18 @@ app.add_middleware(
 )
 
 
+@app.exception_handler(ExecutorBusy)
+async def executor_busy_handler(request: Request, exc: ExecutorBusy):
+    """실행기 대기열 초과 → 503 (재시도 안내)"""
+    return JSONResponse(status_code=503, content={"detail": str(exc)}, headers={"Retry-After": "5"})
+
+
+@app.exception_handler(JobTimeout)
+async def job_timeout_handler(request: Request, exc: JobTimeout):
+    """실행기 작업 타임아웃 → 504"""
+    return JSONResponse(status_code=504, content={"detail": str(exc)})
+
+
 # ===== 헬스체크 =====
 @app.get("/", response_model=APIResponse)
 async def root():
@@ -93,18 +237,44 @@ async def health_check():
         data={
             "spectrum_client": spectrum_client is not None,
             "weather_client": weather_client is not None,
-            "danger_client": danger_client is not None
+            "danger_client": danger_client is not None,
+            "http_pool_hosts": http_pool.hosts if http_pool else [],
+            "circuit_breakers": breakers.stats() if breakers else {},
+            "cache": {name: cache.stats() for name, cache in response_caches.items()},
+            "station_index": station_index.stats(),
+            "feature_store": feature_store.stats() if feature_store else {},
+            "search_ranker": search_ranker is not None,
+            "executors": executors.stats() if executors else {},
+            "jobs": job_queue.stats() if job_queue else {},
+            "weather_snapshot": weather_refresher.stats() if weather_refresher else {},
+            "weather_history": weather_history.stats() if weather_history else {}
         }
     )
 
 
 # ===== 전파누리 API (기지국) =====
+def filter_stations(stations: list, carrier: str = "ALL", service: str = "ALL") -> list:
+    """통신사/서비스 유형 필터 (통신사 코드·서비스 코드·서비스명에 포함 여부, 대소문자 무시)"""
+    def matches(station: Dict[str, Any], wanted: str, fields: tuple) -> bool:
+        raw = station.get("_raw") or {}
+        text = " ".join(str(station.get(f) or raw.get(f) or "") for f in fields).upper()
+        return wanted.upper() in text
+
+    if carrier.upper() != "ALL":
+        stations = [s for s in stations if matches(s, carrier, ("CUS_CD", "SERVICE_NAME"))]
+    if service.upper() != "ALL":
+        stations = [s for s in stations if matches(s, service, ("SERVICE_CD", "SERVICE_NAME"))]
+    return stations
+
+
 @app.get("/api/v1/stations", response_model=BaseStationResponse)
 async def get_base_stations(
+    request: Request,
     park_name: str = "ALL",
     park_type: int = 1,
     carrier: str = "ALL",
-    service: str = "ALL"
+    service: str = "ALL",
+    stream: bool = False
 ):
     """
     이동통신 기지국 정보 조회 (전파누리 API)
@@ -113,51 +283,74 @@ async def get_base_stations(
     - park_type: 1=국립, 2=도립, 3=군립
     - carrier: SK/KT/LG/ALL
     - service: 2G/3G/4G/5G/ALL
+    - stream: true 또는 Accept: application/x-ndjson 이면 NDJSON 스트리밍
     """
     try:
+        # 전파누리 API는 통신사/서비스 조건이 없으므로 조회(캐시) 후 필터링
         data = await spectrum_client.fetch_data(
             park_name=park_name,
             park_type=park_type,
-            carrier=carrier,
-            service=service,
             max_pages=3
         )
+        data = filter_stations(data, carrier, service)
 
-        stations = [BaseStation(**item) for item in data]
+        if wants_ndjson(request, stream):
+            return ndjson_response([data], BaseStation)
 
-        return BaseStationResponse(
-            success=True,
-            message=f"기지국 정보 {len(stations)}건 조회 완료",
-            data=stations,
-            count=len(stations)
+        return list_response(
+            BaseStation,
+            data,
+            message=f"기지국 정보 {len(data)}건 조회 완료"
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"전파누리 API 오류: {str(e)}")
 
 
 @app.get("/api/v1/stations/{park_name}", response_model=BaseStationResponse)
-async def get_stations_by_park(park_name: str):
+async def get_stations_by_park(request: Request, park_name: str, stream: bool = False):
     """특정 공원의 기지국 정보 조회"""
     try:
         data = await spectrum_client.get_stations_by_park(park_name)
-        stations = [BaseStation(**item) for item in data]
+        if wants_ndjson(request, stream):
+            return ndjson_response([data], BaseStation)
 
-        return BaseStationResponse(
-            success=True,
-            message=f"{park_name} 기지국 정보 {len(stations)}건 조회 완료",
-            data=stations,
-            count=len(stations)
+        return list_response(
+            BaseStation,
+            data,
+            message=f"{park_name} 기지국 정보 {len(data)}건 조회 완료"
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"전파누리 API 오류: {str(e)}")
 
 
 # ===== 산악기상정보 API =====
+def weather_snapshot_response(
+    request: Request,
+    stream: bool,
+    local_area: Optional[str] = None,
+    obs_id: Optional[str] = None
+):
+    """스냅샷 필터 결과 응답 (업스트림 호출 없음, 갱신 실패 시 마지막 정상 스냅샷 + stale 헤더)"""
+    data = weather_refresher.snapshot.filter(local_area=local_area, obs_id=obs_id)
+    if wants_ndjson(request, stream):
+        response = ndjson_response([data], MountainWeather)
+    else:
+        response = list_response(
+            MountainWeather,
+            data,
+            message=f"산악기상 정보 {len(data)}건 조회 완료 (스냅샷)"
+        )
+    response.headers.update(weather_refresher.headers())
+    return response
+
+
 @app.get("/api/v1/weather", response_model=MountainWeatherResponse)
 async def get_mountain_weather(
+    request: Request,
     local_area: Optional[str] = None,
     obs_id: Optional[str] = None,
-    obs_time: Optional[str] = None
+    obs_time: Optional[str] = None,
+    stream: bool = False
 ):
     """
     산악기상 정보 조회
@@ -165,7 +358,19 @@ async def get_mountain_weather(
     - local_area: 지역코드 (01:서울, 02:부산, 03:대구, 04:인천...)
     - obs_id: 관측소번호
     - obs_time: 관측시간 (예: 202103221952)
+    - stream: true 또는 Accept: application/x-ndjson 이면 페이지 수신 즉시 NDJSON 스트리밍
+
+    관측시간 미지정 시 백그라운드 갱신 스냅샷에서 응답합니다 (X-Snapshot-* 헤더).
     """
+    if obs_time is None and weather_refresher is not None and weather_refresher.snapshot is not None:
+        return weather_snapshot_response(request, stream, local_area=local_area, obs_id=obs_id)
+
+    if wants_ndjson(request, stream):
+        return ndjson_response(
+            weather_client.iter_pages(local_area=local_area, obs_id=obs_id, obs_time=obs_time),
+            MountainWeather
+        )
+
     try:
         data = await weather_client.fetch_data(
             local_area=local_area,
@@ -173,30 +378,30 @@ async def get_mountain_weather(
             obs_time=obs_time
         )
 
-        weather_list = [MountainWeather(**item) for item in data]
-
-        return MountainWeatherResponse(
-            success=True,
-            message=f"산악기상 정보 {len(weather_list)}건 조회 완료",
-            data=weather_list,
-            count=len(weather_list)
+        return list_response(
+            MountainWeather,
+            data,
+            message=f"산악기상 정보 {len(data)}건 조회 완료"
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"산악기상 API 오류: {str(e)}")
 
 
 @app.get("/api/v1/weather/area/{area_code}", response_model=MountainWeatherResponse)
-async def get_weather_by_area(area_code: str):
+async def get_weather_by_area(request: Request, area_code: str, stream: bool = False):
     """지역별 산악기상 정보 조회"""
+    if weather_refresher is not None and weather_refresher.snapshot is not None:
+        return weather_snapshot_response(request, stream, local_area=area_code)
+
+    if wants_ndjson(request, stream):
+        return ndjson_response(weather_client.iter_pages(local_area=area_code), MountainWeather)
+
     try:
         data = await weather_client.get_weather_by_area(area_code)
-        weather_list = [MountainWeather(**item) for item in data]
-
-        return MountainWeatherResponse(
-            success=True,
-            message=f"지역코드 {area_code} 산악기상 정보 {len(weather_list)}건 조회 완료",
-            data=weather_list,
-            count=len(weather_list)
+        return list_response(
+            MountainWeather,
+            data,
+            message=f"지역코드 {area_code} 산악기상 정보 {len(data)}건 조회 완료"
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"산악기상 API 오류: {str(e)}")
@@ -204,17 +409,17 @@ async def get_weather_by_area(area_code: str):
 
 # ===== 위험지역 POI API =====
 @app.get("/api/v1/danger", response_model=DangerInfoResponse)
-async def get_danger_info():
+async def get_danger_info(request: Request, stream: bool = False):
     """위험지역 POI 정보 조회"""
+    if wants_ndjson(request, stream):
+        return ndjson_response(danger_client.iter_pages(), DangerInfo)
+
     try:
         data = await danger_client.fetch_data()
-        danger_list = [DangerInfo(**item) for item in data]
-
-        return DangerInfoResponse(
-            success=True,
-            message=f"위험지역 정보 {len(danger_list)}건 조회 완료",
-            data=danger_list,
-            count=len(danger_list)
+        return list_response(
+            DangerInfo,
+            data,
+            message=f"위험지역 정보 {len(data)}건 조회 완료"
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"위험지역 API 오류: {str(e)}")
@@ -225,160 +430,246 @@ async def save_test_data(
     park_name: str,
     stations: list,
     weather: list,
-    danger: list
+    danger: list,
+    run_id: Optional[str] = None
 ) -> list:
-    """테스트 데이터를 파일로 저장 (백그라운드 태스크)"""
+    """테스트 데이터를 파일로 저장 (스레드 풀에서 컬럼 포맷 저장 + manifest, 파일명에 작업 ID 포함)"""
     base_path = Path(__file__).parent.parent.parent / "data" / "generated"
-    base_path.mkdir(parents=True, exist_ok=True)
+    manifest = await executors.thread.run(
+        write_datasets,
+        {
+            f"stations_{park_name}": stations,
+            "weather": weather,
+            "danger": danger
+        },
+        base_path,
+        fmt=settings.EXPORT_FORMAT,
+        compression=settings.EXPORT_COMPRESSION,
+        run_id=run_id
+    )
+    return [entry["path"] for entry in manifest["files"]] + [manifest["manifest_path"]]
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    file_paths = []
 
-    # 기지국 데이터 저장
-    if stations:
-        stations_file = base_path / f"stations_{park_name}_{timestamp}.json"
-        with open(stations_file, "w", encoding="utf-8") as f:
-            json.dump(stations, f, ensure_ascii=False, indent=2)
-        file_paths.append(str(stations_file))
-
-        # CSV로도 저장
-        stations_csv = base_path / f"stations_{park_name}_{timestamp}.csv"
-        df = pd.DataFrame(stations)
-        df.to_csv(stations_csv, index=False, encoding="utf-8-sig")
-        file_paths.append(str(stations_csv))
-
-    # 기상 데이터 저장
-    if weather:
-        weather_file = base_path / f"weather_{timestamp}.json"
-        with open(weather_file, "w", encoding="utf-8") as f:
-            json.dump(weather, f, ensure_ascii=False, indent=2)
-        file_paths.append(str(weather_file))
-
-        weather_csv = base_path / f"weather_{timestamp}.csv"
-        df = pd.DataFrame(weather)
-        df.to_csv(weather_csv, index=False, encoding="utf-8-sig")
-        file_paths.append(str(weather_csv))
-
-    # 위험지역 데이터 저장
-    if danger:
-        danger_file = base_path / f"danger_{timestamp}.json"
-        with open(danger_file, "w", encoding="utf-8") as f:
-            json.dump(danger, f, ensure_ascii=False, indent=2)
-        file_paths.append(str(danger_file))
-
-        danger_csv = base_path / f"danger_{timestamp}.csv"
-        df = pd.DataFrame(danger)
-        df.to_csv(danger_csv, index=False, encoding="utf-8-sig")
-        file_paths.append(str(danger_csv))
-
-    return file_paths
-
-
-@app.post("/api/v1/generate-test-data", response_model=GenerateTestDataResponse)
-async def generate_test_data(
-    request: GenerateTestDataRequest,
-    background_tasks: BackgroundTasks
-):
-    """
-    테스트 데이터 생성 및 저장
+async def collect_source(name: str, coro: Awaitable[PagedResult], timeout: float) -> Dict[str, Any]:
+    """단일 소스 수집 (타임아웃/오류 격리, 소요시간 측정)
 
-    3개 외부 API를 호출하여 테스트 데이터를 수집하고 파일로 저장합니다.
+    - 모든 페이지 실패 또는 0건: error / 일부 페이지 실패: partial
     """
+    started = time.perf_counter()
     try:
-        # 1. 기지국 데이터 수집
-        print(f"기지국 데이터 수집 중... (공원: {request.park_name})")
-        stations_data = await spectrum_client.fetch_data(
-            park_name=request.park_name,
-            max_pages=2
-        )
+        result = await asyncio.wait_for(coro, timeout=timeout)
+        data = result.items
+        if result.failed_pages and data:
+            status = "partial"
+            error = f"{len(result.failed_pages)}개 페이지 실패: " + "; ".join(
+                f"page {page}: {message}" for page, message in sorted(result.failed_pages.items())
+            )
+        elif result.failed_pages:
+            status, error = "error", "; ".join(result.failed_pages.values())
+        elif not data:
+            status, error = "error", "응답 0건"
+        else:
+            status, error = "success", None
+    except asyncio.TimeoutError:
+        data, status, error = [], "timeout", f"{timeout:.0f}초 초과"
+    except Exception as e:
+        data, status, error = [], "error", str(e)
 
-        # 2. 산악기상 데이터 수집
-        print("산악기상 데이터 수집 중...")
-        weather_data = await weather_client.fetch_data(max_pages=2)
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+    if error:
+        print(f"{name} 수집 실패 ({status}): {error}")
+    return {"name": name, "status": status, "error": error, "elapsed_ms": elapsed_ms, "data": data}
 
-        # 3. 위험지역 데이터 수집
-        print("위험지역 데이터 수집 중...")
-        danger_data = await danger_client.fetch_data(max_pages=2)
 
-        file_paths = []
+async def collect_all_sources(
+    park_name: str,
+    weather_pages: int,
+    danger_pages: int
+) -> Dict[str, Dict[str, Any]]:
+    """3개 외부 API 동시 수집 - 전체 지연은 가장 느린 소스로 제한
 
-        # 4. 파일 저장
-        if request.save_to_file:
-            file_paths = await save_test_data(
-                park_name=request.park_name,
-                stations=stations_data,
-                weather=weather_data,
-                danger=danger_data
-            )
+    오류를 빈 목록으로 삼키는 fetch_data 대신 실패 페이지를 보고하는 fetch_pages 사용
+    (전파누리 API는 1회 응답에 전체 반환하므로 페이지 수 지정 없음)
+    """
+    results = await asyncio.gather(
+        collect_source(
+            "spectrum_map",
+            spectrum_client.fetch_pages(park_name=park_name),
+            settings.SPECTRUM_SOURCE_TIMEOUT
+        ),
+        collect_source(
+            "mountain_weather",
+            weather_client.fetch_pages(max_pages=weather_pages),
+            settings.WEATHER_SOURCE_TIMEOUT
+        ),
+        collect_source(
+            "danger_info",
+            danger_client.fetch_pages(max_pages=danger_pages),
+            settings.DANGER_SOURCE_TIMEOUT
+        )
+    )
+    return {r["name"]: r for r in results}
+
+
+async def run_test_data_job(job: JobContext) -> Dict[str, Any]:
+    """테스트 데이터 수집 작업 - 3개 외부 API 동시 수집 후 파일 저장"""
+    park_name = job.params["park_name"]
+    await job.stage("collect", 0.1)
+    print(f"외부 API 동시 수집 중... (공원: {park_name})")
+    started = time.perf_counter()
+    sources = await collect_all_sources(
+        park_name,
+        weather_pages=2,
+        danger_pages=2
+    )
+    total_ms = round((time.perf_counter() - started) * 1000, 1)
 
-        return GenerateTestDataResponse(
-            success=True,
-            message="테스트 데이터 생성 완료",
-            base_stations_count=len(stations_data),
-            weather_data_count=len(weather_data),
-            danger_info_count=len(danger_data),
-            file_paths=file_paths,
-            data={
-                "park_name": request.park_name,
-                "stations_sample": stations_data[:3] if stations_data else [],
-                "weather_sample": weather_data[:3] if weather_data else [],
-                "danger_sample": danger_data[:3] if danger_data else []
-            }
+    stations_data = sources["spectrum_map"]["data"]
+    weather_data = sources["mountain_weather"]["data"]
+    danger_data = sources["danger_info"]["data"]
+
+    file_paths = []
+
+    # 파일 저장
+    if job.params["save_to_file"]:
+        await job.stage("save", 0.8)
+        file_paths = await save_test_data(
+            park_name=park_name,
+            stations=stations_data,
+            weather=weather_data,
+            danger=danger_data,
+            run_id=job.job_id
         )
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"테스트 데이터 생성 오류: {str(e)}")
+    source_timings = {
+        name: {k: v for k, v in r.items() if k not in ("name", "data")}
+        for name, r in sources.items()
+    }
+    source_timings["total_ms"] = total_ms
+    failed = [name for name, r in sources.items() if r["status"] != "success"]
+
+    return GenerateTestDataResponse(
+        success=True,
+        message="테스트 데이터 생성 완료" if not failed else f"테스트 데이터 생성 완료 (실패 소스: {', '.join(failed)})",
+        base_stations_count=len(stations_data),
+        weather_data_count=len(weather_data),
+        danger_info_count=len(danger_data),
+        file_paths=file_paths,
+        source_timings=source_timings,
+        data={
+            "park_name": park_name,
+            "stations_sample": stations_data[:3] if stations_data else [],
+            "weather_sample": weather_data[:3] if weather_data else [],
+            "danger_sample": danger_data[:3] if danger_data else []
+        }
+    ).model_dump()
+
+
+async def submit_job(kind: str, params: Dict[str, Any], handler) -> JobSubmitResponse:
+    """작업 등록 후 즉시 응답 (동일 작업 진행 중이면 기존 ID)"""
+    job_id, deduplicated = await job_queue.submit(kind, params, handler)
+    return JobSubmitResponse(
+        success=True,
+        message="동일 작업이 이미 진행 중입니다" if deduplicated else "작업이 등록되었습니다",
+        job_id=job_id,
+        status_url=f"/api/v1/jobs/{job_id}",
+        deduplicated=deduplicated
+    )
 
 
-@app.get("/api/v1/generate-test-data/{park_name}", response_model=GenerateTestDataResponse)
+@app.post("/api/v1/generate-test-data", response_model=JobSubmitResponse, status_code=202)
+async def generate_test_data(request: GenerateTestDataRequest):
+    """
+    테스트 데이터 생성 및 저장 (백그라운드 작업)
+
+    3개 외부 API 동시 수집 + 파일 저장을 작업으로 등록하고 작업 ID를 즉시 반환합니다.
+    진행률/소스별 소요시간/파일 경로는 /api/v1/jobs/{job_id}로 조회합니다.
+    """
+    return await submit_job("generate_test_data", request.model_dump(), run_test_data_job)
+
+
+@app.get("/api/v1/generate-test-data/{park_name}", response_model=JobSubmitResponse, status_code=202)
 async def generate_test_data_get(park_name: str):
-    """GET 방식으로 테스트 데이터 생성 (간편 호출)"""
+    """GET 방식으로 테스트 데이터 생성 작업 등록 (간편 호출)"""
     request = GenerateTestDataRequest(park_name=park_name, save_to_file=True)
-    return await generate_test_data(request, BackgroundTasks())
+    return await generate_test_data(request)
+
+
+# ===== 백그라운드 작업 =====
+@app.get("/api/v1/jobs/{job_id}", response_model=JobStatusResponse)
+async def get_job(job_id: str):
+    """작업 상태/진행률/결과 조회"""
+    job = await job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"작업 없음: {job_id}")
+    return JobStatusResponse(success=job["status"] != "failed", message=job["status"], data=job)
+
+
+@app.get("/api/v1/jobs", response_model=APIResponse)
+async def list_jobs(status: Optional[str] = None, limit: int = 50):
+    """최근 작업 목록"""
+    jobs = await job_queue.list(limit=min(limit, 500), status=status)
+    return APIResponse(success=True, message=f"작업 {len(jobs)}건", data=jobs, count=len(jobs))
+
+
+# ===== 수색 셀 순위 =====
+@app.post("/api/v1/search/rank", response_model=SearchRankResponse)
+async def rank_search_cells(request: SearchRankRequest):
+    """
+    마지막 관측 위치 주변 H3 셀 존재 확률 순위
+
+    k-ring 후보 셀 전체를 사전 로드된 LightGBM 모델로 1회 일괄 예측해 상위 셀을 반환합니다.
+    """
+    if search_ranker is None:
+        raise HTTPException(status_code=503, detail="순위 모델이 로드되지 않았습니다")
+
+    started = time.perf_counter()
+    # LightGBM predict는 GIL을 해제하므로 스레드 풀 (사전 로드 모델 공유)
+    top = await executors.thread.run(
+        search_ranker.rank,
+        request.lat,
+        request.lon,
+        request.last_seen_time,
+        k_ring=request.k_ring,
+        top_k=request.top_k
+    )
+    candidate_count = 3 * request.k_ring * (request.k_ring + 1) + 1
+
+    return SearchRankResponse(
+        success=True,
+        message=f"후보 {candidate_count}셀 중 상위 {len(top)}셀",
+        data=top.drop(columns="cell").to_dict(orient="records"),
+        candidate_count=candidate_count,
+        elapsed_ms=round((time.perf_counter() - started) * 1000, 1)
+    )
 
 
 # ===== 전체 API 테스트 =====
 @app.get("/api/v1/test-all", response_model=APIResponse)
 async def test_all_apis():
-    """모든 외부 API 연결 테스트"""
-    results = {
-        "spectrum_map": {"status": "pending", "message": ""},
-        "mountain_weather": {"status": "pending", "message": ""},
-        "danger_info": {"status": "pending", "message": ""}
-    }
-
-    # 전파누리 API 테스트
-    try:
-        data = await spectrum_client.fetch_data(park_name="지리산", max_pages=1)
-        results["spectrum_map"] = {
-            "status": "success",
-            "message": f"{len(data)}건 조회",
-            "sample": data[0] if data else None
-        }
-    except Exception as e:
-        results["spectrum_map"] = {"status": "error", "message": str(e)}
-
-    # 산악기상 API 테스트
-    try:
-        data = await weather_client.fetch_data(max_pages=1)
-        results["mountain_weather"] = {
-            "status": "success",
-            "message": f"{len(data)}건 조회",
-            "sample": data[0] if data else None
-        }
-    except Exception as e:
-        results["mountain_weather"] = {"status": "error", "message": str(e)}
+    """모든 외부 API 연결 테스트 (동시 실행)"""
+    sources = await collect_all_sources(
+        "지리산",
+        weather_pages=1,
+        danger_pages=1
+    )
 
-    # 위험지역 API 테스트
-    try:
-        data = await danger_client.fetch_data(max_pages=1)
-        results["danger_info"] = {
-            "status": "success",
-            "message": f"{len(data)}건 조회",
-            "sample": data[0] if data else None
-        }
-    except Exception as e:
-        results["danger_info"] = {"status": "error", "message": str(e)}
+    results = {}
+    for name, r in sources.items():
+        if r["status"] == "success":
+            data = r["data"]
+            results[name] = {
+                "status": "success",
+                "message": f"{len(data)}건 조회",
+                "sample": data[0] if data else None,
+                "elapsed_ms": r["elapsed_ms"]
+            }
+        else:
+            results[name] = {
+                "status": r["status"],
+                "message": r["error"],
+                "elapsed_ms": r["elapsed_ms"]
+            }
 
     all_success = all(r["status"] == "success" for r in results.values())
 
@@ -390,102 +681,103 @@ async def test_all_apis():
 
 
 # ===== Mock 데이터 생성 =====
-@app.post("/api/v1/mock/generate", response_model=APIResponse)
+async def run_mock_job(job: JobContext) -> Dict[str, Any]:
+    """Mock 데이터 생성 작업 - 프로세스 풀 생성 후 스레드 풀 저장"""
+    park_name = job.params["park_name"]
+    await job.stage("generate", 0.1)
+    data = await executors.process.run(mock_all_test_data, park_name)
+
+    file_paths = []
+
+    if job.params["save_to_file"]:
+        await job.stage("save", 0.6)
+        base_path = Path(__file__).parent.parent.parent / "data" / "generated"
+        keys = ["base_stations", "mountain_weather", "danger_info", "grids", "episodes", "ground_truths"]
+        manifest = await executors.thread.run(
+            write_datasets,
+            {key: data[key] for key in keys},
+            base_path,
+            name_template=f"mock_{{key}}_{park_name}_{{timestamp}}_{{run_id}}",
+            fmt=settings.EXPORT_FORMAT,
+            compression=settings.EXPORT_COMPRESSION,
+            run_id=job.job_id
+        )
+        file_paths = [entry["path"] for entry in manifest["files"]] + [manifest["manifest_path"]]
+
+    return {
+        "metadata": data["metadata"],
+        "samples": {
+            "base_station": data["base_stations"][0] if data["base_stations"] else None,
+            "weather": data["mountain_weather"][0] if data["mountain_weather"] else None,
+            "danger": data["danger_info"][0] if data["danger_info"] else None,
+            "grid": data["grids"][0] if data["grids"] else None,
+            "episode": data["episodes"][0] if data["episodes"] else None
+        },
+        "file_paths": file_paths,
+        "count": sum(data["metadata"]["counts"].values())
+    }
+
+
+@app.post("/api/v1/mock/generate", response_model=JobSubmitResponse, status_code=202)
 async def generate_mock_data(
     park_name: str = "지리산",
     save_to_file: bool = True
 ):
     """
-    Mock 테스트 데이터 생성 (외부 API 차단 시 사용)
+    Mock 테스트 데이터 생성 (외부 API 차단 시 사용, 백그라운드 작업)
 
-    실제 API 대신 현실적인 테스트 데이터를 생성합니다.
+    실제 API 대신 현실적인 테스트 데이터를 생성하는 작업을 등록하고 작업 ID를 즉시 반환합니다.
     """
-    try:
-        generator = MockDataGenerator(seed=42)
-        data = generator.generate_all_test_data(park_name)
-
-        file_paths = []
-
-        if save_to_file:
-            base_path = Path(__file__).parent.parent.parent / "data" / "generated"
-            base_path.mkdir(parents=True, exist_ok=True)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-            # JSON 저장
-            for key in ["base_stations", "mountain_weather", "danger_info", "grids", "episodes", "ground_truths"]:
-                file_path = base_path / f"mock_{key}_{park_name}_{timestamp}.json"
-                with open(file_path, "w", encoding="utf-8") as f:
-                    json.dump(data[key], f, ensure_ascii=False, indent=2)
-                file_paths.append(str(file_path))
-
-                # CSV 저장
-                csv_path = base_path / f"mock_{key}_{park_name}_{timestamp}.csv"
-                df = pd.DataFrame(data[key])
-                df.to_csv(csv_path, index=False, encoding="utf-8-sig")
-                file_paths.append(str(csv_path))
-
-        return APIResponse(
-            success=True,
-            message=f"Mock 데이터 생성 완료 ({park_name})",
-            data={
-                "metadata": data["metadata"],
-                "samples": {
-                    "base_station": data["base_stations"][0] if data["base_stations"] else None,
-                    "weather": data["mountain_weather"][0] if data["mountain_weather"] else None,
-                    "danger": data["danger_info"][0] if data["danger_info"] else None,
-                    "grid": data["grids"][0] if data["grids"] else None,
-                    "episode": data["episodes"][0] if data["episodes"] else None
-                },
-                "file_paths": file_paths
-            },
-            count=sum(data["metadata"]["counts"].values())
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Mock 데이터 생성 오류: {str(e)}")
+    return await submit_job("mock_generate", {"park_name": park_name, "save_to_file": save_to_file}, run_mock_job)
 
 
 @app.get("/api/v1/mock/stations/{park_name}", response_model=BaseStationResponse)
-async def get_mock_stations(park_name: str, count: int = 50):
+async def get_mock_stations(request: Request, park_name: str, count: int = 50, stream: bool = False):
     """Mock 기지국 데이터 조회"""
-    generator = MockDataGenerator()
-    data = generator.generate_base_stations(park_name, count)
-    stations = [BaseStation(**item) for item in data]
-
-    return BaseStationResponse(
-        success=True,
-        message=f"Mock 기지국 데이터 {len(stations)}건 생성",
-        data=stations,
-        count=len(stations)
+    if wants_ndjson(request, stream):
+        df = await executors.process.run(mock_records, "generate_base_stations_frame", park_name, count)
+        return ndjson_response(iter_frame_batches(df), BaseStation)
+
+    data = await executors.process.run(mock_records, "generate_base_stations_frame", park_name, count, as_records=True)
+    return list_response(
+        BaseStation,
+        data,
+        message=f"Mock 기지국 데이터 {len(data)}건 생성"
     )
 
 
 @app.get("/api/v1/mock/weather", response_model=MountainWeatherResponse)
-async def get_mock_weather(count: int = 30, local_area: Optional[str] = None):
+async def get_mock_weather(
+    request: Request,
+    count: int = 30,
+    local_area: Optional[str] = None,
+    stream: bool = False
+):
     """Mock 기상 데이터 조회"""
-    generator = MockDataGenerator()
-    data = generator.generate_mountain_weather(count, local_area)
-    weather_list = [MountainWeather(**item) for item in data]
-
-    return MountainWeatherResponse(
-        success=True,
-        message=f"Mock 기상 데이터 {len(weather_list)}건 생성",
-        data=weather_list,
-        count=len(weather_list)
+    if wants_ndjson(request, stream):
+        df = await executors.process.run(mock_records, "generate_mountain_weather_frame", count, local_area)
+        return ndjson_response(iter_frame_batches(df), MountainWeather)
+
+    data = await executors.process.run(mock_records, "generate_mountain_weather_frame", count, local_area, as_records=True)
+    return list_response(
+        MountainWeather,
+        data,
+        message=f"Mock 기상 데이터 {len(data)}건 생성"
     )
 
 
 @app.get("/api/v1/mock/danger", response_model=DangerInfoResponse)
-async def get_mock_danger(count: int = 40):
+async def get_mock_danger(request: Request, count: int = 40, stream: bool = False):
     """Mock 위험지역 데이터 조회"""
-    generator = MockDataGenerator()
-    data = generator.generate_danger_info(count)
-    danger_list = [DangerInfo(**item) for item in data]
-
-    return DangerInfoResponse(
-        success=True,
-        message=f"Mock 위험지역 데이터 {len(danger_list)}건 생성",
-        data=danger_list,
-        count=len(danger_list)
+    if wants_ndjson(request, stream):
+        df = await executors.process.run(mock_records, "generate_danger_info_frame", count)
+        return ndjson_response(iter_frame_batches(df), DangerInfo)
+
+    data = await executors.process.run(mock_records, "generate_danger_info_frame", count, as_records=True)
+    return list_response(
+        DangerInfo,
+        data,
+        message=f"Mock 위험지역 데이터 {len(data)}건 생성"
     )
 
 
@@ -2,7 +2,7 @@
 Pydantic 스키마 정의
 """
 from pydantic import BaseModel, Field
-from typing import Optional, List, Any
+from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
 
@@ -135,3 +135,59 @@ class GenerateTestDataResponse(APIResponse):
     weather_data_count: int = 0
     danger_info_count: int = 0
     file_paths: List[str] = []
+    source_timings: Dict[str, Any] = Field(default_factory=dict, description="소스별 수집 상태/소요시간 (ms)")
+
+
+# ===== 수색 셀 순위 =====
+class SearchRankRequest(BaseModel):
+    """수색 셀 순위 요청"""
+    lat: float = Field(..., ge=-90, le=90, description="마지막 관측 위도")
+    lon: float = Field(..., ge=-180, le=180, description="마지막 관측 경도")
+    last_seen_time: Optional[datetime] = Field(None, description="마지막 관측 시각 (기본: 현재)")
+    k_ring: int = Field(10, ge=1, le=60, description="후보 셀 범위 (H3 k-ring, 후보 수 3k²+3k+1)")
+    top_k: int = Field(20, ge=1, le=500, description="반환할 상위 셀 수")
+
+
+class RankedCell(BaseModel):
+    """순위화된 H3 셀"""
+    h3_index: str = Field(..., description="H3 셀 인덱스")
+    lat: float = Field(..., description="셀 중심 위도")
+    lon: float = Field(..., description="셀 중심 경도")
+    probability: float = Field(..., description="존재 확률")
+    rank: int = Field(..., description="순위")
+
+
+class SearchRankResponse(APIResponse):
+    """수색 셀 순위 응답"""
+    data: List[RankedCell] = []
+    candidate_count: int = 0
+    elapsed_ms: float = 0.0
+
+
+# ===== 백그라운드 작업 =====
+class JobStatus(BaseModel):
+    """작업 상태"""
+    id: str
+    kind: str = Field(..., description="작업 종류 (generate_test_data / mock_generate)")
+    status: str = Field(..., description="queued / running / succeeded / failed / interrupted")
+    progress: float = Field(0.0, description="진행률 (0 ~ 1)")
+    stage: Optional[str] = Field(None, description="현재 단계")
+    params: Dict[str, Any] = {}
+    timings: Dict[str, float] = Field(default_factory=dict, description="단계별 소요시간 (ms)")
+    result: Optional[Dict[str, Any]] = Field(None, description="건수/파일 경로 등 결과")
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
+class JobSubmitResponse(APIResponse):
+    """작업 등록 응답 (즉시 반환)"""
+    job_id: str
+    status_url: str
+    deduplicated: bool = Field(False, description="동일 작업이 이미 대기/실행 중이면 True (기존 작업 ID 반환)")
+
+
+class JobStatusResponse(APIResponse):
+    """작업 상태 조회 응답"""
+    data: Optional[JobStatus] = None
@@ -0,0 +1,140 @@
+"""
+목록 응답 고속 직렬화
+- 업스트림 레코드 → 응답 dict를 alias 기준 1회 투영 (항목별 Pydantic 모델 생성 없음)
+- 투영할 수 없는 레코드가 있으면 리스트 전체를 TypeAdapter로 1회 검증 (기존과 동일한 오류)
+- FastAPI ORJSONResponse로 직렬화 (orjson 필요)
+"""
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Tuple, Type, Union, get_args, get_origin
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+
+class _Untrusted(Exception):
+    """고속 투영 불가 레코드 (TypeAdapter 검증으로 전환)"""
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[model])
+
+
+_MISSING = object()
+
+
+@lru_cache(maxsize=None)
+def _projection(model: Type[BaseModel]) -> Union[Tuple[Tuple[str, Union[str, None], type], ...], None]:
+    """모델 필드 → (alias, 대체 필드명, 타입) 목록, Optional[float|str] 이외 필드가 있으면 None
+
+    populate_by_name 모델은 alias 키가 없을 때 필드명 키도 조회 (Pydantic 검증과 동일)
+    """
+    by_name = model.model_config.get("populate_by_name", False)
+    spec = []
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        if get_origin(annotation) is Union:
+            args = [a for a in get_args(annotation) if a is not type(None)]
+            annotation = args[0] if len(args) == 1 else None
+        if annotation not in (float, str) or field.default is not None:
+            return None
+        alias = field.alias or name
+        spec.append((alias, name if by_name and alias != name else None, annotation))
+    return tuple(spec)
+
+
+def _project(spec: Tuple[Tuple[str, Union[str, None], type], ...], items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    rows = []
+    for item in items:
+        row = {}
+        for alias, name, kind in spec:
+            value = item.get(alias, _MISSING)
+            if value is _MISSING:
+                value = item.get(name) if name is not None else None
+            if value is None or type(value) is kind:
+                row[alias] = value
+            elif kind is float and isinstance(value, (int, str)) and not isinstance(value, bool):
+                try:
+                    row[alias] = float(value)
+                except ValueError:
+                    raise _Untrusted(alias)
+            else:
+                raise _Untrusted(alias)
+        rows.append(row)
+    return rows
+
+
+def dump_records(model: Type[BaseModel], items: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """업스트림 레코드 리스트 → 응답용 dict 리스트 (alias 키, JSON 호환 값)"""
+    items = items if isinstance(items, list) else list(items)
+
+    spec = _projection(model)
+    if spec is not None:
+        try:
+            return _project(spec, items)
+        except _Untrusted:
+            pass
+
+    adapter = _list_adapter(model)
+    validated = adapter.validate_python(items)
+    return adapter.dump_python(validated, mode="json", by_alias=True)
+
+
+def list_response(
+    model: Type[BaseModel],
+    items: List[Dict[str, Any]],
+    message: str,
+    success: bool = True
+) -> ORJSONResponse:
+    """APIResponse 형태 목록 응답 (success, message, data, count)
+
+    엔드포인트에서 Response를 직접 반환하므로 FastAPI의 response_model 재검증을 거치지 않는다.
+    response_model 선언은 OpenAPI 문서용으로 유지한다.
+    """
+    data = dump_records(model, items)
+    return ORJSONResponse({
+        "success": success,
+        "message": message,
+        "data": data,
+        "count": len(data)
+    })
+
+
+# 벤치마크: 10k 건 목록 응답 처리량 (기존 경로 vs 고속 경로)
+if __name__ == "__main__":
+    import sys
+    import time
+    from pathlib import Path
+
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from src.api.schemas import BaseStation, BaseStationResponse
+    from src.data.mock_data import MockDataGenerator
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    rounds = 5
+    records = MockDataGenerator(seed=42).generate_base_stations("ALL", count)
+
+    bench_app = FastAPI()
+
+    @bench_app.get("/legacy", response_model=BaseStationResponse)
+    async def legacy():
+        stations = [BaseStation(**item) for item in records]
+        return BaseStationResponse(success=True, message="legacy", data=stations, count=len(stations))
+
+    @bench_app.get("/fast", response_model=BaseStationResponse)
+    async def fast():
+        return list_response(BaseStation, records, message="fast")
+
+    with TestClient(bench_app) as client:
+        assert client.get("/legacy").json()["data"] == client.get("/fast").json()["data"]
+
+        for path in ("/legacy", "/fast"):
+            started = time.perf_counter()
+            for _ in range(rounds):
+                client.get(path)
+            elapsed = (time.perf_counter() - started) / rounds
+            print(f"{path:8s} {elapsed * 1000:8.1f} ms/응답  {count / elapsed:12,.0f} records/s")
@@ -0,0 +1,62 @@
+"""
+NDJSON 스트리밍 응답
+- Accept: application/x-ndjson 또는 ?stream=true 일 때 사용
+- 레코드를 받는 즉시 한 줄씩 전송 (전체 리스트/응답 본문을 메모리에 만들지 않음)
+- 전송 도중 소스 오류 발생 시 마지막 줄에 {"error": ...} 기록 (상태 코드는 이미 200으로 전송됨)
+"""
+from typing import Any, AsyncIterator, Dict, Iterable, List, Type, Union
+import logging
+
+import orjson
+import pandas as pd
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from src.api.serialization import dump_records
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# 레코드 묶음 (페이지 또는 DataFrame 청크) 단위 소스
+RecordBatches = Union[Iterable[List[Dict[str, Any]]], AsyncIterator[List[Dict[str, Any]]]]
+
+
+def wants_ndjson(request: Request, stream: bool = False) -> bool:
+    """스트리밍 요청 여부 (쿼리 파라미터 또는 Accept 헤더)"""
+    return stream or NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+async def _aiter_batches(batches: RecordBatches) -> AsyncIterator[List[Dict[str, Any]]]:
+    if hasattr(batches, "__aiter__"):
+        async for batch in batches:
+            yield batch
+    else:
+        for batch in batches:
+            yield batch
+
+
+def iter_frame_batches(df: pd.DataFrame, chunk_size: int = 1000) -> Iterable[List[Dict[str, Any]]]:
+    """DataFrame을 청크 단위 dict 리스트로 변환 (전체 변환 없이 순차 생성)"""
+    for start in range(0, len(df), chunk_size):
+        yield df.iloc[start:start + chunk_size].to_dict("records")
+
+
+def ndjson_response(batches: RecordBatches, model: Type[BaseModel]) -> StreamingResponse:
+    """레코드 묶음 → 스키마 검증 후 NDJSON 스트리밍 응답 (일반 응답과 동일하게 alias 키 사용)
+
+    소스가 중간에 실패하면 {"error": 메시지} 줄로 끝내 잘린 결과임을 알린다.
+    """
+
+    async def _body():
+        try:
+            async for batch in _aiter_batches(batches):
+                if batch:
+                    yield b"".join(orjson.dumps(row) + b"\n" for row in dump_records(model, batch))
+        except Exception as e:
+            logger.warning(f"NDJSON 스트리밍 중단: {e}")
+            yield orjson.dumps({"error": str(e) or type(e).__name__}) + b"\n"
+
+    return StreamingResponse(_body(), media_type=NDJSON_MEDIA_TYPE)
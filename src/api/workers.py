@@ -0,0 +1,29 @@
+"""
+프로세스 풀 작업 함수
+- 프로세스 풀(spawn)로 전달되므로 모듈 최상위 함수 + 피클 가능한 인자/결과만 사용
+- 워커 프로세스는 요청마다 생성기를 새로 만들어 seed별 결정적 결과 유지
+"""
+from typing import Any, Dict
+
+import pandas as pd
+
+from src.data.mock_data import MockDataGenerator
+
+
+def mock_records(method: str, *args, seed: int = 42, as_records: bool = False) -> Any:
+    """MockDataGenerator.generate_* 호출 결과 (레코드 리스트 또는 DataFrame)
+
+    as_records=True면 DataFrame 결과를 워커에서 dict 리스트로 변환해 반환
+    """
+    if not method.startswith("generate_"):
+        raise ValueError(f"지원하지 않는 생성 메서드: {method}")
+    generator = MockDataGenerator(seed=seed)
+    result = getattr(generator, method)(*args)
+    if as_records and isinstance(result, pd.DataFrame):
+        return generator.frame_to_records(result)
+    return result
+
+
+def mock_all_test_data(park_name: str, seed: int = 42) -> Dict[str, Any]:
+    """공원 단위 전체 Mock 테스트 데이터"""
+    return MockDataGenerator(seed=seed).generate_all_test_data(park_name)
@@ -0,0 +1,179 @@
+"""
+소방청 산악사고 데이터 로더
+- CP949 CSV를 명시적 dtype으로 파싱 (저카디널리티 컬럼은 category)
+- 행정구역명 정규화 (docs/data_preprocessing_analysis.md 3.1)
+- 신고년월일 + 신고시각 → 신고일시(datetime64), 지오코딩용 full_addr 생성
+- 정제 결과를 원본 파일 해시 기준 Parquet으로 캐시 (원본이 바뀌면 자동 재생성)
+"""
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import pandas as pd
+from pandas.api.types import union_categoricals
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(__file__).parent.parent.parent / "data"
+DEFAULT_CACHE_DIR = DATA_DIR / "cache" / "accidents"
+SOURCE_PATTERN = "소방청_*.csv"
+
+# 정제 규칙이 바뀌면 올려서 기존 캐시 무효화
+LOADER_VERSION = 1
+
+# 행정구역 개편 전 명칭 → 현재 명칭
+REGION_ALIASES = {
+    "강원도": "강원특별자치도",
+    "전라북도": "전북특별자치도",
+    "제주도": "제주특별자치도",
+}
+
+# 원본 컬럼 dtype (없는 컬럼은 무시)
+CATEGORY_COLUMNS = [
+    "발생장소_시", "발생장소_구", "발생장소_동", "발생장소_리",
+    "사고원인", "사고원인코드명_사고종별", "처리결과코드",
+]
+STRING_COLUMNS = ["신고년월일", "신고시각", "출동년월일", "출동시각", "번지"]
+ADDRESS_COLUMNS = ["발생장소_시", "발생장소_구", "발생장소_동"]
+
+
+def file_hash(path: Union[str, Path], chunk_size: int = 1 << 20) -> str:
+    """파일 내용 SHA-256 해시"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_raw(path: Path) -> pd.DataFrame:
+    """원본 파일 파싱 (CSV 우선, XLSX는 같은 이름의 CSV가 없을 때만)"""
+    if path.suffix.lower() in (".xlsx", ".xls"):
+        csv_path = path.with_suffix(".csv")
+        if not csv_path.exists():
+            logger.info(f"CSV 없음, Excel 파싱 (느림): {path.name}")
+            return pd.read_excel(path, dtype=str)
+        path = csv_path
+
+    header = pd.read_csv(path, encoding="cp949", nrows=0).columns
+    dtype: Dict[str, str] = {col: "category" for col in CATEGORY_COLUMNS if col in header}
+    dtype.update({col: "string" for col in STRING_COLUMNS if col in header})
+    return pd.read_csv(path, encoding="cp949", dtype=dtype)
+
+
+def _combine_datetime(df: pd.DataFrame, date_col: str, time_col: str) -> pd.Series:
+    return pd.to_datetime(
+        df[date_col].str.strip() + " " + df[time_col].str.strip(),
+        format="%Y-%m-%d %H:%M",
+        errors="coerce"
+    )
+
+
+def clean_accidents(df: pd.DataFrame, source: Optional[str] = None) -> pd.DataFrame:
+    """원본 DataFrame 정제 (행정구역명 정규화, 일시 파싱, full_addr 생성)"""
+    df = df.copy()
+
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype("category")
+
+    # 1. 행정구역명 정규화 (구/신 명칭이 함께 있으면 카테고리가 합쳐짐)
+    df["발생장소_시"] = df["발생장소_시"].astype(object).replace(REGION_ALIASES).astype("category")
+
+    # 2. 일시 파싱
+    df["신고일시"] = _combine_datetime(df, "신고년월일", "신고시각")
+    if "출동년월일" in df.columns:
+        df["출동일시"] = _combine_datetime(df, "출동년월일", "출동시각")
+    df = df.drop(columns=[c for c in ("신고년월일", "신고시각", "출동년월일", "출동시각") if c in df.columns])
+
+    # 3. 시간대 파생 (수색 시간 예측용)
+    df["시간대"] = df["신고일시"].dt.hour.astype("Int8")
+    df["요일"] = df["신고일시"].dt.dayofweek.astype("Int8")
+    df["월"] = df["신고일시"].dt.month.astype("Int8")
+
+    if "구조인원" in df.columns:
+        df["구조인원"] = pd.to_numeric(df["구조인원"], errors="coerce").astype("Int16")
+
+    # 4. 지오코딩용 주소 (시 구 동) - 고유 조합 단위로 생성 후 category
+    parts = df[ADDRESS_COLUMNS].astype(object).fillna("")
+    df["full_addr"] = (
+        parts[ADDRESS_COLUMNS[0]] + " " + parts[ADDRESS_COLUMNS[1]] + " " + parts[ADDRESS_COLUMNS[2]]
+    ).str.split().str.join(" ").astype("category")
+
+    if source is not None:
+        df["source"] = pd.Categorical([source] * len(df))
+
+    return df
+
+
+def load_accidents(
+    path: Union[str, Path],
+    cache_dir: Union[str, Path, None] = DEFAULT_CACHE_DIR,
+    use_cache: bool = True
+) -> pd.DataFrame:
+    """단일 소방청 파일 로드 (정제 결과 Parquet 캐시 사용)"""
+    path = Path(path)
+    source = path.stem
+
+    cache_file = None
+    if use_cache and cache_dir is not None:
+        raw_path = path.with_suffix(".csv") if path.with_suffix(".csv").exists() else path
+        key = f"{file_hash(raw_path)[:16]}_v{LOADER_VERSION}"
+        cache_file = Path(cache_dir) / f"{source}_{key}.parquet"
+        if cache_file.exists():
+            return pd.read_parquet(cache_file)
+
+    df = clean_accidents(_read_raw(path), source=source)
+
+    if cache_file is not None:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # 같은 원본의 이전 버전 캐시 정리
+        for stale in cache_file.parent.glob(f"{source}_*.parquet"):
+            stale.unlink()
+        df.to_parquet(cache_file, engine="pyarrow", compression="zstd", index=False)
+        logger.info(f"사고 데이터 캐시 생성: {cache_file.name} ({len(df)}건)")
+
+    return df
+
+
+def load_all_accidents(
+    data_dir: Union[str, Path] = DATA_DIR,
+    cache_dir: Union[str, Path, None] = DEFAULT_CACHE_DIR,
+    use_cache: bool = True
+) -> pd.DataFrame:
+    """data 디렉토리의 소방청 CSV 전체 로드 (공통 컬럼 + source 구분)"""
+    files: List[Path] = sorted(Path(data_dir).glob(SOURCE_PATTERN))
+    if not files:
+        raise FileNotFoundError(f"소방청 데이터 없음: {data_dir}/{SOURCE_PATTERN}")
+
+    frames = [load_accidents(f, cache_dir=cache_dir, use_cache=use_cache) for f in files]
+
+    # 파일별 카테고리를 합집합으로 맞춰 concat 후에도 category 유지 (object 재변환 방지)
+    for col in CATEGORY_COLUMNS + ["full_addr", "source"]:
+        present = [f[col] for f in frames if col in f.columns]
+        if not present:
+            continue
+        dtype = pd.CategoricalDtype(union_categoricals(present).categories)
+        for f in frames:
+            f[col] = f[col].cat.set_categories(dtype.categories) if col in f.columns \
+                else pd.Categorical([None] * len(f), dtype=dtype)
+
+    return pd.concat(frames, ignore_index=True)
+
+
+if __name__ == "__main__":
+    import time
+
+    started = time.perf_counter()
+    df = load_all_accidents(use_cache=False)
+    print(f"원본 파싱: {len(df)}건, {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    load_all_accidents()
+    started = time.perf_counter()
+    df = load_all_accidents()
+    print(f"캐시 로드: {len(df)}건, {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    print(df.dtypes)
+    print(df["발생장소_시"].value_counts().head(10))
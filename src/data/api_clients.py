@@ -5,31 +5,193 @@
 - 위험지역 POI API
 """
 import httpx
-import xmltodict
-from typing import Optional, List, Dict, Any
+import json
+from xml.etree.ElementTree import ParseError
+from typing import Optional, List, Dict, Any, Tuple, Callable, Awaitable, AsyncIterator
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 import asyncio
-from tenacity import retry, stop_after_attempt, wait_exponential
+import math
+from contextlib import asynccontextmanager
+from tenacity import retry, retry_if_not_exception_type, stop_after_attempt, wait_exponential
 import logging
 
+from src.data.http_pool import HTTPClientPool
+from src.data.cache import ResponseCache, make_cache_key
+from src.data.circuit_breaker import BreakerRegistry, CircuitOpen
+from src.data.xml_stream import DANGER_NUMERIC_FIELDS, ParsedPage, XMLRecordParser, detect_format, page_from_json
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _to_int(value: Any) -> Optional[int]:
+    """totalCount 등 숫자 필드 변환 (XML 응답은 문자열)"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class PagedResult:
+    """페이지 병렬 조회 결과"""
+    items: List[Dict[str, Any]] = field(default_factory=list)
+    total_count: Optional[int] = None
+    pages_fetched: List[int] = field(default_factory=list)
+    failed_pages: Dict[int, str] = field(default_factory=dict)  # 페이지 번호 → 오류 메시지
+
+    @property
+    def complete(self) -> bool:
+        return not self.failed_pages
+
+
+# 페이지 조회 함수: page → (items, totalCount)
+PageFetcher = Callable[[int], Awaitable[Tuple[List[Dict[str, Any]], Optional[int]]]]
+
+
 class BaseAPIClient(ABC):
     """API 클라이언트 기본 클래스 (비동기)"""
 
-    def __init__(self, timeout: float = 30.0):
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        http_pool: Optional[HTTPClientPool] = None,
+        cache: Optional[ResponseCache] = None,
+        breakers: Optional[BreakerRegistry] = None
+    ):
         self.timeout = timeout
+        self.http_pool = http_pool
+        self.cache = cache
+        self.breakers = breakers
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
+    async def _cached(
+        self,
+        params: Dict[str, Any],
+        fetch: Callable[[], Awaitable[List[Dict[str, Any]]]]
+    ) -> List[Dict[str, Any]]:
+        """정규화된 요청 파라미터 기준 캐시 조회 (동시 동일 요청은 1회 호출로 병합)
+
+        - 업스트림 브레이커가 open이면 만료된 캐시 값이라도 반환 (없으면 즉시 실패 → 빈 결과)
+        """
+        key = make_cache_key(self.cache.name, params)
+        if self._circuit_open():
+            hit, value = self.cache.get_stale(key)
+            if hit:
+                return list(value)
+
+        result = await self.cache.get_or_fetch(key, fetch)
+        if not result and self._circuit_open():
+            # 조회 도중 브레이커가 열린 경우
+            hit, value = self.cache.get_stale(key)
+            if hit:
+                return list(value)
+        # 캐시된 리스트가 호출 측에서 변경되지 않도록 복사본 반환
+        return list(result)
+
+    def _circuit_open(self) -> bool:
+        return self.breakers is not None and self.breakers.is_open(self.base_url)
+
+    async def _guarded(self, url: str, send: Callable[[], Awaitable[dict]]) -> dict:
+        """호스트 서킷 브레이커 경유 호출 (브레이커 미설정 시 직접 호출)"""
+        if self.breakers is None:
+            return await send()
+        return await self.breakers.call(url, send)
+
+    @asynccontextmanager
+    async def _client(self, url: str):
+        """공용 풀이 있으면 호스트별 공유 클라이언트, 없으면 1회용 클라이언트"""
+        if self.http_pool is not None:
+            yield self.http_pool.get(url)
+        else:
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                yield client
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_not_exception_type(CircuitOpen)
+    )
     async def _request(self, url: str, params: dict) -> dict:
-        """재시도 로직이 포함된 비동기 API 요청"""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            logger.info(f"Requesting: {url}")
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
+        """재시도 로직이 포함된 비동기 API 요청 (브레이커 open 시 재시도 없이 즉시 실패)"""
+        async def send() -> dict:
+            async with self._client(url) as client:
+                logger.info(f"Requesting: {url}")
+                response = await client.get(url, params=params, timeout=self.timeout)
+                response.raise_for_status()
+                return response.json()
+
+        return await self._guarded(url, send)
+
+    async def _fan_out_pages(
+        self,
+        fetch_page: PageFetcher,
+        num_of_rows: int,
+        max_pages: int,
+        max_concurrency: int = 5,
+        source: str = "API"
+    ) -> PagedResult:
+        """1페이지 조회 후 전체 페이지 수를 계산하고 나머지 페이지를 동시에 조회
+
+        - 동시 요청 수는 세마포어로 제한
+        - 결과는 페이지 순서대로 병합
+        - 실패한 페이지는 failed_pages에 기록 (나머지 결과는 유지)
+        """
+        result = PagedResult()
+
+        try:
+            first_items, total_count = await fetch_page(1)
+        except Exception as e:
+            logger.error(f"{source} - Page 1 오류: {e}")
+            result.failed_pages[1] = str(e)
+            return result
+
+        result.total_count = total_count
+        result.pages_fetched.append(1)
+        result.items.extend(first_items)
+
+        if not first_items:
+            return result
+
+        if total_count is not None:
+            page_count = min(max_pages, math.ceil(total_count / num_of_rows))
+        elif len(first_items) < num_of_rows:
+            page_count = 1
+        else:
+            # totalCount가 없는 API는 max_pages까지 조회 후 빈 페이지 무시
+            page_count = max_pages
+
+        if page_count <= 1:
+            return result
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _bounded(page: int):
+            async with semaphore:
+                return await fetch_page(page)
+
+        pages = list(range(2, page_count + 1))
+        outcomes = await asyncio.gather(
+            *(_bounded(page) for page in pages),
+            return_exceptions=True
+        )
+
+        for page, outcome in zip(pages, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"{source} - Page {page} 오류: {outcome}")
+                result.failed_pages[page] = str(outcome)
+                continue
+            items, _ = outcome
+            result.pages_fetched.append(page)
+            result.items.extend(items)
+
+        if result.failed_pages:
+            logger.warning(
+                f"{source} - {len(result.failed_pages)}/{page_count} 페이지 실패: "
+                f"{sorted(result.failed_pages)}"
+            )
+        logger.info(f"{source} - {len(result.pages_fetched)}개 페이지 병렬 조회: {len(result.items)} records")
+        return result
 
     @abstractmethod
     async def fetch_data(self, **kwargs) -> List[Dict[str, Any]]:
@@ -39,8 +201,15 @@ class BaseAPIClient(ABC):
 class SpectrumMapClient(BaseAPIClient):
     """전파누리 API 클라이언트 (이동통신 기지국)"""
 
-    def __init__(self, api_key: str, base_url: str = "https://spectrummap.kr/openapiNew.do"):
-        super().__init__()
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://spectrummap.kr/openapiNew.do",
+        http_pool: Optional[HTTPClientPool] = None,
+        cache: Optional[ResponseCache] = None,
+        breakers: Optional[BreakerRegistry] = None
+    ):
+        super().__init__(http_pool=http_pool, cache=cache, breakers=breakers)
         self.api_key = api_key
         self.base_url = base_url
 
@@ -48,7 +217,8 @@ class SpectrumMapClient(BaseAPIClient):
         self,
         park_name: str = "지리산",
         park_type: int = 1,  # 1=국립, 2=도립, 3=군립
-        max_pages: int = 5
+        max_pages: int = 5,
+        use_cache: bool = True
     ) -> List[Dict[str, Any]]:
         """산악지역 이동통신 기지국 정보 조회
 
@@ -62,50 +232,20 @@ class SpectrumMapClient(BaseAPIClient):
         - GND_ALTD_HET: 지상고 (m)
         - SERVICE_NAME: 서비스명
         """
+        if self.cache is not None and use_cache:
+            return await self._cached(
+                {"park_name": park_name, "park_type": park_type, "max_pages": max_pages},
+                lambda: self.fetch_data(park_name, park_type, max_pages, use_cache=False)
+            )
+
         all_data = []
         page = 1
 
         while page <= max_pages:
-            # 필수 파라미터만 사용 (불필요한 파라미터 제거)
-            params = {
-                "key": self.api_key,
-                "searchId": "07",
-                "SCH_CD": "MOBILE",
-                "PARK_CD": park_type,
-                "QUERY": park_name,
-            }
-
             try:
-                result = await self._request(self.base_url, params)
-
-                # 응답 키는 "RESULT" (기존 "data" 아님)
-                data = result.get("RESULT", [])
-                result_code = result.get("RESULT_CODE", "")
-
-                if not data or result_code != "INFO-100":
-                    logger.warning(f"전파누리 API - RESULT_CODE: {result_code}")
-                    break
-
-                # 필드명 정규화 (기존 스키마와 호환)
-                normalized_data = []
-                for item in data:
-                    normalized_data.append({
-                        "LAT": item.get("LAT"),
-                        "LON": item.get("LON"),
-                        "FRQ": item.get("FRQ_HZ", 0) / 1000000 if item.get("FRQ_HZ") else None,  # Hz → MHz
-                        "PWR": item.get("ARW_PWR_WTT"),
-                        "ANT_FORM": item.get("ARW_FORM_CD"),
-                        "ANT_GAIN": item.get("ARW_GAN_NMV"),
-                        "SEA_ALT": item.get("ALT_ALTD_HET"),
-                        "GRD_ALT": item.get("GND_ALTD_HET"),
-                        "SERVICE_NAME": item.get("SERVICE_NAME"),
-                        "ADDRESS": item.get("RDS_TRS_ADR"),
-                        # 원본 데이터도 포함
-                        "_raw": item
-                    })
-
-                all_data.extend(normalized_data)
-                logger.info(f"전파누리 API - Page {page}: {len(data)} records fetched")
+                items, _ = await self._fetch_page(park_name, park_type)
+                all_data.extend(items)
+                logger.info(f"전파누리 API - Page {page}: {len(items)} records fetched")
 
                 # 전파누리 API는 페이지네이션 없이 전체 반환
                 break
@@ -116,6 +256,54 @@ class SpectrumMapClient(BaseAPIClient):
 
         return all_data
 
+    async def _fetch_page(self, park_name: str, park_type: int) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """단일 조회 → (정규화 items, None), 오류/비정상 RESULT_CODE는 예외로 전달"""
+        # 필수 파라미터만 사용 (불필요한 파라미터 제거)
+        params = {
+            "key": self.api_key,
+            "searchId": "07",
+            "SCH_CD": "MOBILE",
+            "PARK_CD": park_type,
+            "QUERY": park_name,
+        }
+
+        result = await self._request(self.base_url, params)
+
+        # 응답 키는 "RESULT" (기존 "data" 아님)
+        data = result.get("RESULT", [])
+        result_code = result.get("RESULT_CODE", "")
+
+        if result_code != "INFO-100":
+            raise ValueError(f"전파누리 API - RESULT_CODE: {result_code}")
+
+        # 필드명 정규화 (기존 스키마와 호환)
+        normalized_data = []
+        for item in data:
+            normalized_data.append({
+                "LAT": item.get("LAT"),
+                "LON": item.get("LON"),
+                "FRQ": item.get("FRQ_HZ", 0) / 1000000 if item.get("FRQ_HZ") else None,  # Hz → MHz
+                "PWR": item.get("ARW_PWR_WTT"),
+                "ANT_FORM": item.get("ARW_FORM_CD"),
+                "ANT_GAIN": item.get("ARW_GAN_NMV"),
+                "SEA_ALT": item.get("ALT_ALTD_HET"),
+                "GRD_ALT": item.get("GND_ALTD_HET"),
+                "SERVICE_NAME": item.get("SERVICE_NAME"),
+                "ADDRESS": item.get("RDS_TRS_ADR"),
+                # 원본 데이터도 포함
+                "_raw": item
+            })
+        return normalized_data, None
+
+    async def fetch_pages(self, park_name: str = "지리산", park_type: int = 1) -> PagedResult:
+        """조회 결과 + 실패 정보 (전파누리 API는 1회 응답에 전체 반환)"""
+        return await self._fan_out_pages(
+            lambda page: self._fetch_page(park_name, park_type),
+            num_of_rows=1,
+            max_pages=1,
+            source="전파누리 API"
+        )
+
     async def get_stations_by_park(self, park_name: str) -> List[Dict[str, Any]]:
         """특정 공원의 기지국 정보 조회"""
         return await self.fetch_data(park_name=park_name)
@@ -124,54 +312,100 @@ class SpectrumMapClient(BaseAPIClient):
 class MountainWeatherClient(BaseAPIClient):
     """산악기상정보 API 클라이언트"""
 
-    def __init__(self, service_key: str, base_url: str = "https://apis.data.go.kr/1400377/mtweather/mountListSearch"):
-        super().__init__()
+    def __init__(
+        self,
+        service_key: str,
+        base_url: str = "https://apis.data.go.kr/1400377/mtweather/mountListSearch",
+        http_pool: Optional[HTTPClientPool] = None,
+        cache: Optional[ResponseCache] = None,
+        breakers: Optional[BreakerRegistry] = None
+    ):
+        super().__init__(http_pool=http_pool, cache=cache, breakers=breakers)
         self.service_key = service_key
         self.base_url = base_url
 
+    async def _fetch_page(
+        self,
+        page: int,
+        num_of_rows: int,
+        filters: Dict[str, Any]
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """단일 페이지 조회 → (items, totalCount)"""
+        params = {
+            "ServiceKey": self.service_key,
+            "pageNo": page,
+            "numOfRows": num_of_rows,
+            "_type": "json"
+        }
+        params.update(filters)
+
+        result = await self._request(self.base_url, params)
+        body = result.get("response", {}).get("body", {})
+        items = body.get("items", {}).get("item", [])
+        total_count = _to_int(body.get("totalCount"))
+
+        if not items:
+            return [], total_count
+
+        # 단일 항목인 경우 리스트로 변환
+        if isinstance(items, dict):
+            items = [items]
+
+        logger.info(f"산악기상 API - Page {page}: {len(items)} records fetched")
+        return items, total_count
+
     async def fetch_data(
         self,
         local_area: Optional[str] = None,
         obs_id: Optional[str] = None,
         obs_time: Optional[str] = None,
         num_of_rows: int = 100,
-        max_pages: int = 3
+        max_pages: int = 3,
+        concurrent: bool = False,
+        max_concurrency: int = 5,
+        use_cache: bool = True
     ) -> List[Dict[str, Any]]:
-        """산악기상 정보 조회"""
+        """산악기상 정보 조회
+
+        - concurrent=True: 1페이지의 totalCount로 페이지 수를 계산해 나머지를 동시 조회
+        """
+        if self.cache is not None and use_cache:
+            return await self._cached(
+                {
+                    "local_area": local_area, "obs_id": obs_id, "obs_time": obs_time,
+                    "num_of_rows": num_of_rows, "max_pages": max_pages
+                },
+                lambda: self.fetch_data(
+                    local_area, obs_id, obs_time, num_of_rows, max_pages,
+                    concurrent=concurrent, max_concurrency=max_concurrency, use_cache=False
+                )
+            )
+
+        filters = {}
+        if local_area:
+            filters["localArea"] = local_area
+        if obs_id:
+            filters["obsid"] = obs_id
+        if obs_time:
+            filters["tm"] = obs_time
+
+        if concurrent:
+            paged = await self.fetch_pages(filters, num_of_rows, max_pages, max_concurrency)
+            return paged.items
+
         all_data = []
         page = 1
 
         while page <= max_pages:
-            params = {
-                "ServiceKey": self.service_key,
-                "pageNo": page,
-                "numOfRows": num_of_rows,
-                "_type": "json"
-            }
-            if local_area:
-                params["localArea"] = local_area
-            if obs_id:
-                params["obsid"] = obs_id
-            if obs_time:
-                params["tm"] = obs_time
-
             try:
-                result = await self._request(self.base_url, params)
-                body = result.get("response", {}).get("body", {})
-                items = body.get("items", {}).get("item", [])
+                items, total_count = await self._fetch_page(page, num_of_rows, filters)
 
                 if not items:
                     break
 
-                # 단일 항목인 경우 리스트로 변환
-                if isinstance(items, dict):
-                    items = [items]
-
                 all_data.extend(items)
-                logger.info(f"산악기상 API - Page {page}: {len(items)} records fetched")
 
-                total_count = body.get("totalCount", 0)
-                if page * num_of_rows >= total_count:
+                if page * num_of_rows >= (total_count or 0):
                     break
                 page += 1
 
@@ -181,6 +415,55 @@ class MountainWeatherClient(BaseAPIClient):
 
         return all_data
 
+    async def fetch_pages(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        num_of_rows: int = 100,
+        max_pages: int = 3,
+        max_concurrency: int = 5
+    ) -> PagedResult:
+        """페이지 병렬 조회 (실패 페이지 정보 포함)"""
+        filters = filters or {}
+        return await self._fan_out_pages(
+            lambda page: self._fetch_page(page, num_of_rows, filters),
+            num_of_rows=num_of_rows,
+            max_pages=max_pages,
+            max_concurrency=max_concurrency,
+            source="산악기상 API"
+        )
+
+    async def iter_pages(
+        self,
+        local_area: Optional[str] = None,
+        obs_id: Optional[str] = None,
+        obs_time: Optional[str] = None,
+        num_of_rows: int = 100,
+        max_pages: int = 3
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """페이지 단위 순차 조회 (스트리밍 응답용, 페이지 수신 즉시 반환, 실패 시 예외 전달)"""
+        filters = {}
+        if local_area:
+            filters["localArea"] = local_area
+        if obs_id:
+            filters["obsid"] = obs_id
+        if obs_time:
+            filters["tm"] = obs_time
+
+        for page in range(1, max_pages + 1):
+            try:
+                items, total_count = await self._fetch_page(page, num_of_rows, filters)
+            except Exception as e:
+                # 중간 실패를 정상 종료와 구분할 수 있도록 호출 측(NDJSON 응답)에 전달
+                logger.error(f"산악기상 API 오류: {e}")
+                raise
+
+            if not items:
+                return
+            yield items
+
+            if page * num_of_rows >= (total_count or 0):
+                return
+
     async def get_weather_by_area(self, area_code: str) -> List[Dict[str, Any]]:
         """지역별 산악기상 정보 조회"""
         return await self.fetch_data(local_area=area_code)
@@ -189,90 +472,141 @@ class MountainWeatherClient(BaseAPIClient):
 class DangerInfoClient(BaseAPIClient):
     """위험지역 POI API 클라이언트"""
 
-    def __init__(self, service_key: str, base_url: str = "https://apis.data.go.kr/B553662/dangerInfoService"):
-        super().__init__()
+    def __init__(
+        self,
+        service_key: str,
+        base_url: str = "https://apis.data.go.kr/B553662/dangerInfoService",
+        http_pool: Optional[HTTPClientPool] = None,
+        cache: Optional[ResponseCache] = None,
+        breakers: Optional[BreakerRegistry] = None
+    ):
+        super().__init__(http_pool=http_pool, cache=cache, breakers=breakers)
         self.service_key = service_key
         self.base_url = base_url
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
-    async def _request_with_xml_fallback(self, url: str, params: dict) -> dict:
-        """XML/JSON 자동 변환 요청 (공공데이터 API용)"""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            logger.info(f"Requesting: {url}")
-            response = await client.get(url, params=params)
-            response.raise_for_status()
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_not_exception_type(CircuitOpen)
+    )
+    async def _request_page(self, url: str, params: dict) -> ParsedPage:
+        """JSON/XML 응답 페이지 조회 (공공데이터 API용, 브레이커 open 시 즉시 실패)
 
-            content_type = response.headers.get("content-type", "")
-            text = response.text
-
-            # JSON 파싱 시도
-            try:
-                return response.json()
-            except Exception:
-                pass
-
-            # XML 파싱 시도
-            if text.strip().startswith("<?xml") or text.strip().startswith("<"):
-                try:
-                    result = xmltodict.parse(text)
-                    logger.info("XML 응답을 JSON으로 변환 완료")
-                    return result
-                except Exception as e:
-                    logger.error(f"XML 파싱 실패: {e}")
-
-            # 에러 메시지 반환
-            logger.warning(f"응답 파싱 실패 - Content-Type: {content_type}, 내용: {text[:200]}")
-            return {"error": text}
+        - Content-Type으로 형식 판별, XML은 수신 청크 단위로 증분 파싱
+        - 해석할 수 없는 응답은 ParsedPage.error에 본문 앞부분 기록
+        """
+        async def send() -> ParsedPage:
+            async with self._client(url) as client:
+                logger.info(f"Requesting: {url}")
+                async with client.stream("GET", url, params=params, timeout=self.timeout) as response:
+                    response.raise_for_status()
+                    content_type = response.headers.get("content-type", "")
+                    chunks = response.aiter_bytes()
+                    head = b""
+                    async for head in chunks:
+                        if head.strip():
+                            break
+                    fmt = detect_format(content_type, head)
+
+                    if fmt == "xml":
+                        parser = XMLRecordParser(converters=DANGER_NUMERIC_FIELDS)
+                        try:
+                            parser.feed(head)
+                            async for chunk in chunks:
+                                parser.feed(chunk)
+                            parser.close()
+                            return parser.page
+                        except ParseError as e:
+                            logger.error(f"XML 파싱 실패: {e}")
+                            return ParsedPage(error=f"XML 파싱 실패: {e}")
+
+                    body = head + b"".join([chunk async for chunk in chunks])
+                    if fmt == "json":
+                        try:
+                            return page_from_json(json.loads(body), DANGER_NUMERIC_FIELDS)
+                        except ValueError as e:
+                            logger.error(f"JSON 파싱 실패: {e}")
+
+                    text = body.decode(response.encoding or "utf-8", errors="replace")
+                    logger.warning(f"응답 파싱 실패 - Content-Type: {content_type}, 내용: {text[:200]}")
+                    return ParsedPage(error=text)
+
+        return await self._guarded(url, send)
+
+    async def _fetch_page(
+        self,
+        url: str,
+        page: int,
+        num_of_rows: int,
+        extra_params: Optional[dict] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """단일 페이지 조회 → (items, totalCount), 에러 응답은 예외로 전달"""
+        params = {
+            "serviceKey": self.service_key,
+            "pageNo": page,
+            "numOfRows": num_of_rows,
+            "returnType": "JSON"
+        }
+        if extra_params:
+            params.update(extra_params)
+
+        result = await self._request_page(url, params)
+
+        # 에러 응답 확인
+        if result.error is not None:
+            raise ValueError(f"위험지역 API 에러 응답: {result.error[:100]}")
+
+        if not result.items:
+            # 에러 코드 확인
+            if result.result_code != "00":
+                raise ValueError(f"위험지역 API - 코드: {result.result_code}, 메시지: {result.result_msg}")
+            return [], result.total_count
+
+        logger.info(f"위험지역 API - Page {page}: {len(result.items)} records fetched")
+        return result.items, result.total_count
 
     async def fetch_data(
         self,
         endpoint: str = "getDangerInfoList",
         extra_params: Optional[dict] = None,
         num_of_rows: int = 100,
-        max_pages: int = 3
+        max_pages: int = 3,
+        concurrent: bool = False,
+        max_concurrency: int = 5,
+        use_cache: bool = True
     ) -> List[Dict[str, Any]]:
-        """위험지역 POI 정보 조회"""
+        """위험지역 POI 정보 조회
+
+        - concurrent=True: 1페이지 조회 후 나머지 페이지를 동시 조회
+        """
+        if self.cache is not None and use_cache:
+            return await self._cached(
+                {
+                    "endpoint": endpoint, "extra_params": extra_params,
+                    "num_of_rows": num_of_rows, "max_pages": max_pages
+                },
+                lambda: self.fetch_data(
+                    endpoint, extra_params, num_of_rows, max_pages,
+                    concurrent=concurrent, max_concurrency=max_concurrency, use_cache=False
+                )
+            )
+
+        if concurrent:
+            paged = await self.fetch_pages(endpoint, extra_params, num_of_rows, max_pages, max_concurrency)
+            return paged.items
+
+        url = f"{self.base_url}/{endpoint}"
         all_data = []
         page = 1
 
         while page <= max_pages:
-            params = {
-                "serviceKey": self.service_key,
-                "pageNo": page,
-                "numOfRows": num_of_rows,
-                "returnType": "JSON"
-            }
-            if extra_params:
-                params.update(extra_params)
-
-            url = f"{self.base_url}/{endpoint}"
-
             try:
-                result = await self._request_with_xml_fallback(url, params)
+                items, _ = await self._fetch_page(url, page, num_of_rows, extra_params)
 
-                # 에러 응답 확인
-                if "error" in result:
-                    logger.warning(f"위험지역 API 에러 응답: {result.get('error', '')[:100]}")
-                    break
-
-                body = result.get("response", {}).get("body", {})
-                items = body.get("items", {}).get("item", [])
-
-                # items가 None이거나 빈 문자열인 경우
                 if not items:
-                    # 에러 코드 확인
-                    header = result.get("response", {}).get("header", {})
-                    result_code = header.get("resultCode", "")
-                    result_msg = header.get("resultMsg", "")
-                    if result_code != "00":
-                        logger.warning(f"위험지역 API - 코드: {result_code}, 메시지: {result_msg}")
                     break
 
-                if isinstance(items, dict):
-                    items = [items]
-
                 all_data.extend(items)
-                logger.info(f"위험지역 API - Page {page}: {len(items)} records fetched")
 
                 if len(items) < num_of_rows:
                     break
@@ -284,15 +618,57 @@ class DangerInfoClient(BaseAPIClient):
 
         return all_data
 
+    async def fetch_pages(
+        self,
+        endpoint: str = "getDangerInfoList",
+        extra_params: Optional[dict] = None,
+        num_of_rows: int = 100,
+        max_pages: int = 3,
+        max_concurrency: int = 5
+    ) -> PagedResult:
+        """페이지 병렬 조회 (실패 페이지 정보 포함)"""
+        url = f"{self.base_url}/{endpoint}"
+        return await self._fan_out_pages(
+            lambda page: self._fetch_page(url, page, num_of_rows, extra_params),
+            num_of_rows=num_of_rows,
+            max_pages=max_pages,
+            max_concurrency=max_concurrency,
+            source="위험지역 API"
+        )
+
+    async def iter_pages(
+        self,
+        endpoint: str = "getDangerInfoList",
+        extra_params: Optional[dict] = None,
+        num_of_rows: int = 100,
+        max_pages: int = 3
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """페이지 단위 순차 조회 (스트리밍 응답용, 페이지 수신 즉시 반환, 실패 시 예외 전달)"""
+        url = f"{self.base_url}/{endpoint}"
+
+        for page in range(1, max_pages + 1):
+            try:
+                items, _ = await self._fetch_page(url, page, num_of_rows, extra_params)
+            except Exception as e:
+                logger.error(f"위험지역 API 오류: {e}")
+                raise
+
+            if not items:
+                return
+            yield items
+
+            if len(items) < num_of_rows:
+                return
+
 
 # 팩토리 함수
-def create_spectrum_client(api_key: str) -> SpectrumMapClient:
-    return SpectrumMapClient(api_key=api_key)
+def create_spectrum_client(api_key: str, http_pool: Optional[HTTPClientPool] = None) -> SpectrumMapClient:
+    return SpectrumMapClient(api_key=api_key, http_pool=http_pool)
 
 
-def create_weather_client(service_key: str) -> MountainWeatherClient:
-    return MountainWeatherClient(service_key=service_key)
+def create_weather_client(service_key: str, http_pool: Optional[HTTPClientPool] = None) -> MountainWeatherClient:
+    return MountainWeatherClient(service_key=service_key, http_pool=http_pool)
 
 
-def create_danger_client(service_key: str) -> DangerInfoClient:
-    return DangerInfoClient(service_key=service_key)
+def create_danger_client(service_key: str, http_pool: Optional[HTTPClientPool] = None) -> DangerInfoClient:
+    return DangerInfoClient(service_key=service_key, http_pool=http_pool)
@@ -0,0 +1,141 @@
+"""
+외부 API 응답 캐시
+- 소스별 TTL + LRU 크기 제한
+- 동일 요청 동시 발생 시 업스트림 1회만 호출 (single-flight)
+- 히트/미스 카운터 (/health 노출용)
+- 갱신 리스너 (새 값 저장 시 파생 색인 등 증분 갱신)
+- 만료 항목은 LRU 퇴출 전까지 보관 (업스트림 장애 시 stale 응답용)
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(source: str, params: Dict[str, Any]) -> Tuple:
+    """요청 파라미터 정규화 → 캐시 키 (None 제거, 키 정렬, 문자열 공백 제거)"""
+    normalized = []
+    for key in sorted(params):
+        value = params[key]
+        if value is None:
+            continue
+        if isinstance(value, str):
+            value = value.strip()
+        elif isinstance(value, dict):
+            value = tuple(sorted(value.items()))
+        normalized.append((key, value))
+    return (source, tuple(normalized))
+
+
+class ResponseCache:
+    """TTL/LRU 응답 캐시 (single-flight)"""
+
+    def __init__(self, name: str, ttl: float, max_entries: int = 256, cache_empty: bool = False):
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # 클라이언트는 오류 시 빈 리스트를 반환하므로 기본적으로 빈 결과는 캐시하지 않음
+        self.cache_empty = cache_empty
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        self._listeners: List[Callable[[Tuple, Any], None]] = []
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.stale_served = 0
+
+    def get(self, key: Tuple) -> Tuple[bool, Any]:
+        """캐시 조회 → (hit 여부, 값)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            return False, None
+
+        self._entries.move_to_end(key)
+        return True, value
+
+    def get_stale(self, key: Tuple) -> Tuple[bool, Any]:
+        """만료 여부와 무관하게 마지막 저장 값 조회 (업스트림 차단 시 대체 응답)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        self.stale_served += 1
+        return True, entry[1]
+
+    def set(self, key: Tuple, value: Any):
+        if not value and not self.cache_empty:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+        for listener in self._listeners:
+            try:
+                listener(key, value)
+            except Exception as e:
+                logger.warning(f"{self.name} 캐시 리스너 오류: {e}")
+
+    def add_listener(self, listener: Callable[[Tuple, Any], None]):
+        """새 값 저장 시 호출할 리스너 등록 (listener(key, value))"""
+        self._listeners.append(listener)
+
+    def invalidate(self, key: Optional[Tuple] = None):
+        """특정 키 또는 전체 무효화"""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    async def get_or_fetch(self, key: Tuple, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """캐시 조회, 미스 시 fetch 실행 (동일 키 동시 요청은 하나의 fetch를 공유)"""
+        hit, value = self.get(key)
+        if hit:
+            self.hits += 1
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await fetch()
+        except BaseException as e:
+            if not future.done():
+                future.set_exception(e)
+                # 대기자가 없을 때 "Future exception was never retrieved" 경고 방지
+                future.exception()
+            raise
+        else:
+            self.set(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "ttl_seconds": self.ttl,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "stale_served": self.stale_served,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0
+        }
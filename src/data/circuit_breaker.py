@@ -0,0 +1,256 @@
+"""
+업스트림 호스트별 서킷 브레이커 + 헤지 요청
+- closed: 정상 호출, 연속 실패가 임계값에 도달하면 open
+- open: 업스트림 호출 없이 즉시 CircuitOpen (재시도 대기 없이 실패 → 호출 측은 캐시 응답 사용)
+- half-open: reset_timeout 경과 후 시험 요청 1건만 통과, 성공 시 closed / 실패 시 다시 open
+- 헤지 요청(선택): 최근 응답시간 p95가 지나도 응답이 없으면 동일 요청을 1회 더 보내 먼저 끝난 결과 사용
+- 4xx(429 제외) 응답은 요청 문제로 보고 실패로 집계하지 않음
+"""
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Optional
+from urllib.parse import urlsplit
+import logging
+
+import httpx
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 브레이커 상태
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# 헤지 지연 계산에 필요한 최소 응답시간 표본 수
+MIN_HEDGE_SAMPLES = 20
+
+
+class CircuitOpen(RuntimeError):
+    """브레이커가 열려 업스트림 호출을 차단함"""
+
+
+def host_key(url: str) -> str:
+    """URL → scheme://netloc (HTTPClientPool과 동일한 호스트 단위)"""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def is_failure(exc: BaseException) -> bool:
+    """브레이커 실패 집계 대상 여부 (전송 오류/타임아웃/5xx/429)"""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status >= 500 or status == 429
+    return not isinstance(exc, CircuitOpen)
+
+
+class CircuitBreaker:
+    """단일 호스트 서킷 브레이커 (이벤트 루프 단일 스레드에서 사용)"""
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0, latency_window: int = 200):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probe_inflight = False
+        self.consecutive_failures = 0
+        self.latencies: deque = deque(maxlen=latency_window)
+        self.successes = 0
+        self.failures = 0
+        self.rejected = 0
+        self.opened = 0
+        self.last_error: Optional[str] = None
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+        return self._state
+
+    @property
+    def is_open(self) -> bool:
+        """호출이 차단되는 상태인지 (half-open 시험 요청 진행 중 포함)"""
+        state = self.state
+        return state == OPEN or (state == HALF_OPEN and self._probe_inflight)
+
+    def acquire(self) -> bool:
+        """호출 허용 여부 확인 → 시험 요청이면 True (차단 시 CircuitOpen)"""
+        state = self.state
+        if state == CLOSED:
+            return False
+        if state == HALF_OPEN and not self._probe_inflight:
+            self._probe_inflight = True
+            return True
+        self.rejected += 1
+        retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+        raise CircuitOpen(f"{self.name} 서킷 브레이커 open (재시도까지 {retry_in:.0f}초)")
+
+    def release(self, probe: bool):
+        """시험 요청이 결과 없이 끝난 경우(취소 등) 다음 시험 요청 허용"""
+        if probe:
+            self._probe_inflight = False
+
+    def record_success(self, latency: float):
+        self.successes += 1
+        self.latencies.append(latency)
+        self.consecutive_failures = 0
+        self._probe_inflight = False
+        if self._state != CLOSED:
+            logger.info(f"{self.name} 서킷 브레이커 closed (시험 요청 성공)")
+        self._state = CLOSED
+
+    def record_failure(self, exc: BaseException, probe: bool = False):
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.last_error = str(exc) or type(exc).__name__
+        self._probe_inflight = False
+        if probe or (self._state == CLOSED and self.consecutive_failures >= self.failure_threshold):
+            self._trip()
+
+    def _trip(self):
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+        self.opened += 1
+        logger.warning(
+            f"{self.name} 서킷 브레이커 open ({self.consecutive_failures}회 연속 실패, "
+            f"{self.reset_timeout:.0f}초 후 시험 요청): {self.last_error}"
+        )
+
+    def percentile(self, q: float) -> Optional[float]:
+        """최근 성공 응답시간 분위수 (초)"""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def hedge_delay(self, min_delay: float, max_delay: float) -> Optional[float]:
+        """헤지 요청 지연 = p95 (표본 부족 시 None → 헤지 안 함)"""
+        if len(self.latencies) < MIN_HEDGE_SAMPLES:
+            return None
+        return min(max_delay, max(min_delay, self.percentile(0.95)))
+
+    def stats(self) -> Dict[str, Any]:
+        p50 = self.percentile(0.5)
+        p95 = self.percentile(0.95)
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "successes": self.successes,
+            "failures": self.failures,
+            "rejected": self.rejected,
+            "opened": self.opened,
+            "p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+            "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+            "last_error": self.last_error
+        }
+
+
+class BreakerRegistry:
+    """호스트별 서킷 브레이커 모음 + 보호 호출 (헤지 포함)"""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        hedge_enabled: bool = False,
+        hedge_min_delay: float = 0.2,
+        hedge_max_delay: float = 5.0
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.hedge_enabled = hedge_enabled
+        self.hedge_min_delay = hedge_min_delay
+        self.hedge_max_delay = hedge_max_delay
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    def get(self, url: str) -> CircuitBreaker:
+        key = host_key(url)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(key, self.failure_threshold, self.reset_timeout)
+            self._breakers[key] = breaker
+        return breaker
+
+    def is_open(self, url: str) -> bool:
+        return self.get(url).is_open
+
+    async def call(self, url: str, send: Callable[[], Awaitable[Any]]) -> Any:
+        """브레이커 확인 → 호출 → 결과 기록 (closed 상태에서만 헤지)"""
+        breaker = self.get(url)
+        probe = breaker.acquire()
+        started = time.monotonic()
+        try:
+            delay = None
+            if self.hedge_enabled and not probe:
+                delay = breaker.hedge_delay(self.hedge_min_delay, self.hedge_max_delay)
+            if delay is None:
+                result = await send()
+            else:
+                result = await self._hedged(send, delay)
+        except asyncio.CancelledError:
+            breaker.release(probe)
+            raise
+        except Exception as e:
+            if is_failure(e):
+                breaker.record_failure(e, probe)
+            else:
+                # 4xx: 업스트림은 응답 중이므로 정상으로 간주
+                breaker.record_success(time.monotonic() - started)
+            raise
+        breaker.record_success(time.monotonic() - started)
+        return result
+
+    async def _hedged(self, send: Callable[[], Awaitable[Any]], delay: float) -> Any:
+        """delay 내 응답이 없으면 두 번째 요청 전송 → 먼저 성공한 결과 반환, 나머지 취소"""
+        primary = asyncio.ensure_future(send())
+        pending = {primary}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if done:
+                return primary.result()
+
+            self.hedged += 1
+            hedge = asyncio.ensure_future(send())
+            pending.add(hedge)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "hedge_enabled": self.hedge_enabled,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "hosts": {key: breaker.stats() for key, breaker in self._breakers.items()}
+        }
+
+
+def create_breakers(settings=None) -> Optional[BreakerRegistry]:
+    """설정값 기반 브레이커 생성 (비활성화 시 None)"""
+    if settings is None:
+        from config.settings import get_settings
+        settings = get_settings()
+
+    if not settings.BREAKER_ENABLED:
+        return None
+    return BreakerRegistry(
+        failure_threshold=settings.BREAKER_FAILURE_THRESHOLD,
+        reset_timeout=settings.BREAKER_RESET_TIMEOUT,
+        hedge_enabled=settings.HEDGE_ENABLED,
+        hedge_min_delay=settings.HEDGE_MIN_DELAY,
+        hedge_max_delay=settings.HEDGE_MAX_DELAY
+    )
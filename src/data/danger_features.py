@@ -0,0 +1,184 @@
+"""
+위험지역 거리 피처
+- 그리드 셀 좌표 배열 × 위험지역 POI 좌표 배열 → 셀별 피처
+  · danger_zone_distance: 가장 가까운 POI까지 대권 거리 (m)
+  · near_danger_zone: 반경 이내 POI 존재 여부
+  · danger_count_in_radius: 반경 이내 POI 수
+  · nearest_danger_type: 가장 가까운 POI의 plcTypeCd
+- POI는 KD-tree(단위 구면 좌표)로 1회 색인, 셀은 청크 단위로 조회해 메모리 사용량 고정
+
+(data/AI_수색지역_MVP_구현계획서.md 위험지역 피처)
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+import logging
+
+from src.data.station_index import to_unit_xyz, meters_to_chord, chord_to_meters
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_DANGER_RADIUS_M = 500.0
+DEFAULT_CHUNK_SIZE = 250_000
+
+# POI 좌표/유형 컬럼 후보 (위험지역 API: lat/lot/plcTypeCd, Mock: lat/lon/danger_type)
+POI_COORD_COLUMNS = [("lat", "lot"), ("lat", "lon")]
+POI_TYPE_COLUMNS = ["plcTypeCd", "place_type", "danger_type"]
+
+
+def poi_arrays(
+    pois: Union[pd.DataFrame, List[Dict[str, Any]]]
+) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+    """위험지역 레코드 → (위도, 경도, 유형) 배열 (좌표 없는 POI 제외)"""
+    df = pois if isinstance(pois, pd.DataFrame) else pd.DataFrame(pois)
+    if df.empty:
+        return np.array([]), np.array([]), None
+
+    lat_col, lon_col = next(
+        ((lat, lon) for lat, lon in POI_COORD_COLUMNS if lat in df.columns and lon in df.columns),
+        (None, None)
+    )
+    if lat_col is None:
+        raise ValueError(f"위험지역 좌표 컬럼 없음: {list(df.columns)}")
+
+    lats = pd.to_numeric(df[lat_col], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    lons = pd.to_numeric(df[lon_col], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = np.isfinite(lats) & np.isfinite(lons)
+
+    type_col = next((c for c in POI_TYPE_COLUMNS if c in df.columns), None)
+    types = df[type_col].to_numpy(dtype=object)[valid] if type_col else None
+    return lats[valid], lons[valid], types
+
+
+class DangerZoneIndex:
+    """위험지역 POI 공간 색인"""
+
+    def __init__(
+        self,
+        lats: Sequence[float],
+        lons: Sequence[float],
+        types: Optional[Sequence[Any]] = None
+    ):
+        self.size = len(lats)
+        self.tree = cKDTree(to_unit_xyz(lats, lons), balanced_tree=False) if self.size else None
+
+        # 유형은 정수 코드 + 카테고리로 보관 (셀 수만큼의 object 배열 생성 방지)
+        if types is not None and self.size:
+            self.type_codes, self.type_categories = pd.factorize(pd.Series(types, dtype=object))
+        else:
+            self.type_codes, self.type_categories = None, pd.Index([])
+
+    @classmethod
+    def from_records(cls, pois: Union[pd.DataFrame, List[Dict[str, Any]]]) -> "DangerZoneIndex":
+        return cls(*poi_arrays(pois))
+
+    def features(
+        self,
+        lats: Sequence[float],
+        lons: Sequence[float],
+        radius_m: float = DEFAULT_DANGER_RADIUS_M,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> pd.DataFrame:
+        """셀 좌표 배열 → 위험지역 피처 DataFrame (입력 순서 유지)"""
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        n = len(lats)
+
+        distance = np.full(n, np.nan)
+        count = np.zeros(n, dtype=np.int32)
+        nearest_code = np.full(n, -1, dtype=np.int64)
+
+        if self.tree is not None:
+            chord = meters_to_chord(radius_m)
+            for start in range(0, n, chunk_size):
+                stop = min(start + chunk_size, n)
+                points = to_unit_xyz(lats[start:stop], lons[start:stop])
+                valid = np.isfinite(points).all(axis=1)
+                if not valid.any():
+                    continue
+
+                dist, ind = self.tree.query(points[valid], k=1)
+                idx = np.flatnonzero(valid) + start
+                distance[idx] = chord_to_meters(dist)
+                count[idx] = self.tree.query_ball_point(points[valid], chord, return_length=True)
+                if self.type_codes is not None:
+                    nearest_code[idx] = self.type_codes[ind]
+
+        return pd.DataFrame({
+            "danger_zone_distance": distance,
+            "near_danger_zone": count > 0,
+            "danger_count_in_radius": count,
+            "nearest_danger_type": pd.Categorical.from_codes(
+                nearest_code, categories=self.type_categories
+            ) if len(self.type_categories) else pd.Categorical([None] * n)
+        })
+
+
+def compute_danger_features(
+    cell_lats: Sequence[float],
+    cell_lons: Sequence[float],
+    poi_lats: Sequence[float],
+    poi_lons: Sequence[float],
+    poi_types: Optional[Sequence[Any]] = None,
+    radius_m: float = DEFAULT_DANGER_RADIUS_M,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> pd.DataFrame:
+    """좌표 배열 기반 위험지역 피처 계산 (색인 1회 생성)"""
+    index = DangerZoneIndex(poi_lats, poi_lons, poi_types)
+    return index.features(cell_lats, cell_lons, radius_m=radius_m, chunk_size=chunk_size)
+
+
+def add_danger_features(
+    grid: Union[pd.DataFrame, List[Dict[str, Any]]],
+    pois: Union[pd.DataFrame, List[Dict[str, Any]]],
+    radius_m: float = DEFAULT_DANGER_RADIUS_M,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> pd.DataFrame:
+    """그리드(generate_grid_frame DataFrame / generate_grid_data 레코드 리스트)에 위험지역 피처 컬럼 추가"""
+    from src.data.spatial_join import find_coord_columns
+
+    if not isinstance(grid, pd.DataFrame):
+        grid = pd.DataFrame(grid)
+    lat_col, lon_col = find_coord_columns(grid)
+    features = DangerZoneIndex.from_records(pois).features(
+        grid[lat_col].to_numpy(dtype=np.float64),
+        grid[lon_col].to_numpy(dtype=np.float64),
+        radius_m=radius_m,
+        chunk_size=chunk_size
+    )
+    features.index = grid.index
+    return pd.concat([grid, features], axis=1)
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+    from pathlib import Path
+
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from src.data.mock_data import MockDataGenerator
+
+    generator = MockDataGenerator(seed=42)
+    grid = generator.generate_grid_frame("지리산", grid_size_m=100, grid_count=1_000_000)
+    pois = generator.generate_danger_info_frame(10_000)
+
+    started = time.perf_counter()
+    result = add_danger_features(grid, pois, radius_m=500)
+    print(f"위험지역 피처 {len(grid):,}셀 × {len(pois):,} POI: {(time.perf_counter() - started) * 1000:.0f} ms")
+    print(result[["danger_zone_distance", "danger_count_in_radius"]].describe().T)
+    print(result["nearest_danger_type"].value_counts().head())
+
+    # 브루트포스 검증 (일부 셀)
+    sample = result.iloc[:500]
+    lat = np.radians(sample["center_lat"].values)[:, None]
+    lon = np.radians(sample["center_lon"].values)[:, None]
+    p_lat = np.radians(pois["lat"].values)[None, :]
+    p_lon = np.radians(pois["lon"].values)[None, :]
+    a = np.sin((p_lat - lat) / 2) ** 2 + np.cos(lat) * np.cos(p_lat) * np.sin((p_lon - lon) / 2) ** 2
+    brute = 2 * 6_371_008.8 * np.arcsin(np.sqrt(a))
+    assert np.allclose(brute.min(axis=1), sample["danger_zone_distance"].values, atol=0.01)
+    assert ((brute <= 500).sum(axis=1) == sample["danger_count_in_radius"].values).all()
+    assert (pois["danger_type"].values[brute.argmin(axis=1)] == sample["nearest_danger_type"].astype(object).values).all()
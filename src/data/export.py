@@ -0,0 +1,144 @@
+"""
+데이터셋 파일 저장 (컬럼 포맷)
+- Parquet (zstd 압축) / Feather(Arrow IPC) / 기존 JSON+CSV
+- 저장 파일 목록, 행 수, 크기, 스키마를 담은 manifest 작성
+- 파일명/manifest에 실행 ID를 붙여 같은 초에 끝난 동시 작업끼리 덮어쓰지 않음
+- 비동기 서버에서는 스레드 풀에서 실행 (이벤트 루프 차단 방지)
+"""
+import json
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import pandas as pd
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = ("parquet", "feather", "json+csv")
+
+Dataset = Union[pd.DataFrame, List[Dict[str, Any]]]
+
+
+def _to_frame(data: Dataset) -> pd.DataFrame:
+    """레코드 → 컬럼 타입이 일관된 DataFrame
+
+    - dict/list 값(예: 전파누리 _raw)은 JSON 문자열로 변환
+    - 정수/실수 혼합, Decimal 컬럼은 숫자형, 날짜/시각 객체 컬럼은 datetime64로 변환
+    - 그 외 숫자/문자가 섞인 object 컬럼은 문자열로 통일 (Arrow 스키마 추론 실패 방지)
+    """
+    df = data.copy() if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+
+    for col in df.columns:
+        if df[col].dtype != object:
+            continue
+        kind = pd.api.types.infer_dtype(df[col], skipna=True)
+        if kind in ("string", "empty", "boolean", "floating", "integer"):
+            continue
+        if kind in ("mixed-integer-float", "decimal"):
+            df[col] = pd.to_numeric(df[col])
+            continue
+        if kind in ("datetime", "datetime64", "date"):
+            try:
+                df[col] = pd.to_datetime(df[col])
+                continue
+            except (TypeError, ValueError):
+                # 시간대가 섞인 경우 등은 문자열로 저장
+                pass
+        df[col] = df[col].map(
+            lambda v: None if v is None or (isinstance(v, float) and pd.isna(v))
+            else json.dumps(v, ensure_ascii=False) if isinstance(v, (dict, list))
+            else str(v)
+        )
+    return df
+
+
+def _write_one(df: pd.DataFrame, path_stem: Path, fmt: str, compression: str) -> List[Path]:
+    if fmt == "parquet":
+        path = path_stem.with_suffix(".parquet")
+        df.to_parquet(path, engine="pyarrow", compression=compression, index=False)
+        return [path]
+    if fmt == "feather":
+        path = path_stem.with_suffix(".feather")
+        df.reset_index(drop=True).to_feather(path, compression=compression)
+        return [path]
+
+    # 기존 형식 (JSON + UTF-8-SIG CSV)
+    json_path = path_stem.with_suffix(".json")
+    json_path.write_text(
+        df.to_json(orient="records", force_ascii=False, indent=2), encoding="utf-8"
+    )
+    csv_path = path_stem.with_suffix(".csv")
+    df.to_csv(csv_path, index=False, encoding="utf-8-sig")
+    return [json_path, csv_path]
+
+
+def write_datasets(
+    datasets: Dict[str, Dataset],
+    base_path: Union[str, Path],
+    name_template: str = "{key}_{timestamp}_{run_id}",
+    fmt: str = "parquet",
+    compression: str = "zstd",
+    timestamp: Optional[str] = None,
+    manifest_name: Optional[str] = None,
+    run_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """데이터셋 일괄 저장 + manifest 작성 (동기)
+
+    - name_template: 파일명 템플릿 ({key}, {timestamp}, {run_id} 사용 가능)
+    - run_id: 실행 ID (작업 ID 등, 미지정 시 무작위) - 기본 파일명/manifest 이름에 포함
+    - 빈 데이터셋은 건너뜀
+    - 반환: manifest dict (manifest 파일 경로 포함)
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"지원하지 않는 저장 형식: {fmt} ({', '.join(EXPORT_FORMATS)})")
+
+    base_path = Path(base_path)
+    base_path.mkdir(parents=True, exist_ok=True)
+    timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+    run_id = run_id or uuid.uuid4().hex[:8]
+
+    entries = []
+    for key, data in datasets.items():
+        if data is None or len(data) == 0:
+            continue
+
+        df = _to_frame(data)
+        stem = base_path / name_template.format(key=key, timestamp=timestamp, run_id=run_id)
+        for path in _write_one(df, stem, fmt, compression):
+            entries.append({
+                "dataset": key,
+                "path": str(path),
+                "format": path.suffix.lstrip("."),
+                "rows": len(df),
+                "bytes": path.stat().st_size,
+                "columns": {col: str(dtype) for col, dtype in df.dtypes.items()}
+            })
+
+    manifest = {
+        "created_at": datetime.now().isoformat(),
+        "run_id": run_id,
+        "format": fmt,
+        "compression": compression if fmt != "json+csv" else None,
+        "files": entries
+    }
+    manifest_path = base_path / (manifest_name or f"manifest_{timestamp}_{run_id}.json")
+    manifest_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+    manifest["manifest_path"] = str(manifest_path)
+
+    logger.info(f"데이터셋 저장 완료 ({fmt}): {len(entries)}개 파일 → {manifest_path.name}")
+    return manifest
+
+
+def read_dataset(path: Union[str, Path]) -> pd.DataFrame:
+    """저장된 데이터셋 파일 로드 (확장자로 형식 판별)"""
+    path = Path(path)
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path)
+    if path.suffix == ".feather":
+        return pd.read_feather(path)
+    if path.suffix == ".csv":
+        return pd.read_csv(path, encoding="utf-8-sig")
+    return pd.read_json(path, orient="records")
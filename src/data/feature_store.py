@@ -0,0 +1,376 @@
+"""
+H3 셀 단위 증분 피처 저장소
+- 피처 패밀리(coverage / danger / weather / history)별로 분리된 Parquet 데이터셋
+  · 경로: {root}/{family}/parent={상위 H3 셀}/part.parquet (셀 ID는 uint64 "cell" 컬럼)
+  · 한 패밀리 갱신 시 다른 패밀리 파일은 건드리지 않음
+- 패밀리별 버전 + 파티션별 버전을 manifest(_manifest.json)에 기록
+- 부분 재계산: 영향받은 셀만 다시 계산해 해당 파티션만 재작성
+- 조회: 필요한 셀이 속한 파티션과 필요한 컬럼만 로드 (파티션은 버전 기준 메모리 캐시)
+
+거리(dist_to_last_seen) / 시간 피처는 요청마다 달라지므로 저장하지 않고 조회 시 계산한다.
+(data/AI_수색지역_MVP_구현계획서.md 6.1)
+"""
+import json
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import logging
+
+from src.data.spatial_join import CELL_DTYPE, H3_RESOLUTION, cells_to_parent, cells_to_latlng, cells_within_radius
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_DIR = Path(__file__).parent.parent.parent / "data" / "features"
+PARENT_RESOLUTION = 5
+CELL_COLUMN = "cell"
+
+# 저장 대상 패밀리 (셀 고정 피처)
+FEATURE_FAMILIES = {
+    "coverage": ["num_stations_in_range", "avg_station_power", "coverage_score"],
+    "danger": ["near_danger_zone", "danger_zone_distance", "danger_count_in_radius", "nearest_danger_type"],
+    "weather": ["precipitation_mm", "humidity_2m", "weather_risk_score"],
+    "history": ["historical_accident_count"],
+}
+
+ComputeFn = Callable[[np.ndarray], pd.DataFrame]
+
+
+class FeatureStore:
+    """패밀리/파티션 단위 Parquet 피처 저장소"""
+
+    def __init__(
+        self,
+        root: Union[str, Path] = DEFAULT_STORE_DIR,
+        cell_res: int = H3_RESOLUTION,
+        parent_res: int = PARENT_RESOLUTION,
+        max_cached_partitions: int = 256
+    ):
+        self.root = Path(root)
+        self.cell_res = cell_res
+        self.parent_res = parent_res
+        self.max_cached_partitions = max_cached_partitions
+        self._lock = threading.RLock()
+        # 패밀리별 재계산 직렬화 (겹친 갱신이 역순으로 저장되지 않도록)
+        self._family_locks: Dict[str, threading.Lock] = {}
+        # (패밀리, 파티션) → (파티션 버전, DataFrame)
+        self._partitions: "OrderedDict[Tuple[str, int], Tuple[int, pd.DataFrame]]" = OrderedDict()
+        self._manifest_path = self.root / "_manifest.json"
+        self.manifest = self._load_manifest()
+
+    # ===== manifest =====
+    def _load_manifest(self) -> Dict[str, Any]:
+        if self._manifest_path.exists():
+            manifest = json.loads(self._manifest_path.read_text(encoding="utf-8"))
+            if manifest.get("cell_res") != self.cell_res or manifest.get("parent_res") != self.parent_res:
+                raise ValueError(
+                    f"피처 저장소 해상도 불일치: {self.root} "
+                    f"(저장: {manifest.get('cell_res')}/{manifest.get('parent_res')}, 요청: {self.cell_res}/{self.parent_res})"
+                )
+            return manifest
+        return {"cell_res": self.cell_res, "parent_res": self.parent_res, "families": {}}
+
+    def _save_manifest(self):
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self._manifest_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp, self._manifest_path)
+
+    def versions(self) -> Dict[str, int]:
+        """패밀리별 현재 버전"""
+        return {name: info["version"] for name, info in self.manifest["families"].items()}
+
+    # ===== 경로 =====
+    def parents_of(self, cells: np.ndarray) -> np.ndarray:
+        return cells_to_parent(np.asarray(cells, dtype=CELL_DTYPE), self.parent_res)
+
+    def _partition_path(self, family: str, parent: int) -> Path:
+        return self.root / family / f"parent={int(parent):x}" / "part.parquet"
+
+    def _family_parents(self, family: str) -> List[int]:
+        info = self.manifest["families"].get(family)
+        return [int(p, 16) for p in info["partitions"]] if info else []
+
+    def _load_partition(self, family: str, parent: int) -> pd.DataFrame:
+        """파티션 로드 (manifest 버전이 같으면 메모리 캐시 사용)"""
+        version = self.manifest["families"][family]["partitions"][f"{parent:x}"]
+        cached = self._partitions.get((family, parent))
+        if cached is not None and cached[0] == version:
+            self._partitions.move_to_end((family, parent))
+            return cached[1]
+
+        part = pd.read_parquet(self._partition_path(family, parent))
+        self._partitions[(family, parent)] = (version, part)
+        while len(self._partitions) > self.max_cached_partitions:
+            self._partitions.popitem(last=False)
+        return part
+
+    # ===== 쓰기 =====
+    def write(self, family: str, df: pd.DataFrame, replace: bool = False, as_of: Optional[datetime] = None) -> int:
+        """패밀리 피처 저장 (cell 컬럼 필수) → 새 버전
+
+        - 같은 셀의 기존 행은 교체, 다른 셀은 유지 (replace=True면 패밀리 전체 교체)
+        - df에 포함된 셀의 파티션만 재작성
+        - as_of: 원천 데이터 기준 시각 (manifest에 기록, recompute의 역순 저장 방지용)
+        """
+        if CELL_COLUMN not in df.columns:
+            raise ValueError(f"'{CELL_COLUMN}' 컬럼이 필요합니다")
+
+        df = df.assign(**{CELL_COLUMN: df[CELL_COLUMN].to_numpy(dtype=CELL_DTYPE)})
+        df = df[df[CELL_COLUMN] != 0].drop_duplicates(CELL_COLUMN, keep="last")
+        parents = self.parents_of(df[CELL_COLUMN].to_numpy())
+
+        with self._lock:
+            info = self.manifest["families"].get(family)
+            if info is None or replace:
+                if info is not None:
+                    for parent in self._family_parents(family):
+                        self._partition_path(family, parent).unlink(missing_ok=True)
+                info = {"version": info["version"] if info else 0, "columns": [], "partitions": {}}
+            version = info["version"] + 1
+
+            for parent, part in df.groupby(parents, sort=False):
+                path = self._partition_path(family, parent)
+                if path.exists():
+                    existing = pd.read_parquet(path)
+                    existing = existing[~existing[CELL_COLUMN].isin(part[CELL_COLUMN])]
+                    part = pd.concat([existing, part], ignore_index=True)
+                part = part.sort_values(CELL_COLUMN, ignore_index=True)
+
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_suffix(".tmp")
+                part.to_parquet(tmp, engine="pyarrow", compression="zstd", index=False)
+                os.replace(tmp, path)
+                info["partitions"][f"{int(parent):x}"] = version
+
+            info["version"] = version
+            info["columns"] = [c for c in df.columns if c != CELL_COLUMN]
+            info["updated_at"] = datetime.now().isoformat()
+            if as_of is not None:
+                info["as_of"] = as_of.isoformat()
+            self.manifest["families"][family] = info
+            self._save_manifest()
+
+        logger.info(f"피처 저장: {family} v{version} ({len(df)}셀, {len(np.unique(parents))}개 파티션)")
+        return version
+
+    def _family_lock(self, family: str) -> threading.Lock:
+        with self._lock:
+            return self._family_locks.setdefault(family, threading.Lock())
+
+    def recompute(
+        self,
+        family: str,
+        cells: Sequence[int],
+        compute: ComputeFn,
+        as_of: Optional[datetime] = None
+    ) -> int:
+        """지정 셀만 재계산해 저장 (compute(cells) → 셀 순서대로 피처 DataFrame)
+
+        - 같은 패밀리 재계산은 순차 실행 (계산 + 저장을 패밀리 락 안에서 수행)
+        - as_of 지정 시 이미 저장된 기준 시각보다 오래된 원천이면 저장하지 않음
+        """
+        cells = pd.unique(np.asarray(cells, dtype=CELL_DTYPE))
+        cells = cells[cells != 0]
+        if len(cells) == 0:
+            return self.versions().get(family, 0)
+
+        with self._family_lock(family):
+            stored_as_of = self.manifest["families"].get(family, {}).get("as_of")
+            if as_of is not None and stored_as_of is not None and as_of <= datetime.fromisoformat(stored_as_of):
+                logger.info(f"피처 재계산 생략: {family} (원천 {as_of.isoformat()} ≤ 저장 {stored_as_of})")
+                return self.versions()[family]
+
+            features = compute(cells).reset_index(drop=True)
+            features.insert(0, CELL_COLUMN, cells)
+            return self.write(family, features, as_of=as_of)
+
+    # ===== 읽기 =====
+    def existing_cells(self, family: str, cells: Optional[Sequence[int]] = None) -> np.ndarray:
+        """패밀리에 저장된 셀 (cells 지정 시 그중 저장된 셀만)"""
+        if cells is None:
+            parents = self._family_parents(family)
+        else:
+            cells = np.asarray(cells, dtype=CELL_DTYPE)
+            parents = np.unique(self.parents_of(cells)).tolist()
+
+        found = [
+            pd.read_parquet(path, columns=[CELL_COLUMN])[CELL_COLUMN].to_numpy()
+            for path in (self._partition_path(family, p) for p in parents)
+            if path.exists()
+        ]
+        stored = np.concatenate(found) if found else np.array([], dtype=CELL_DTYPE)
+        return stored if cells is None else stored[np.isin(stored, cells)]
+
+    def read(
+        self,
+        cells: Optional[Sequence[int]] = None,
+        families: Optional[Sequence[str]] = None,
+        columns: Optional[Sequence[str]] = None
+    ) -> pd.DataFrame:
+        """셀 피처 조회 - 필요한 파티션/컬럼만 로드
+
+        - cells 지정 시 해당 셀 순서대로 반환 (저장되지 않은 피처는 결측)
+        - columns 지정 시 해당 컬럼을 가진 패밀리만 로드
+        """
+        families = list(families or self.manifest["families"].keys())
+        if cells is not None:
+            cells = np.asarray(cells, dtype=CELL_DTYPE)
+            wanted_parents = set(np.unique(self.parents_of(cells)).tolist())
+
+        frames = []
+        with self._lock:
+            for family in families:
+                info = self.manifest["families"].get(family)
+                if info is None:
+                    continue
+                family_columns = [c for c in info["columns"] if columns is None or c in columns]
+                if not family_columns:
+                    continue
+
+                parts = []
+                for parent in self._family_parents(family):
+                    if cells is not None and parent not in wanted_parents:
+                        continue
+                    part = self._load_partition(family, parent)[[CELL_COLUMN] + family_columns]
+                    if cells is not None:
+                        part = part[part[CELL_COLUMN].isin(cells)]
+                    parts.append(part)
+
+                if parts:
+                    frames.append(pd.concat(parts, ignore_index=True).set_index(CELL_COLUMN))
+
+        if cells is not None:
+            result = pd.DataFrame(index=pd.Index(cells, name=CELL_COLUMN))
+            for frame in frames:
+                result = result.join(frame, how="left")
+            return result.reset_index()
+
+        if not frames:
+            return pd.DataFrame({CELL_COLUMN: np.array([], dtype=CELL_DTYPE)})
+        result = frames[0]
+        for frame in frames[1:]:
+            result = result.join(frame, how="outer")
+        return result.reset_index()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            name: {"version": info["version"], "partitions": len(info["partitions"]), "updated_at": info.get("updated_at")}
+            for name, info in self.manifest["families"].items()
+        }
+
+
+# ===== 소스 갱신 → 부분 재계산 =====
+def refresh_coverage(
+    store: FeatureStore,
+    station_index,
+    changed_lats: Sequence[float],
+    changed_lons: Sequence[float],
+    radius_m: Optional[float] = None
+) -> int:
+    """변경된 기지국 주변 셀의 coverage 피처만 재계산 → 재계산 셀 수"""
+    from src.data.station_index import DEFAULT_RADIUS_M
+
+    radius_m = radius_m or DEFAULT_RADIUS_M
+    affected = cells_within_radius(changed_lats, changed_lons, radius_m, store.cell_res)
+    cells = store.existing_cells("coverage", affected)
+    if len(cells) == 0:
+        return 0
+
+    def compute(cells: np.ndarray) -> pd.DataFrame:
+        lats, lons = cells_to_latlng(cells)
+        return station_index.coverage_features(lats, lons, radius_m=radius_m)[FEATURE_FAMILIES["coverage"]]
+
+    store.recompute("coverage", cells, compute)
+    return len(cells)
+
+
+def refresh_weather(
+    store: FeatureStore,
+    registry,
+    records: Union[pd.DataFrame, List[Dict[str, Any]]],
+    as_of: Optional[datetime] = None
+) -> int:
+    """기상 스냅샷 → 저장된 셀의 weather 피처만 재계산 → 재계산 셀 수
+
+    대상 셀: 저장소의 모든 패밀리에 저장된 셀 (다른 패밀리 파일은 건드리지 않음)
+    """
+    from src.data.observatories import ObservatoryAssignment, weather_cell_features
+
+    stored = [store.existing_cells(family) for family in list(store.manifest["families"])]
+    cells = np.unique(np.concatenate(stored)) if stored else np.array([], dtype=CELL_DTYPE)
+    if len(cells) == 0 or len(registry) == 0:
+        return 0
+
+    assignment = ObservatoryAssignment.cached(registry, cells, res=store.cell_res)
+
+    def compute(cells: np.ndarray) -> pd.DataFrame:
+        return weather_cell_features(assignment, registry, records, cells)[FEATURE_FAMILIES["weather"]]
+
+    store.recompute("weather", cells, compute, as_of=as_of)
+    return len(cells)
+
+
+if __name__ == "__main__":
+    import sys
+    import tempfile
+    import time
+
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from src.data.mock_data import MockDataGenerator
+    from src.data.spatial_join import latlng_to_cells
+    from src.data.station_index import StationIndex
+    from src.data.danger_features import DangerZoneIndex
+
+    generator = MockDataGenerator(seed=42)
+    grid = generator.generate_grid_frame("지리산", grid_size_m=100, grid_count=250_000)
+    cells = pd.unique(latlng_to_cells(grid["center_lat"].values, grid["center_lon"].values, H3_RESOLUTION)[H3_RESOLUTION])
+    stations = generator.generate_base_stations("지리산", 500)
+    index = StationIndex(stations)
+    danger = DangerZoneIndex.from_records(generator.generate_danger_info_frame(200))
+
+    store = FeatureStore(tempfile.mkdtemp())
+    lats, lons = cells_to_latlng(cells)
+
+    started = time.perf_counter()
+    store.recompute("coverage", cells, lambda c: index.coverage_features(lats, lons)[FEATURE_FAMILIES["coverage"]])
+    store.recompute("danger", cells, lambda c: danger.features(lats, lons))
+    print(f"전체 계산 {len(cells):,}셀: {(time.perf_counter() - started) * 1000:.0f} ms, {store.stats()}")
+
+    # 기지국 10개 변경 → 주변 셀 coverage만 재계산
+    index.upsert([dict(s, PWR=s["PWR"] * 2) for s in stations[:10]])
+    danger_version = store.versions()["danger"]
+    started = time.perf_counter()
+    count = refresh_coverage(store, index, index.last_changed[:, 0], index.last_changed[:, 1])
+    print(f"부분 재계산 {count:,}셀: {(time.perf_counter() - started) * 1000:.0f} ms, {store.versions()}")
+    assert store.versions()["danger"] == danger_version
+
+    # 탐색 영역 조회: 필요한 셀/컬럼만
+    area = cells[:2000]
+    started = time.perf_counter()
+    features = store.read(area, columns=["coverage_score", "danger_zone_distance"])
+    print(f"영역 조회 {len(area):,}셀: {(time.perf_counter() - started) * 1000:.0f} ms, 컬럼 {list(features.columns)}")
+    expected = index.coverage_features(*cells_to_latlng(area))["coverage_score"].values
+    assert np.allclose(features["coverage_score"].values, expected)
+
+    # 기상 스냅샷 → weather 패밀리만 재계산, 오래된 스냅샷은 저장하지 않음
+    from datetime import timedelta
+    from src.data.observatories import ObservatoryRegistry
+
+    registry = ObservatoryRegistry.from_mock_parks()
+    snapshot = generator.generate_mountain_weather_frame(len(registry))
+    coverage_version = store.versions()["coverage"]
+    fetched_at = datetime.now()
+    started = time.perf_counter()
+    count = refresh_weather(store, registry, snapshot, as_of=fetched_at)
+    print(f"기상 재계산 {count:,}셀: {(time.perf_counter() - started) * 1000:.0f} ms, {store.versions()}")
+    weather_version = store.versions()["weather"]
+    refresh_weather(store, registry, snapshot, as_of=fetched_at - timedelta(minutes=2))
+    assert store.versions()["weather"] == weather_version
+    assert store.versions()["coverage"] == coverage_version
@@ -0,0 +1,227 @@
+"""
+지오코딩 영구 캐시 (SQLite)
+- 주소 → 좌표 결과를 디스크에 저장하여 재실행 시 네트워크 호출 생략
+- 실패 결과는 TTL 기간 동안 네거티브 캐시
+- 기존 주소_좌표_매핑 Excel 일괄 임포트
+- 캐시 키는 사고 데이터 로더와 같은 규칙으로 정규화 (개편 전 시도명 → 현재 명칭)
+"""
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, List, Dict, Iterable, Union
+import logging
+
+from src.data.sgis_client import GeocodingResult
+from src.data.accident_loader import REGION_ALIASES
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path(__file__).parent.parent.parent / "data" / "cache" / "geocode.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS geocode (
+    address TEXT PRIMARY KEY,
+    lon REAL,
+    lat REAL,
+    sido_nm TEXT,
+    sgg_nm TEXT,
+    emdong_nm TEXT,
+    full_addr TEXT,
+    matching INTEGER,
+    success INTEGER NOT NULL,
+    error TEXT,
+    updated_at REAL NOT NULL
+) WITHOUT ROWID
+"""
+
+_COLUMNS = (
+    "address", "lon", "lat", "sido_nm", "sgg_nm", "emdong_nm",
+    "full_addr", "matching", "success", "error", "updated_at"
+)
+
+
+def normalize_address(address: str) -> str:
+    """캐시 키용 주소 정규화 (앞뒤/중복 공백 제거, 개편 전 시도명 → 현재 명칭)
+
+    매핑 Excel의 "강원도 ..." 키와 로더가 만든 "강원특별자치도 ..." 주소가 같은 키가 되도록
+    accident_loader.REGION_ALIASES를 첫 토큰(시도)에 적용한다.
+    """
+    tokens = str(address).split()
+    if tokens:
+        tokens[0] = REGION_ALIASES.get(tokens[0], tokens[0])
+    return " ".join(tokens)
+
+
+class GeocodeCache:
+    """SQLite 기반 지오코딩 캐시"""
+
+    def __init__(
+        self,
+        path: Union[str, Path] = DEFAULT_CACHE_PATH,
+        negative_ttl: float = 7 * 24 * 60 * 60
+    ):
+        self.path = Path(path)
+        self.negative_ttl = negative_ttl
+        self.hits = 0
+        self.misses = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        # 이전 규칙(공백 정규화만)으로 저장된 개편 전 시도명 키를 현재 명칭으로 변경
+        for old, new in REGION_ALIASES.items():
+            self._conn.execute(
+                "UPDATE OR IGNORE geocode SET address = ? || substr(address, ?) WHERE address LIKE ?",
+                (new, len(old) + 1, f"{old} %")
+            )
+        self._conn.commit()
+
+    def _to_result(self, row: tuple) -> GeocodingResult:
+        data = dict(zip(_COLUMNS, row))
+        return GeocodingResult(
+            address=data["address"],
+            x=data["lon"],
+            y=data["lat"],
+            sido_nm=data["sido_nm"],
+            sgg_nm=data["sgg_nm"],
+            emdong_nm=data["emdong_nm"],
+            full_addr=data["full_addr"],
+            matching=data["matching"],
+            success=bool(data["success"]),
+            error=data["error"]
+        )
+
+    def _is_fresh(self, row: tuple) -> bool:
+        """성공 결과는 만료 없음, 실패 결과는 negative_ttl 이내만 유효"""
+        success, updated_at = row[8], row[10]
+        return bool(success) or time.time() - updated_at < self.negative_ttl
+
+    def get(self, address: str) -> Optional[GeocodingResult]:
+        """캐시 조회 (미스 또는 만료된 실패 결과는 None)"""
+        key = normalize_address(address)
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM geocode WHERE address = ?", (key,)
+            ).fetchone()
+
+        if row is None or not self._is_fresh(row):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        result = self._to_result(row)
+        result.address = address
+        return result
+
+    def get_many(self, addresses: Iterable[str]) -> Dict[str, GeocodingResult]:
+        """여러 주소 일괄 조회 → {원본 주소: 결과} (히트만 포함)"""
+        # 정규화 키 → 원본 주소들 (구/신 명칭 주소가 같은 키로 모일 수 있음)
+        keys: Dict[str, List[str]] = {}
+        for address in addresses:
+            keys.setdefault(normalize_address(address), []).append(address)
+        found: Dict[str, GeocodingResult] = {}
+        key_list = list(keys)
+
+        # SQLite 바인딩 변수 제한 고려하여 분할 조회
+        for i in range(0, len(key_list), 500):
+            chunk = key_list[i:i + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT {', '.join(_COLUMNS)} FROM geocode WHERE address IN ({placeholders})",
+                    chunk
+                ).fetchall()
+            for row in rows:
+                if self._is_fresh(row):
+                    for address in keys[row[0]]:
+                        result = self._to_result(row)
+                        result.address = address
+                        found[address] = result
+
+        total = sum(len(originals) for originals in keys.values())
+        self.hits += len(found)
+        self.misses += total - len(found)
+        return found
+
+    def put(self, result: GeocodingResult):
+        self.put_many([result])
+
+    def put_many(self, results: Iterable[GeocodingResult]):
+        """결과 저장 (동일 주소는 갱신)"""
+        now = time.time()
+        rows = [
+            (
+                normalize_address(r.address), r.x, r.y, r.sido_nm, r.sgg_nm, r.emdong_nm,
+                r.full_addr, r.matching, int(r.success), r.error, now
+            )
+            for r in results
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO geocode ({', '.join(_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(_COLUMNS))})",
+                rows
+            )
+            self._conn.commit()
+
+    def import_excel(self, file_path: Union[str, Path], overwrite: bool = False) -> int:
+        """주소_좌표_매핑 Excel 일괄 임포트 (original_addr, lat, lon, ... 컬럼)
+
+        overwrite=False이면 이미 캐시에 있는 주소는 유지한다.
+        """
+        import pandas as pd
+
+        df = pd.read_excel(file_path)
+        addr_col = "original_addr" if "original_addr" in df.columns else "address"
+        df = df.dropna(subset=[addr_col])
+        df = df.astype(object).where(df.notna(), None)
+
+        matching_map = {"완전": 0, "불완전": 1}
+
+        def _col(row, name):
+            return row[name] if name in row else None
+
+        results: List[GeocodingResult] = []
+        for row in df.to_dict("records"):
+            matching = _col(row, "matching")
+            if isinstance(matching, str):
+                matching = matching_map.get(matching)
+            success = bool(_col(row, "success")) and _col(row, "lat") is not None
+            results.append(GeocodingResult(
+                address=str(row[addr_col]),
+                x=_col(row, "lon"),
+                y=_col(row, "lat"),
+                sido_nm=_col(row, "sido_nm"),
+                sgg_nm=_col(row, "sgg_nm"),
+                emdong_nm=_col(row, "emdong_nm"),
+                full_addr=_col(row, "full_addr_result"),
+                matching=int(matching) if matching is not None else None,
+                success=success,
+                error=_col(row, "error")
+            ))
+
+        if not overwrite:
+            existing = self.get_many(r.address for r in results)
+            results = [r for r in results if r.address not in existing]
+
+        self.put_many(results)
+        logger.info(f"지오코딩 캐시 임포트: {file_path} → {len(results)}건")
+        return len(results)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM geocode").fetchone()[0]
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self), "hits": self.hits, "misses": self.misses}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,103 @@
+"""
+공용 HTTP 커넥션 풀
+- 업스트림 호스트별 장수명 httpx.AsyncClient 1개 유지 (keep-alive)
+- HTTP/2 선택 사용 (h2 패키지 필요)
+- 풀 크기/keep-alive 만료 설정 가능
+"""
+import httpx
+from typing import Dict
+from urllib.parse import urlsplit
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _http2_available() -> bool:
+    """h2 패키지 설치 여부 확인"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class HTTPClientPool:
+    """호스트별 공유 AsyncClient 풀
+
+    호출마다 AsyncClient를 새로 만들면 매번 TCP+TLS 핸드셰이크가 발생하므로,
+    호스트(scheme+netloc)별로 클라이언트를 하나씩 만들어 재사용한다.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False
+    ):
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        if http2 and not _http2_available():
+            logger.warning("h2 패키지가 없어 HTTP/1.1로 동작합니다 (pip install httpx[http2])")
+            http2 = False
+        self.http2 = http2
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._closed = False
+
+    @staticmethod
+    def _host_key(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
+
+    def get(self, url: str) -> httpx.AsyncClient:
+        """URL의 호스트에 해당하는 공유 클라이언트 반환 (없으면 생성)"""
+        if self._closed:
+            raise RuntimeError("HTTPClientPool이 이미 종료되었습니다")
+
+        key = self._host_key(url)
+        client = self._clients.get(key)
+        if client is None:
+            client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2
+            )
+            self._clients[key] = client
+            logger.info(f"HTTP 커넥션 풀 생성: {key} (http2={self.http2})")
+        return client
+
+    @property
+    def hosts(self) -> list:
+        return list(self._clients.keys())
+
+    async def aclose(self):
+        """모든 공유 클라이언트 종료"""
+        self._closed = True
+        clients, self._clients = self._clients, {}
+        for key, client in clients.items():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.error(f"HTTP 커넥션 풀 종료 오류 ({key}): {e}")
+        logger.info(f"HTTP 커넥션 풀 종료 ({len(clients)}개 호스트)")
+
+
+def create_http_pool(settings=None) -> HTTPClientPool:
+    """설정값 기반 커넥션 풀 생성"""
+    if settings is None:
+        from config.settings import get_settings
+        settings = get_settings()
+
+    return HTTPClientPool(
+        timeout=settings.HTTP_TIMEOUT,
+        max_connections=settings.HTTP_POOL_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.HTTP_POOL_MAX_KEEPALIVE,
+        keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+        http2=settings.HTTP2_ENABLED
+    )
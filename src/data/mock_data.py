@@ -4,8 +4,9 @@ Mock 데이터 생성기
 """
 import random
 import numpy as np
+import pandas as pd
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import json
 
 
@@ -32,7 +33,15 @@ class MockDataGenerator:
     DANGER_TYPES = ["낙석위험", "급경사", "낙뢰위험", "실족위험", "고도위험", "계곡위험"]
     ACCIDENT_TYPES = ["일반추락", "실족추락", "질병환자", "탈진/탈수", "기타사고"]
 
+    # 벡터화 생성 시 테이블별 독립 난수 스트림 (호출 순서와 무관하게 seed별 결정적)
+    TABLE_STREAMS = {
+        "base_stations": 1, "mountain_weather": 2, "danger_info": 3,
+        "grids": 4, "episodes": 5, "ground_truths": 6
+    }
+    LANDCOVERS = ["FOREST", "GRASS", "ROCK", "WATER"]
+
     def __init__(self, seed: int = 42):
+        self.seed = seed
         random.seed(seed)
         np.random.seed(seed)
 
@@ -270,6 +279,231 @@ class MockDataGenerator:
             }
         }
 
+    # ===== 벡터화 생성 (대용량, DataFrame 반환) =====
+    def _rng(self, table: str) -> np.random.Generator:
+        return np.random.default_rng([self.seed, self.TABLE_STREAMS[table]])
+
+    @staticmethod
+    def _choice(rng: np.random.Generator, values: List[Any], size: int) -> np.ndarray:
+        return np.asarray(values, dtype=object)[rng.integers(0, len(values), size)]
+
+    def generate_base_stations_frame(
+        self,
+        park_name: str = "지리산",
+        count: int = 50
+    ) -> pd.DataFrame:
+        """이동통신 기지국 Mock 데이터 (벡터화)"""
+        rng = self._rng("base_stations")
+        if park_name == "ALL":
+            parks = list(self.PARKS.keys())
+        else:
+            parks = [park_name] if park_name in self.PARKS else ["지리산"]
+
+        park_idx = rng.integers(0, len(parks), count)
+        park_arr = np.asarray(parks, dtype=object)[park_idx]
+        park_lat = np.array([self.PARKS[p]["lat"] for p in parks])[park_idx]
+        park_lon = np.array([self.PARKS[p]["lon"] for p in parks])[park_idx]
+        prefixes = np.array([p[:2] for p in parks], dtype=object)[park_idx]
+
+        return pd.DataFrame({
+            "LAT": np.round(park_lat + rng.normal(0, 0.05, count), 6),
+            "LON": np.round(park_lon + rng.normal(0, 0.05, count), 6),
+            "FRQ": rng.choice([700, 850, 1800, 2100, 2600, 3500], count),
+            "PWR": np.round(rng.uniform(5, 40, count), 1),
+            "ANT_FORM": self._choice(rng, self.ANTENNA_FORMS, count),
+            "ANT_GAIN": np.round(rng.uniform(10, 20, count), 1),
+            "SEA_ALT": np.round(rng.uniform(200, 1500, count), 1),
+            "GRD_ALT": np.round(rng.uniform(10, 50, count), 1),
+            "CUS_CD": self._choice(rng, self.CARRIERS, count),
+            "SERVICE_CD": self._choice(rng, self.SERVICES, count),
+            "PARK_NM": park_arr,
+            "STATION_ID": "BS-" + pd.Series(prefixes) + "-" + pd.Series(np.arange(1, count + 1)).astype(str).str.zfill(4)
+        })
+
+    def generate_mountain_weather_frame(
+        self,
+        count: int = 30,
+        local_area: Optional[str] = None
+    ) -> pd.DataFrame:
+        """산악기상 Mock 데이터 (벡터화)"""
+        rng = self._rng("mountain_weather")
+        obs = pd.DataFrame([
+            {"obsid": f"OBS{i:04d}", "obsname": park, "localarea": info["area_code"]}
+            for i, (park, info) in enumerate(self.PARKS.items())
+        ])
+        if local_area:
+            obs = obs[obs["localarea"] == local_area].reset_index(drop=True)
+
+        picked = obs.iloc[rng.integers(0, len(obs), count)].reset_index(drop=True)
+        base_time = datetime.now() - timedelta(hours=count)
+        times = pd.date_range(base_time, periods=count, freq="h")
+
+        picked["tm"] = times.strftime("%Y-%m-%d %H:%M")
+        picked["cprn"] = np.round(rng.uniform(0, 50, count), 1)
+        picked["rn"] = np.round(rng.uniform(0, 20, count), 1)
+        picked["hm10m"] = np.round(rng.uniform(40, 95, count), 1)
+        picked["hm2m"] = np.round(rng.uniform(45, 98, count), 1)
+        picked["pa"] = np.round(rng.uniform(950, 1030, count), 1)
+        picked["ta"] = np.round(rng.uniform(-10, 30, count), 1)
+        picked["ws"] = np.round(rng.uniform(0, 15, count), 1)
+        return picked
+
+    def generate_danger_info_frame(self, count: int = 40) -> pd.DataFrame:
+        """위험지역 POI Mock 데이터 (벡터화)"""
+        rng = self._rng("danger_info")
+        parks = list(self.PARKS.keys())
+        park_idx = rng.integers(0, len(parks), count)
+        park_arr = pd.Series(np.asarray(parks, dtype=object)[park_idx])
+        park_lat = np.array([self.PARKS[p]["lat"] for p in parks])[park_idx]
+        park_lon = np.array([self.PARKS[p]["lon"] for p in parks])[park_idx]
+        sections = pd.Series(self._choice(rng, ["북릉", "남릉", "동릉", "서릉", "정상부근", "계곡", "능선"], count))
+        registered = pd.Timestamp(datetime.now().date()) - pd.to_timedelta(rng.integers(0, 366, count), unit="D")
+
+        return pd.DataFrame({
+            "danger_id": "DNG-" + pd.Series(np.arange(1, count + 1)).astype(str).str.zfill(5),
+            "danger_type": self._choice(rng, self.DANGER_TYPES, count),
+            "location_name": park_arr + " " + sections,
+            "lat": np.round(park_lat + rng.normal(0, 0.03, count), 6),
+            "lon": np.round(park_lon + rng.normal(0, 0.03, count), 6),
+            "mountain_name": park_arr,
+            "altitude": np.round(rng.uniform(300, 1800, count), 1),
+            "severity": self._choice(rng, ["높음", "중간", "낮음"], count),
+            "description": pd.Series(self._choice(rng, self.DANGER_TYPES, count)) + " 주의 구간",
+            "registered_date": registered.strftime("%Y-%m-%d")
+        })
+
+    def generate_grid_frame(
+        self,
+        park_name: str = "지리산",
+        grid_size_m: int = 100,
+        grid_count: int = 500,
+        with_ids: bool = False
+    ) -> pd.DataFrame:
+        """100m x 100m Grid Mock 데이터 (벡터화, 수백만 셀 규모)
+
+        - 행 단위 Python 객체 없이 열 배열로 생성 (landcover는 Categorical)
+        - grid_id 문자열은 with_ids=True일 때만 생성 (대용량에서는 grid_row/grid_col 사용)
+        """
+        rng = self._rng("grids")
+        park_info = self.PARKS.get(park_name, self.PARKS["지리산"])
+        degree_per_100m = 0.0009
+
+        grid_per_side = int(np.sqrt(grid_count))
+        n = grid_per_side * grid_per_side
+        rows = np.repeat(np.arange(grid_per_side, dtype=np.int32), grid_per_side)
+        cols = np.tile(np.arange(grid_per_side, dtype=np.int32), grid_per_side)
+
+        df = pd.DataFrame({
+            "grid_row": rows,
+            "grid_col": cols,
+            "center_lat": np.round(park_info["lat"] - (grid_per_side / 2 - rows) * degree_per_100m, 6),
+            "center_lon": np.round(park_info["lon"] - (grid_per_side / 2 - cols) * degree_per_100m, 6),
+            "grid_size_m": np.full(n, grid_size_m, dtype=np.int32),
+            "elevation_m": np.round(rng.uniform(200, 1800, n), 1),
+            "slope_deg": np.round(rng.uniform(0, 60, n), 1),
+            "landcover": pd.Categorical.from_codes(
+                rng.integers(0, len(self.LANDCOVERS), n, dtype=np.int8), categories=self.LANDCOVERS
+            ),
+            "forest_density": np.round(rng.uniform(0, 1, n), 2),
+        })
+        df.attrs["crs"] = "EPSG:4326"
+
+        if with_ids:
+            prefix = f"GRID-{park_name[:2]}-"
+            df.insert(0, "grid_id", prefix + pd.Series(rows).astype(str).str.zfill(3) + "-" + pd.Series(cols).astype(str).str.zfill(3))
+            df["crs"] = "EPSG:4326"
+        return df
+
+    def generate_episode_frame(
+        self,
+        count: int = 10,
+        park_name: str = "지리산"
+    ) -> pd.DataFrame:
+        """수색 에피소드 Mock 데이터 (벡터화)"""
+        rng = self._rng("episodes")
+        park_info = self.PARKS.get(park_name, self.PARKS["지리산"])
+        now = pd.Timestamp(datetime.now())
+        base_time = now - pd.to_timedelta(rng.integers(1, 366, count), unit="D")
+        end_time = base_time + pd.to_timedelta(rng.integers(2, 49, count), unit="h")
+        last_seen_time = base_time - pd.to_timedelta(rng.integers(1, 13, count), unit="h")
+
+        return pd.DataFrame({
+            "episode_id": (
+                f"EP-{park_name[:2]}-" + pd.Series(base_time.strftime("%Y%m%d")) + "-" +
+                pd.Series(np.arange(1, count + 1)).astype(str).str.zfill(3)
+            ),
+            "episode_type": self._choice(rng, ["drill", "real"], count),
+            "agency": self._choice(rng, ["소방청", "경찰청", "산림청", "해양경찰"], count),
+            "region_code": "KR-" + pd.Series(rng.integers(11, 51, count)).astype(str).str.zfill(2),
+            "park_name": park_name,
+            "start_time": base_time.strftime("%Y-%m-%dT%H:%M:%S.%f"),
+            "end_time": end_time.strftime("%Y-%m-%dT%H:%M:%S.%f"),
+            "last_seen_time": last_seen_time.strftime("%Y-%m-%dT%H:%M:%S.%f"),
+            "last_seen_lat": np.round(park_info["lat"] + rng.normal(0, 0.02, count), 6),
+            "last_seen_lon": np.round(park_info["lon"] + rng.normal(0, 0.02, count), 6),
+            "subject_age": rng.integers(20, 71, count),
+            "subject_gender": self._choice(rng, ["M", "F"], count),
+            "accident_type": self._choice(rng, self.ACCIDENT_TYPES, count)
+        })
+
+    def generate_ground_truth_frame(self, episodes: pd.DataFrame) -> pd.DataFrame:
+        """Ground Truth Mock 데이터 (벡터화)"""
+        rng = self._rng("ground_truths")
+        n = len(episodes)
+
+        return pd.DataFrame({
+            "episode_id": episodes["episode_id"].values,
+            "gt_type": self._choice(rng, ["found_point", "found_polygon"], n),
+            "gt_lat": np.round(episodes["last_seen_lat"].values + rng.normal(0, 0.005, n), 6),
+            "gt_lon": np.round(episodes["last_seen_lon"].values + rng.normal(0, 0.005, n), 6),
+            "found_time": episodes["end_time"].values,
+            "outcome": self._choice(rng, ["found", "found", "found", "not_found"], n),  # 75% 발견
+            "gt_confidence": np.round(rng.uniform(0.7, 1.0, n), 2),
+            "search_duration_hours": rng.integers(2, 49, n)
+        })
+
+    @staticmethod
+    def frame_to_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """DataFrame → 기존 dict 리스트 형식 (numpy 스칼라 → Python 기본형)"""
+        return json.loads(df.to_json(orient="records", force_ascii=False, double_precision=15))
+
+    def generate_all_test_frames(
+        self,
+        park_name: str = "지리산",
+        grid_count: int = 400,
+        as_records: bool = False
+    ) -> Dict[str, Any]:
+        """전체 테스트 데이터 셋 벡터화 생성 (as_records=True면 기존 dict 리스트 형식)"""
+        episodes = self.generate_episode_frame(count=10, park_name=park_name)
+        frames = {
+            "base_stations": self.generate_base_stations_frame(park_name, count=50),
+            "mountain_weather": self.generate_mountain_weather_frame(count=30),
+            "danger_info": self.generate_danger_info_frame(count=40),
+            "grids": self.generate_grid_frame(park_name, grid_count=grid_count, with_ids=as_records),
+            "episodes": episodes,
+            "ground_truths": self.generate_ground_truth_frame(episodes),
+        }
+        counts = {
+            "base_stations": len(frames["base_stations"]),
+            "weather": len(frames["mountain_weather"]),
+            "danger": len(frames["danger_info"]),
+            "grids": len(frames["grids"]),
+            "episodes": len(frames["episodes"]),
+            "ground_truths": len(frames["ground_truths"])
+        }
+
+        if as_records:
+            frames = {key: self.frame_to_records(df) for key, df in frames.items()}
+
+        return {
+            **frames,
+            "metadata": {
+                "park_name": park_name,
+                "generated_at": datetime.now().isoformat(),
+                "counts": counts
+            }
+        }
+
 
 # 단독 실행 시 테스트
 if __name__ == "__main__":
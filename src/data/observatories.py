@@ -0,0 +1,348 @@
+"""
+산악기상 관측소 좌표 등록부 + H3 셀 → 최근접 관측소 배정
+- 관측소 등록부: obsid / obsname / localarea / 위경도 (CSV 또는 레코드, 없으면 Mock 공원 좌표)
+- 셀 배정: 셀 중심 기준 k개 최근접 관측소 인덱스(int32) + 역거리 가중치(float32)를 1회 계산해 보관
+  · 관측소 색인은 단위 구면 좌표 KD-tree (station_index와 동일 방식)
+  · 배정 결과는 등록부 해시/해상도/k/지수별 .npz로 캐시
+- 보간: 관측소별 값 벡터를 (셀 × k) 인덱스로 gather 후 가중치와 내적 → 셀 수백만 개도 검색 없이 계산
+  · 결측 관측소는 가중치에서 제외하고 나머지로 재정규화
+
+(data/AI_수색지역_MVP_구현계획서.md 기상 피처 - 셀 단위 기상 보간)
+"""
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import h3.api.numpy_int as h3i
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+import logging
+
+from src.data.spatial_join import CELL_DTYPE, H3_RESOLUTION, cells_to_latlng, cells_within_radius
+from src.data.station_index import to_unit_xyz, chord_to_meters
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_REGISTRY_PATH = Path(__file__).parent.parent.parent / "data" / "observatories.csv"
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent.parent / "data" / "cache" / "observatories"
+DEFAULT_K = 3
+DEFAULT_POWER = 2.0
+# 관측소와 이 거리(m) 이내인 셀은 해당 관측소 값을 그대로 사용
+SNAP_DISTANCE_M = 1.0
+
+REGISTRY_COLUMNS = ["obsid", "obsname", "localarea", "lat", "lon"]
+
+
+class ObservatoryRegistry:
+    """관측소 좌표 등록부 (obsid 순서 = 배정 인덱스)"""
+
+    def __init__(self, frame: pd.DataFrame):
+        missing = {"obsid", "lat", "lon"} - set(frame.columns)
+        if missing:
+            raise ValueError(f"관측소 등록부 컬럼 없음: {sorted(missing)}")
+        df = frame.copy()
+        df["obsid"] = df["obsid"].astype(str).str.strip()
+        df["lat"] = pd.to_numeric(df["lat"], errors="coerce")
+        df["lon"] = pd.to_numeric(df["lon"], errors="coerce")
+        df = df.dropna(subset=["lat", "lon"]).drop_duplicates("obsid", keep="last").reset_index(drop=True)
+        for column in REGISTRY_COLUMNS:
+            if column not in df.columns:
+                df[column] = None
+        self.frame = df[REGISTRY_COLUMNS]
+        self.obsids = self.frame["obsid"].to_numpy(dtype=object)
+        self._index = {obsid: i for i, obsid in enumerate(self.obsids)}
+        self.tree = cKDTree(to_unit_xyz(self.frame["lat"].to_numpy(), self.frame["lon"].to_numpy())) if len(df) else None
+
+    @classmethod
+    def from_records(cls, records: Union[pd.DataFrame, List[Dict[str, Any]]]) -> "ObservatoryRegistry":
+        return cls(records if isinstance(records, pd.DataFrame) else pd.DataFrame(records))
+
+    @classmethod
+    def from_csv(cls, path: Union[str, Path] = DEFAULT_REGISTRY_PATH) -> "ObservatoryRegistry":
+        return cls(pd.read_csv(path, dtype={"obsid": str, "localarea": str}))
+
+    @classmethod
+    def from_mock_parks(cls) -> "ObservatoryRegistry":
+        """Mock 공원 좌표 등록부 (generate_mountain_weather_frame의 OBS#### 관측소와 동일 ID)"""
+        from src.data.mock_data import MockDataGenerator
+
+        return cls(pd.DataFrame([
+            {"obsid": f"OBS{i:04d}", "obsname": park, "localarea": info["area_code"], "lat": info["lat"], "lon": info["lon"]}
+            for i, (park, info) in enumerate(MockDataGenerator.PARKS.items())
+        ]))
+
+    @classmethod
+    def load(cls, path: Union[str, Path] = DEFAULT_REGISTRY_PATH) -> "ObservatoryRegistry":
+        """등록부 CSV가 있으면 사용, 없으면 Mock 공원 좌표"""
+        if Path(path).exists():
+            return cls.from_csv(path)
+        logger.warning(f"관측소 등록부 없음 ({path}) - Mock 공원 좌표 사용")
+        return cls.from_mock_parks()
+
+    def __len__(self) -> int:
+        return len(self.obsids)
+
+    @property
+    def digest(self) -> str:
+        """좌표 포함 등록부 해시 (배정 캐시 키)"""
+        payload = self.frame[["obsid", "lat", "lon"]].to_csv(index=False).encode("utf-8")
+        return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+    def positions(self, obsids: Sequence[Any]) -> np.ndarray:
+        """obsid 배열 → 등록부 인덱스 (미등록 -1)"""
+        return np.array([self._index.get(str(obsid).strip(), -1) for obsid in obsids], dtype=np.int64)
+
+    def values(self, records: Union[pd.DataFrame, List[Dict[str, Any]]], column: str) -> np.ndarray:
+        """관측 레코드(스냅샷 등) → 등록부 순서 값 벡터 (관측 없는 관측소 NaN, 같은 관측소는 마지막 값)"""
+        df = records if isinstance(records, pd.DataFrame) else pd.DataFrame(records)
+        out = np.full(len(self), np.nan)
+        if df.empty or column not in df.columns or "obsid" not in df.columns:
+            return out
+        pos = self.positions(df["obsid"].to_numpy())
+        vals = pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+        ok = pos >= 0
+        out[pos[ok]] = vals[ok]
+        return out
+
+
+def cells_resolution(cells: np.ndarray, res: Optional[int] = None) -> int:
+    """셀 배열의 H3 해상도 (셀에서 직접 판정, res 지정 시 일치 여부 검증)"""
+    if len(cells) == 0:
+        return H3_RESOLUTION if res is None else res
+    # H3 인덱스 52~55비트 = 해상도 (h3.get_resolution과 동일, 배열 단위 판정)
+    resolutions = np.unique((cells.astype(np.int64) >> 52) & 0xF)
+    if len(resolutions) > 1:
+        raise ValueError(f"해상도가 서로 다른 셀이 섞여 있음: {resolutions.tolist()}")
+    actual = int(h3i.get_resolution(cells[0]))
+    if res is not None and res != actual:
+        raise ValueError(f"셀 해상도({actual})와 지정 해상도({res})가 다름")
+    return actual
+
+
+class ObservatoryAssignment:
+    """H3 셀 → k개 최근접 관측소 + 역거리 가중치 (셀 오름차순 정렬)"""
+
+    def __init__(self, cells: np.ndarray, neighbors: np.ndarray, weights: np.ndarray, distances: np.ndarray, res: int):
+        self.cells = cells
+        self.neighbors = neighbors
+        self.weights = weights
+        self.distances = distances
+        self.res = res
+
+    @property
+    def k(self) -> int:
+        return self.neighbors.shape[1]
+
+    @classmethod
+    def build(
+        cls,
+        registry: ObservatoryRegistry,
+        cells: Sequence[int],
+        k: int = DEFAULT_K,
+        power: float = DEFAULT_POWER,
+        res: Optional[int] = None
+    ) -> "ObservatoryAssignment":
+        """셀 배열에 대해 최근접 관측소/가중치 계산 (중복 셀 제거 후 정렬, 해상도는 셀에서 판정)"""
+        if registry.tree is None:
+            raise ValueError("관측소 등록부가 비어 있음")
+        cells = np.unique(np.asarray(cells, dtype=CELL_DTYPE))
+        cells = cells[cells != 0]
+        res = cells_resolution(cells, res)
+        k = min(k, len(registry))
+
+        lats, lons = cells_to_latlng(cells)
+        chord, neighbors = registry.tree.query(to_unit_xyz(lats, lons), k=k)
+        if k == 1:
+            chord, neighbors = chord[:, None], neighbors[:, None]
+        distances = chord_to_meters(chord)
+
+        # 역거리 가중치 (관측소와 겹치는 셀은 해당 관측소만 사용)
+        weights = 1.0 / np.maximum(distances, SNAP_DISTANCE_M) ** power
+        snapped = distances[:, 0] <= SNAP_DISTANCE_M
+        weights[snapped] = 0.0
+        weights[snapped, 0] = 1.0
+        weights /= weights.sum(axis=1, keepdims=True)
+
+        return cls(
+            cells,
+            neighbors.astype(np.int32),
+            weights.astype(np.float32),
+            distances.astype(np.float32),
+            res
+        )
+
+    @classmethod
+    def cached(
+        cls,
+        registry: ObservatoryRegistry,
+        cells: Sequence[int],
+        k: int = DEFAULT_K,
+        power: float = DEFAULT_POWER,
+        res: Optional[int] = None,
+        cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR
+    ) -> "ObservatoryAssignment":
+        """배정 결과 .npz 캐시 (등록부 + 셀 집합 + k + 지수 기준)"""
+        cells = np.unique(np.asarray(cells, dtype=CELL_DTYPE))
+        cells = cells[cells != 0]
+        res = cells_resolution(cells, res)
+        cell_digest = hashlib.blake2b(cells.tobytes(), digest_size=8).hexdigest()
+        path = Path(cache_dir) / f"assign_{registry.digest}_{cell_digest}_r{res}_k{k}_p{power:g}.npz"
+        if path.exists():
+            return cls.load(path)
+        assignment = cls.build(registry, cells, k=k, power=power, res=res)
+        assignment.save(path)
+        return assignment
+
+    @classmethod
+    def for_area(
+        cls,
+        registry: ObservatoryRegistry,
+        lat: float,
+        lon: float,
+        radius_m: float,
+        res: int = H3_RESOLUTION,
+        k: int = DEFAULT_K,
+        power: float = DEFAULT_POWER
+    ) -> "ObservatoryAssignment":
+        """중심 좌표 반경 내 해상도 res 셀 전체 배정 (캐시 사용)"""
+        cells = cells_within_radius([lat], [lon], radius_m, res)
+        return cls.cached(registry, cells, k=k, power=power, res=res)
+
+    def save(self, path: Union[str, Path]):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.stem + ".tmp.npz")
+        np.savez(tmp, cells=self.cells, neighbors=self.neighbors, weights=self.weights, distances=self.distances, res=self.res)
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ObservatoryAssignment":
+        with np.load(path) as data:
+            return cls(data["cells"], data["neighbors"], data["weights"], data["distances"], int(data["res"]))
+
+    def rows(self, cells: Sequence[int]) -> np.ndarray:
+        """셀 배열 → 배정 행 인덱스 (미배정 셀 -1)"""
+        cells = np.asarray(cells, dtype=CELL_DTYPE)
+        if not len(self.cells):
+            return np.full(len(cells), -1)
+        idx = np.minimum(np.searchsorted(self.cells, cells), len(self.cells) - 1)
+        return np.where(self.cells[idx] == cells, idx, -1)
+
+    def interpolate(self, values: np.ndarray, cells: Optional[Sequence[int]] = None) -> np.ndarray:
+        """관측소 값 벡터 → 셀별 역거리 가중 보간값 (gather + 내적, 결측 관측소 제외 후 재정규화)
+
+        values: 등록부 순서 (n_obs,) 또는 (n_obs, m) - 여러 변수 동시 보간
+        cells: 지정 시 해당 셀 순서로 반환 (미배정 셀 NaN), 미지정 시 self.cells 순서
+        """
+        values = np.asarray(values, dtype=np.float32)
+        neighbors, weights = self.neighbors, self.weights
+        missing_rows = None
+        if cells is not None:
+            rows = self.rows(cells)
+            missing_rows = rows < 0
+            neighbors, weights = neighbors[np.maximum(rows, 0)], weights[np.maximum(rows, 0)]
+
+        gathered = values[neighbors]  # (n, k) 또는 (n, k, m)
+        if values.ndim == 2:
+            weights = weights[:, :, None]
+        valid = np.isfinite(gathered)
+        numerator = (np.where(valid, gathered, 0) * weights).sum(axis=1)
+        denominator = (valid * weights).sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result = numerator / denominator
+        if missing_rows is not None:
+            result[missing_rows] = np.nan
+        return result
+
+    def nearest(self) -> np.ndarray:
+        """셀별 최근접 관측소 인덱스"""
+        return self.neighbors[:, 0]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "cells": int(len(self.cells)),
+            "k": self.k,
+            "res": self.res,
+            "median_nearest_m": float(np.median(self.distances[:, 0])) if len(self.cells) else None,
+            "bytes": int(self.cells.nbytes + self.neighbors.nbytes + self.weights.nbytes + self.distances.nbytes)
+        }
+
+
+def interpolate_weather(
+    assignment: ObservatoryAssignment,
+    registry: ObservatoryRegistry,
+    records: Union[pd.DataFrame, List[Dict[str, Any]]],
+    columns: Sequence[str] = ("rn", "hm2m"),
+    cells: Optional[Sequence[int]] = None
+) -> pd.DataFrame:
+    """관측 레코드(스냅샷) → 셀별 보간 기상값 DataFrame (cell + 컬럼)"""
+    values = np.column_stack([registry.values(records, column) for column in columns])
+    interpolated = assignment.interpolate(values, cells)
+    out = pd.DataFrame(interpolated, columns=list(columns))
+    out.insert(0, "cell", assignment.cells if cells is None else np.asarray(cells, dtype=CELL_DTYPE))
+    return out
+
+
+def weather_cell_features(
+    assignment: ObservatoryAssignment,
+    registry: ObservatoryRegistry,
+    records: Union[pd.DataFrame, List[Dict[str, Any]]],
+    cells: Optional[Sequence[int]] = None
+) -> pd.DataFrame:
+    """관측 레코드 → 셀별 기상 피처 (cell, precipitation_mm, humidity_2m, weather_risk_score)"""
+    from src.data.weather_history import weather_risk_score
+
+    observed = interpolate_weather(assignment, registry, records, columns=("rn", "hm2m"), cells=cells)
+    return pd.DataFrame({
+        "cell": observed["cell"],
+        "precipitation_mm": observed["rn"].to_numpy(dtype=np.float32),
+        "humidity_2m": observed["hm2m"].to_numpy(dtype=np.float32),
+        "weather_risk_score": weather_risk_score(observed["rn"].to_numpy(), observed["hm2m"].to_numpy())
+    })
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+    # 전국 관측소 ~400곳 (무작위 좌표) × 지리산 주변 res 8 셀
+    rng = np.random.default_rng(42)
+    registry = ObservatoryRegistry.from_records(pd.DataFrame({
+        "obsid": [f"{i:04d}" for i in range(400)],
+        "lat": rng.uniform(33.2, 38.5, 400),
+        "lon": rng.uniform(126.1, 129.5, 400)
+    }))
+    center = h3i.latlng_to_cell(35.3373, 127.7307, 8)
+    cells = np.asarray(h3i.grid_disk(center, 500), dtype=CELL_DTYPE)  # ≈ 750k셀
+
+    started = time.perf_counter()
+    assignment = ObservatoryAssignment.build(registry, cells, k=4)
+    print(f"배정 {len(assignment.cells):,}셀 × k=4: {(time.perf_counter() - started) * 1000:.0f} ms, {assignment.stats()}")
+
+    snapshot = pd.DataFrame({
+        "obsid": registry.obsids,
+        "rn": np.round(rng.uniform(0, 20, len(registry)), 1),
+        "hm2m": np.round(rng.uniform(45, 98, len(registry)), 1)
+    })
+    snapshot.loc[::7, "rn"] = np.nan  # 일부 관측소 결측
+
+    interpolate_weather(assignment, registry, snapshot)
+    rounds = 10
+    started = time.perf_counter()
+    for _ in range(rounds):
+        result = interpolate_weather(assignment, registry, snapshot)
+    print(f"보간 {len(result):,}셀 × 2변수: {(time.perf_counter() - started) / rounds * 1000:.1f} ms")
+    print(result.describe().T)
+
+    # 셀별 직접 계산 검증 (일부)
+    values = registry.values(snapshot, "rn")
+    for row in rng.integers(0, len(assignment.cells), 200):
+        nbr, w = assignment.neighbors[row], assignment.weights[row].astype(np.float64)
+        ok = np.isfinite(values[nbr])
+        expected = (values[nbr][ok] * w[ok]).sum() / w[ok].sum() if ok.any() else np.nan
+        assert np.isclose(expected, result["rn"].iloc[row], rtol=1e-4, equal_nan=True)
+    print("직접 계산 일치")
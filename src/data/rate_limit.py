@@ -0,0 +1,57 @@
+"""
+비동기 토큰 버킷 호출 제한기
+- 초당 요청 수(rate) 유지, 버스트 크기(capacity) 제한
+- 업스트림 제한(429/503) 감지 시 속도 감소, 정상 응답 시 점진 복구 (AIMD)
+"""
+import asyncio
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """초당 rate개 토큰을 채우는 비동기 토큰 버킷"""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        min_rate: Optional[float] = None
+    ):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다")
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min_rate if min_rate is not None else max(rate / 16, 0.1)
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self.throttled = 0
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        """토큰 1개 획득 (부족하면 대기, 대기자는 도착 순서대로 처리)"""
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def backoff(self, factor: float = 0.5):
+        """제한 응답 수신 시 속도 감소 + 남은 버스트 토큰 제거"""
+        self.throttled += 1
+        self._refill()
+        self.rate = max(self.min_rate, self.rate * factor)
+        self._tokens = min(self._tokens, 0.0)
+
+    def recover(self, step: Optional[float] = None):
+        """정상 응답 시 목표 속도까지 점진 복구"""
+        if self.rate < self.max_rate:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + (step or self.max_rate * 0.05))
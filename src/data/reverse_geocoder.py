@@ -0,0 +1,166 @@
+"""
+오프라인 역지오코딩 (좌표 → 행정구역)
+- 시도/시군구/읍면동 경계 폴리곤을 STRtree(R-tree)로 1회 색인
+- 좌표 배열 단위 point-in-polygon 일괄 조회 (shapely 2 벡터화)
+- SGISClient.reverse_geocode와 동일한 응답 형태 제공
+
+경계 파일: 통계청 SGIS / 국가공간정보 행정구역 Shapefile
+(docs/data_preprocessing_analysis.md 전략 B)
+"""
+import numpy as np
+import shapely
+from shapely.strtree import STRtree
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Sequence, Tuple, Union
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_SHAPEFILE_DIR = Path(__file__).parent.parent.parent / "data" / "shapefiles"
+
+# 레벨별 (파일명 후보, 코드 컬럼 후보, 이름 컬럼 후보)
+# - 국가공간정보: ctprvn.shp / sig.shp / emd.shp
+# - SGIS 경계: bnd_sido_*.shp / bnd_sigungu_*.shp / bnd_dong_*.shp
+LEVELS = {
+    "sido": (("ctprvn.shp", "bnd_sido_*.shp"), ("CTPRVN_CD", "SIDO_CD"), ("CTP_KOR_NM", "SIDO_NM")),
+    "sgg": (("sig.shp", "bnd_sigungu_*.shp"), ("SIG_CD", "SIGUNGU_CD"), ("SIG_KOR_NM", "SIGUNGU_NM")),
+    "emdong": (("emd.shp", "bnd_dong_*.shp"), ("EMD_CD", "ADM_CD"), ("EMD_KOR_NM", "ADM_NM")),
+}
+
+
+class BoundaryLayer:
+    """단일 행정구역 레벨 (코드/이름 배열 + STRtree)"""
+
+    def __init__(self, level: str, geometries: Sequence, codes: Sequence, names: Sequence):
+        self.level = level
+        self.geometries = np.asarray(geometries, dtype=object)
+        self.codes = np.asarray(codes, dtype=object)
+        self.names = np.asarray(names, dtype=object)
+        self.tree = STRtree(self.geometries)
+        # 반복 조회 시 predicate 평가 가속
+        shapely.prepare(self.geometries)
+
+    def query(self, points: np.ndarray) -> np.ndarray:
+        """포인트 배열 → 포함 폴리곤 인덱스 배열 (미포함 -1, 경계 중복 시 첫 번째)"""
+        matched = np.full(len(points), -1, dtype=np.int64)
+        if len(points) == 0:
+            return matched
+
+        point_idx, poly_idx = self.tree.query(points, predicate="intersects")
+        if len(point_idx):
+            first_point, first_pos = np.unique(point_idx, return_index=True)
+            matched[first_point] = poly_idx[first_pos]
+        return matched
+
+    def __len__(self) -> int:
+        return len(self.geometries)
+
+
+class AdminBoundaryIndex:
+    """시도/시군구/읍면동 경계 공간 색인"""
+
+    def __init__(self, layers: Dict[str, BoundaryLayer]):
+        self.layers = layers
+
+    @classmethod
+    def from_shapefiles(
+        cls,
+        directory: Union[str, Path] = DEFAULT_SHAPEFILE_DIR,
+        levels: Sequence[str] = ("sido", "sgg", "emdong")
+    ) -> "AdminBoundaryIndex":
+        """Shapefile 디렉토리에서 경계 로드 (EPSG:4326으로 변환)"""
+        import geopandas as gpd
+
+        directory = Path(directory)
+        layers = {}
+
+        for level in levels:
+            patterns, code_cols, name_cols = LEVELS[level]
+            files = [f for pattern in patterns for f in sorted(directory.glob(pattern))]
+            if not files:
+                logger.warning(f"{level} 경계 파일 없음: {directory} ({', '.join(patterns)})")
+                continue
+
+            gdf = gpd.read_file(files[-1])
+            if gdf.crs is not None and gdf.crs.to_epsg() != 4326:
+                gdf = gdf.to_crs(epsg=4326)
+
+            code_col = next((c for c in code_cols if c in gdf.columns), None)
+            name_col = next((c for c in name_cols if c in gdf.columns), None)
+            if name_col is None:
+                raise ValueError(f"{files[-1]}: 이름 컬럼 없음 ({', '.join(name_cols)})")
+
+            codes = gdf[code_col].astype(str).values if code_col else [None] * len(gdf)
+            layers[level] = BoundaryLayer(level, gdf.geometry.values, codes, gdf[name_col].values)
+            logger.info(f"{level} 경계 색인 완료: {files[-1].name} ({len(gdf)}개 폴리곤)")
+
+        return cls(layers)
+
+    def lookup(
+        self,
+        lons: Sequence[float],
+        lats: Sequence[float]
+    ) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """좌표 배열 일괄 조회 → {레벨: (코드 배열, 이름 배열)}, 미포함은 None"""
+        points = shapely.points(np.asarray(lons, dtype=float), np.asarray(lats, dtype=float))
+        result = {}
+
+        for level, layer in self.layers.items():
+            matched = layer.query(points)
+            found = matched >= 0
+            codes = np.full(len(points), None, dtype=object)
+            names = np.full(len(points), None, dtype=object)
+            codes[found] = layer.codes[matched[found]]
+            names[found] = layer.names[matched[found]]
+            result[level] = (codes, names)
+
+        return result
+
+    def assign(self, lons: Sequence[float], lats: Sequence[float]):
+        """좌표 배열 → 행정구역 DataFrame (sido_cd, sido_nm, sgg_cd, ...)"""
+        import pandas as pd
+
+        columns = {}
+        for level, (codes, names) in self.lookup(lons, lats).items():
+            columns[f"{level}_cd"] = codes
+            columns[f"{level}_nm"] = names
+        return pd.DataFrame(columns)
+
+    def reverse_geocode_many(
+        self,
+        xs: Sequence[float],
+        ys: Sequence[float]
+    ) -> List[Dict[str, Any]]:
+        """좌표 배열 → SGISClient.reverse_geocode 형태 결과 리스트"""
+        looked_up = self.lookup(xs, ys)
+        results = []
+
+        for i in range(len(xs)):
+            data = {}
+            for level, (codes, names) in looked_up.items():
+                data[f"{level}_cd"] = codes[i]
+                data[f"{level}_nm"] = names[i]
+
+            parts = [data.get(f"{level}_nm") for level in ("sido", "sgg", "emdong")]
+            if not any(parts):
+                results.append({"success": False, "error": "행정구역 경계 밖 좌표"})
+                continue
+
+            data["full_addr"] = " ".join(p for p in parts if p)
+            results.append({"success": True, "data": data})
+
+        return results
+
+    def reverse_geocode(self, x: float, y: float) -> Dict[str, Any]:
+        """단일 좌표 → SGISClient.reverse_geocode 형태 결과"""
+        return self.reverse_geocode_many([x], [y])[0]
+
+
+def load_boundary_index(directory: Union[str, Path] = DEFAULT_SHAPEFILE_DIR) -> Optional[AdminBoundaryIndex]:
+    """경계 파일이 있으면 색인 생성, 없으면 None (네트워크 역지오코딩 사용)"""
+    directory = Path(directory)
+    if not directory.exists():
+        return None
+    index = AdminBoundaryIndex.from_shapefiles(directory)
+    return index if index.layers else None
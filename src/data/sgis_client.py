@@ -5,10 +5,18 @@ SGIS (통계지리정보서비스) 지오코딩 API 클라이언트
 """
 import httpx
 import asyncio
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, TYPE_CHECKING
 from dataclasses import dataclass
 import logging
 import time
+from contextlib import asynccontextmanager
+
+from src.data.http_pool import HTTPClientPool
+from src.data.rate_limit import TokenBucket
+
+if TYPE_CHECKING:
+    from src.data.geocode_cache import GeocodeCache
+    from src.data.reverse_geocoder import AdminBoundaryIndex
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -27,6 +35,18 @@ class GeocodingResult:
     matching: Optional[int] = None  # 0=완전매칭, 1=불완전매칭
     success: bool = False
     error: Optional[str] = None
+    error_transient: bool = False  # 네트워크 등 일시 오류 (캐시 제외)
+
+
+THROTTLE_MARKERS = ("429", "503", "Too Many Requests")
+AUTH_ERROR_CODES = (-401,)  # 인증 정보 없음/만료
+TOKEN_EXPIRY_MARGIN = 300  # 만료 5분 전부터 무효 처리
+TOKEN_REFRESH_AHEAD = 30 * 60  # 만료 30분 전부터 백그라운드 갱신
+
+
+def _is_throttled(result: GeocodingResult) -> bool:
+    """업스트림 호출 제한 응답 여부"""
+    return bool(result.error_transient and result.error and any(m in result.error for m in THROTTLE_MARKERS))
 
 
 class SGISClient:
@@ -34,27 +54,67 @@ class SGISClient:
 
     BASE_URL = "https://sgisapi.mods.go.kr/OpenAPI3"
 
-    def __init__(self, consumer_key: str, consumer_secret: str):
+    def __init__(
+        self,
+        consumer_key: str,
+        consumer_secret: str,
+        http_pool: Optional[HTTPClientPool] = None,
+        geocode_cache: Optional["GeocodeCache"] = None,
+        boundary_index: Optional["AdminBoundaryIndex"] = None
+    ):
         self.consumer_key = consumer_key
         self.consumer_secret = consumer_secret
         self._access_token: Optional[str] = None
         self._token_expires: float = 0
         self.timeout = 30.0
+        self.http_pool = http_pool
+        self.geocode_cache = geocode_cache
+        self.boundary_index = boundary_index
+        self._token_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.token_refreshes = 0
+
+    @asynccontextmanager
+    async def _client(self, url: str):
+        """공용 풀이 있으면 공유 클라이언트, 없으면 1회용 클라이언트"""
+        if self.http_pool is not None:
+            yield self.http_pool.get(url)
+        else:
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                yield client
 
-    async def _get_access_token(self) -> str:
-        """액세스 토큰 발급 (4시간 유효)"""
+    def _token_valid(self, margin: float = TOKEN_EXPIRY_MARGIN) -> bool:
+        return bool(self._access_token) and time.time() < self._token_expires - margin
+
+    async def _get_access_token(self, stale_token: Optional[str] = None) -> str:
+        """액세스 토큰 발급 (4시간 유효)
+
+        - 발급은 단일 잠금으로 직렬화하여 동시 호출 시 인증 API를 한 번만 호출
+        - 만료 임박(TOKEN_REFRESH_AHEAD 이내) 시 현재 토큰을 반환하고 백그라운드에서 갱신
+        - stale_token: 인증 오류를 받은 토큰 (해당 토큰이면 유효기간과 무관하게 재발급)
+        """
         # 토큰이 유효하면 재사용
-        if self._access_token and time.time() < self._token_expires - 300:  # 5분 여유
+        if stale_token is None and self._token_valid():
+            if not self._token_valid(TOKEN_REFRESH_AHEAD):
+                self._schedule_token_refresh()
             return self._access_token
 
+        async with self._token_lock:
+            # 잠금 대기 중 다른 코루틴이 이미 갱신했으면 그 토큰 사용
+            if self._token_valid() and (stale_token is None or self._access_token != stale_token):
+                return self._access_token
+            return await self._issue_access_token()
+
+    async def _issue_access_token(self) -> str:
+        """인증 API 호출 (호출 측에서 _token_lock 보유)"""
         url = f"{self.BASE_URL}/auth/authentication.json"
         params = {
             "consumer_key": self.consumer_key,
             "consumer_secret": self.consumer_secret
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(url, params=params)
+        async with self._client(url) as client:
+            response = await client.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
             result = response.json()
 
@@ -62,63 +122,109 @@ class SGISClient:
                 self._access_token = result["result"]["accessToken"]
                 # 4시간 유효
                 self._token_expires = time.time() + (4 * 60 * 60)
+                self.token_refreshes += 1
                 logger.info("SGIS 액세스 토큰 발급 완료")
                 return self._access_token
             else:
                 raise Exception(f"SGIS 인증 실패: {result.get('errMsg')}")
 
+    def _schedule_token_refresh(self):
+        """만료 전 백그라운드 갱신 (동시에 하나만 실행)"""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+
+        async def _refresh():
+            try:
+                async with self._token_lock:
+                    if not self._token_valid(TOKEN_REFRESH_AHEAD):
+                        await self._issue_access_token()
+            except Exception as e:
+                # 기존 토큰이 아직 유효하므로 다음 호출에서 다시 시도
+                logger.warning(f"SGIS 토큰 사전 갱신 실패: {e}")
+
+        self._refresh_task = asyncio.get_running_loop().create_task(_refresh())
+
+    async def _authed_get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """토큰 포함 GET 요청 - 인증 오류 코드 수신 시 토큰 재발급 후 1회 재시도"""
+        url = f"{self.BASE_URL}{path}"
+        token = await self._get_access_token()
+
+        for attempt in range(2):
+            async with self._client(url) as client:
+                response = await client.get(
+                    url, params={**params, "accessToken": token}, timeout=self.timeout
+                )
+                response.raise_for_status()
+                result = response.json()
+
+            if result.get("errCd") not in AUTH_ERROR_CODES or attempt == 1:
+                return result
+
+            logger.info(f"SGIS 인증 오류 ({result.get('errCd')}) - 토큰 재발급 후 재시도")
+            token = await self._get_access_token(stale_token=token)
+
+        return result
+
     async def geocode(self, address: str) -> GeocodingResult:
-        """주소 → 좌표 변환 (WGS84)"""
-        try:
-            token = await self._get_access_token()
+        """주소 → 좌표 변환 (WGS84), 캐시가 있으면 캐시 우선"""
+        if self.geocode_cache is not None:
+            cached = self.geocode_cache.get(address)
+            if cached is not None:
+                return cached
+
+        result = await self._geocode_remote(address)
 
-            url = f"{self.BASE_URL}/addr/geocodewgs84.json"
+        # 네트워크/인증 예외(일시 오류)는 캐시하지 않고, API 응답 결과만 기록
+        if self.geocode_cache is not None and not result.error_transient:
+            self.geocode_cache.put(result)
+        return result
+
+    async def _geocode_remote(self, address: str) -> GeocodingResult:
+        """SGIS 지오코딩 API 호출"""
+        try:
             params = {
-                "accessToken": token,
                 "address": address,
                 "resultcount": 1
             }
+            result = await self._authed_get("/addr/geocodewgs84.json", params)
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                result = response.json()
+            if result.get("errCd") == 0 and result.get("result"):
+                data = result["result"]
 
-                if result.get("errCd") == 0 and result.get("result"):
-                    data = result["result"]
-
-                    if data.get("resultdata"):
-                        item = data["resultdata"][0]
-                        return GeocodingResult(
-                            address=address,
-                            x=float(item.get("x", 0)),  # 경도
-                            y=float(item.get("y", 0)),  # 위도
-                            sido_nm=item.get("sido_nm"),
-                            sgg_nm=item.get("sgg_nm"),
-                            emdong_nm=item.get("emdong_nm"),
-                            full_addr=item.get("full_addr"),
-                            matching=data.get("matching"),
-                            success=True
-                        )
-                    else:
-                        return GeocodingResult(
-                            address=address,
-                            success=False,
-                            error="결과 없음"
-                        )
+                if data.get("resultdata"):
+                    item = data["resultdata"][0]
+                    return GeocodingResult(
+                        address=address,
+                        x=float(item.get("x", 0)),  # 경도
+                        y=float(item.get("y", 0)),  # 위도
+                        sido_nm=item.get("sido_nm"),
+                        sgg_nm=item.get("sgg_nm"),
+                        emdong_nm=item.get("emdong_nm"),
+                        full_addr=item.get("full_addr"),
+                        matching=data.get("matching"),
+                        success=True
+                    )
                 else:
                     return GeocodingResult(
                         address=address,
                         success=False,
-                        error=result.get("errMsg", "알 수 없는 오류")
+                        error="결과 없음"
                     )
+            else:
+                return GeocodingResult(
+                    address=address,
+                    success=False,
+                    error=result.get("errMsg", "알 수 없는 오류"),
+                    error_transient=result.get("errCd") in AUTH_ERROR_CODES
+                )
 
         except Exception as e:
             logger.error(f"지오코딩 오류 ({address}): {e}")
             return GeocodingResult(
                 address=address,
                 success=False,
-                error=str(e)
+                error=str(e),
+                error_transient=True
             )
 
     async def reverse_geocode(
@@ -127,33 +233,65 @@ class SGISClient:
         y: float,
         addr_type: int = 20  # 20=행정동
     ) -> Dict[str, Any]:
-        """좌표 → 주소 변환 (WGS84)"""
-        try:
-            token = await self._get_access_token()
+        """좌표 → 주소 변환 (WGS84), 경계 색인이 있으면 로컬 조회 우선"""
+        if self.boundary_index is not None:
+            local = self.boundary_index.reverse_geocode(x, y)
+            if local["success"]:
+                return local
 
-            url = f"{self.BASE_URL}/addr/rgeocodewgs84.json"
+        return await self._reverse_geocode_remote(x, y, addr_type)
+
+    async def batch_reverse_geocode(
+        self,
+        coords: List[Tuple[float, float]],
+        addr_type: int = 20,
+        concurrency: int = 4
+    ) -> List[Dict[str, Any]]:
+        """좌표 목록 일괄 역지오코딩 - 로컬 색인으로 일괄 처리 후 미매칭 좌표만 네트워크 조회"""
+        if self.boundary_index is not None and coords:
+            xs, ys = zip(*coords)
+            results = self.boundary_index.reverse_geocode_many(xs, ys)
+        else:
+            results = [{"success": False} for _ in coords]
+
+        misses = [i for i, r in enumerate(results) if not r["success"]]
+        if misses:
+            semaphore = asyncio.Semaphore(max(1, concurrency))
+
+            async def _remote(i: int):
+                async with semaphore:
+                    x, y = coords[i]
+                    results[i] = await self._reverse_geocode_remote(x, y, addr_type)
+
+            await asyncio.gather(*(_remote(i) for i in misses))
+
+        return results
+
+    async def _reverse_geocode_remote(
+        self,
+        x: float,
+        y: float,
+        addr_type: int = 20
+    ) -> Dict[str, Any]:
+        """SGIS 역지오코딩 API 호출"""
+        try:
             params = {
-                "accessToken": token,
                 "x_coor": x,
                 "y_coor": y,
                 "addr_type": addr_type
             }
+            result = await self._authed_get("/addr/rgeocodewgs84.json", params)
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                result = response.json()
-
-                if result.get("errCd") == 0 and result.get("result"):
-                    return {
-                        "success": True,
-                        "data": result["result"][0] if result["result"] else {}
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "error": result.get("errMsg", "알 수 없는 오류")
-                    }
+            if result.get("errCd") == 0 and result.get("result"):
+                return {
+                    "success": True,
+                    "data": result["result"][0] if result["result"] else {}
+                }
+            else:
+                return {
+                    "success": False,
+                    "error": result.get("errMsg", "알 수 없는 오류")
+                }
 
         except Exception as e:
             logger.error(f"리버스 지오코딩 오류 ({x}, {y}): {e}")
@@ -163,50 +301,130 @@ class SGISClient:
         self,
         addresses: List[str],
         delay: float = 0.1,  # API 호출 간격 (초)
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[callable] = None,
+        rate_per_second: Optional[float] = None,
+        concurrency: int = 1,
+        max_retries: int = 3
     ) -> List[GeocodingResult]:
-        """주소 목록 일괄 지오코딩"""
+        """주소 목록 일괄 지오코딩
+
+        - rate_per_second 지정 시 토큰 버킷 기반 동시 처리 (최대 concurrency개 동시 요청)
+        - 결과는 입력 순서, progress_callback(current, total, addr, success)은 완료 순서로 호출
+        """
+        cached = self.geocode_cache.get_many(addresses) if self.geocode_cache is not None else {}
+
+        if rate_per_second:
+            return await self._batch_geocode_concurrent(
+                addresses, cached, rate_per_second, concurrency, max_retries, progress_callback
+            )
+
         results = []
         total = len(addresses)
 
         for i, addr in enumerate(addresses):
-            result = await self.geocode(addr)
+            result = cached.get(addr)
+            from_cache = result is not None
+            if not from_cache:
+                result = await self.geocode(addr)
             results.append(result)
 
             if progress_callback:
                 progress_callback(i + 1, total, addr, result.success)
 
-            # API 호출 제한 방지
-            if i < total - 1:
+            # API 호출 제한 방지 (캐시 히트는 대기 없음)
+            if not from_cache and i < total - 1:
                 await asyncio.sleep(delay)
 
         return results
 
+    async def _batch_geocode_concurrent(
+        self,
+        addresses: List[str],
+        cached: Dict[str, GeocodingResult],
+        rate_per_second: float,
+        concurrency: int,
+        max_retries: int,
+        progress_callback: Optional[callable]
+    ) -> List[GeocodingResult]:
+        """토큰 버킷 속도 제한 + 동시 요청 수 제한 일괄 지오코딩"""
+        total = len(addresses)
+        results: List[Optional[GeocodingResult]] = [None] * total
+        limiter = TokenBucket(rate_per_second)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        completed = 0
+
+        async def _geocode_with_backoff(addr: str) -> GeocodingResult:
+            async with semaphore:
+                for attempt in range(max_retries + 1):
+                    await limiter.acquire()
+                    result = await self.geocode(addr)
+                    if not _is_throttled(result):
+                        limiter.recover()
+                        return result
+                    # 호출 제한 응답: 속도 감소 후 재시도
+                    limiter.backoff()
+                    logger.warning(f"SGIS 호출 제한 감지 - 속도 {limiter.rate:.1f}/s로 감소 ({addr})")
+                    await asyncio.sleep(min(2 ** attempt, 10))
+                return result
+
+        async def _worker(i: int, addr: str):
+            nonlocal completed
+            result = cached.get(addr)
+            if result is None:
+                result = await _geocode_with_backoff(addr)
+            results[i] = result
+            completed += 1
+            if progress_callback:
+                progress_callback(completed, total, addr, result.success)
+
+        await asyncio.gather(*(_worker(i, addr) for i, addr in enumerate(addresses)))
+
+        if limiter.throttled:
+            logger.info(f"SGIS 호출 제한 {limiter.throttled}회 발생, 최종 속도 {limiter.rate:.1f}/s")
+        return results
+
 
 async def geocode_accident_data(
     consumer_key: str,
     consumer_secret: str,
     input_file: str,
-    output_file: str
+    output_file: str,
+    cache_path: Optional[str] = None,
+    mapping_file: Optional[str] = None,
+    rate_per_second: float = 10.0,
+    concurrency: int = 8
 ) -> Dict[str, Any]:
-    """소방청 사고 데이터 지오코딩 및 Excel 저장"""
+    """소방청 사고 데이터 지오코딩 및 Excel 저장
+
+    - cache_path: 지오코딩 캐시 경로 (기본: data/cache/geocode.sqlite)
+    - mapping_file: 캐시가 비어 있을 때 임포트할 주소_좌표_매핑 Excel
+      (미지정 시 data/generated/주소_좌표_매핑_통합_*.xlsx 중 최신 파일)
+    - rate_per_second, concurrency: SGIS 호출 속도/동시 요청 수
+    """
     import pandas as pd
+    from src.data.geocode_cache import GeocodeCache, DEFAULT_CACHE_PATH
+    from src.data.accident_loader import load_accidents
+
+    geocode_cache = GeocodeCache(cache_path or DEFAULT_CACHE_PATH)
+    if len(geocode_cache) == 0:
+        if mapping_file is None:
+            candidates = sorted(
+                (DEFAULT_CACHE_PATH.parent.parent / "generated").glob("주소_좌표_매핑_통합_*.xlsx")
+            )
+            mapping_file = str(candidates[-1]) if candidates else None
+        if mapping_file:
+            geocode_cache.import_excel(mapping_file)
 
-    # 클라이언트 초기화
-    client = SGISClient(consumer_key, consumer_secret)
+    # 클라이언트 초기화 (일괄 처리 동안 커넥션 재사용)
+    http_pool = HTTPClientPool()
+    client = SGISClient(consumer_key, consumer_secret, http_pool=http_pool, geocode_cache=geocode_cache)
 
-    # 데이터 로드
+    # 데이터 로드 (정제 + full_addr 생성, Parquet 캐시)
     logger.info(f"데이터 로딩: {input_file}")
-    df = pd.read_excel(input_file)
+    df = load_accidents(input_file)
 
     # 고유 주소 추출
-    df['full_addr'] = (
-        df['발생장소_시'].fillna('') + ' ' +
-        df['발생장소_구'].fillna('') + ' ' +
-        df['발생장소_동'].fillna('')
-    ).str.strip()
-
-    unique_addresses = df['full_addr'].unique().tolist()
+    unique_addresses = [addr for addr in df['full_addr'].cat.categories if addr]
     logger.info(f"고유 주소 수: {len(unique_addresses)}")
 
     # 진행 상황 출력
@@ -217,11 +435,17 @@ async def geocode_accident_data(
 
     # 일괄 지오코딩
     logger.info("지오코딩 시작...")
-    results = await client.batch_geocode(
-        unique_addresses,
-        delay=0.1,
-        progress_callback=progress
-    )
+    try:
+        results = await client.batch_geocode(
+            unique_addresses,
+            progress_callback=progress,
+            rate_per_second=rate_per_second,
+            concurrency=concurrency
+        )
+    finally:
+        await http_pool.aclose()
+        logger.info(f"지오코딩 캐시: {geocode_cache.stats()}")
+        geocode_cache.close()
 
     # 결과를 DataFrame으로 변환
     geocode_df = pd.DataFrame([
@@ -241,7 +465,7 @@ async def geocode_accident_data(
     ])
 
     # 원본 데이터와 조인
-    df_merged = df.merge(
+    df_merged = df.assign(full_addr=df['full_addr'].astype(object)).merge(
         geocode_df,
         left_on='full_addr',
         right_on='original_addr',
@@ -0,0 +1,328 @@
+"""
+H3 셀 할당 및 공간 조인
+- 좌표 배열 → H3 정수 셀 ID (uint64) 일괄 할당, 여러 해상도 동시 지원
+  · 중복 좌표를 제거해 h3 호출은 고유 좌표 수만큼만 발생
+  · hierarchical=True면 최고 해상도만 계산하고 상위 셀은 비트 연산으로 도출 (부모-자식 일관)
+- 셀 / k-ring 이웃 기준 조인 (hex 문자열 대신 정수 ID로 merge)
+- 클라이언트 출력(기지국/위험지역/Mock 그리드)과 사고 데이터의 좌표 컬럼 자동 인식
+
+(data/AI_수색지역_MVP_구현계획서.md 3.2 ~ 3.3)
+"""
+import hashlib
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import h3.api.numpy_int as h3i
+import numpy as np
+import pandas as pd
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+H3_RESOLUTION = 8
+CELL_DTYPE = np.uint64
+
+# (위도, 경도) 컬럼 후보 - 사고 데이터, 전파누리, 위험지역, Mock 그리드/에피소드 순
+COORD_COLUMNS = [
+    ("lat", "lon"),
+    ("LAT", "LON"),
+    ("lat", "lot"),
+    ("center_lat", "center_lon"),
+    ("last_seen_lat", "last_seen_lon"),
+    ("gt_lat", "gt_lon"),
+]
+
+# H3 인덱스 비트 배치: 해상도 52~55비트, 해상도 r 자리(digit)는 (15 - r) * 3 비트부터 3비트
+_RES_SHIFT = 52
+_RES_MASK = np.uint64(0xF << _RES_SHIFT)
+
+
+def cell_column(res: int, prefix: str = "h3_") -> str:
+    return f"{prefix}{res}"
+
+
+def find_coord_columns(df: pd.DataFrame) -> Tuple[str, str]:
+    """DataFrame의 (위도, 경도) 컬럼명 탐지"""
+    for lat_col, lon_col in COORD_COLUMNS:
+        if lat_col in df.columns and lon_col in df.columns:
+            return lat_col, lon_col
+    raise ValueError(f"좌표 컬럼 없음: {list(df.columns)}")
+
+
+def cells_to_parent(cells: np.ndarray, res: int) -> np.ndarray:
+    """셀 배열 → 상위 해상도 셀 배열 (비트 연산, 0은 0 유지)"""
+    cells = np.asarray(cells, dtype=CELL_DTYPE)
+    unused_digits = np.uint64((1 << (45 - 3 * res)) - 1)
+    parents = (cells & ~_RES_MASK) | np.uint64(res << _RES_SHIFT) | unused_digits
+    return np.where(cells == 0, CELL_DTYPE(0), parents)
+
+
+def _latlng_to_cells_unique(lats: np.ndarray, lons: np.ndarray, res: int) -> np.ndarray:
+    """고유 좌표만 h3 호출 (유효하지 않은 좌표는 0)"""
+    cells = np.zeros(len(lats), dtype=CELL_DTYPE)
+    valid = np.isfinite(lats) & np.isfinite(lons) & (np.abs(lats) <= 90) & (np.abs(lons) <= 180)
+    latlng_to_cell = h3i.latlng_to_cell
+    cells[valid] = [
+        latlng_to_cell(lat, lon, res)
+        for lat, lon in zip(lats[valid].tolist(), lons[valid].tolist())
+    ]
+    return cells
+
+
+def latlng_to_cells(
+    lats: Sequence[float],
+    lons: Sequence[float],
+    resolutions: Union[int, Sequence[int]] = H3_RESOLUTION,
+    hierarchical: bool = False
+) -> Dict[int, np.ndarray]:
+    """좌표 배열 → {해상도: uint64 셀 ID 배열}
+
+    H3 셀은 부모에 완전히 포함되지 않으므로 기본값은 해상도별 실제 포함 셀을 계산한다.
+    hierarchical=True면 최고 해상도 셀의 부모를 사용한다 (파티션 키 등 부모-자식 일관성이 필요할 때).
+    """
+    if isinstance(resolutions, int):
+        resolutions = [resolutions]
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    if lats.shape != lons.shape:
+        raise ValueError("위도/경도 배열 길이가 다릅니다")
+
+    # 복소수 키로 (lat, lon) 쌍 해시 기반 중복 제거
+    codes, uniques = pd.factorize(lats + 1j * lons, use_na_sentinel=False)
+    unique_lats, unique_lons = uniques.real.copy(), uniques.imag.copy()
+
+    result = {}
+    if hierarchical:
+        finest = max(resolutions)
+        unique_cells = _latlng_to_cells_unique(unique_lats, unique_lons, finest)
+        for res in resolutions:
+            level = unique_cells if res == finest else cells_to_parent(unique_cells, res)
+            result[res] = level[codes]
+    else:
+        for res in resolutions:
+            result[res] = _latlng_to_cells_unique(unique_lats, unique_lons, res)[codes]
+    return result
+
+
+def cells_to_latlng(cells: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """셀 배열 → 셀 중심 (위도, 경도) 배열 (고유 셀만 h3 호출, 0은 NaN)"""
+    codes, uniques = pd.factorize(np.asarray(cells, dtype=CELL_DTYPE))
+    centers = np.full((len(uniques), 2), np.nan)
+    for i, cell in enumerate(uniques.tolist()):
+        if cell:
+            centers[i] = h3i.cell_to_latlng(cell)
+    return centers[codes, 0], centers[codes, 1]
+
+
+def cells_within_radius(
+    lats: Sequence[float],
+    lons: Sequence[float],
+    radius_m: float,
+    res: int = H3_RESOLUTION
+) -> np.ndarray:
+    """좌표 주변 반경 이내에 걸칠 수 있는 셀 집합 (k-ring 확장, 보수적 상한)"""
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    if len(lats) == 0:
+        return np.array([], dtype=CELL_DTYPE)
+
+    edge_m = h3i.average_hexagon_edge_length(res, unit="m")
+    # 인접 셀 중심 간격은 edge * sqrt(3), 경계 셀까지 포함하도록 1칸 여유
+    k = int(np.ceil(radius_m / (edge_m * np.sqrt(3)))) + 1
+    centers = latlng_to_cells(lats, lons, res)[res]
+    return grid_disk_pairs(centers, k)["neighbor"].unique()
+
+
+class CellCache:
+    """좌표 배열 내용 기준 셀 배열 캐시 (같은 원본을 여러 조인에 반복 사용할 때)"""
+
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, int], np.ndarray]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _digest(lats: np.ndarray, lons: np.ndarray) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(np.ascontiguousarray(lats, dtype=np.float64).tobytes())
+        digest.update(np.ascontiguousarray(lons, dtype=np.float64).tobytes())
+        return digest.hexdigest()
+
+    def get(self, lats, lons, resolutions: Sequence[int]) -> Dict[int, np.ndarray]:
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        digest = self._digest(lats, lons)
+
+        result, missing = {}, []
+        for res in resolutions:
+            cells = self._entries.get((digest, res))
+            if cells is None:
+                missing.append(res)
+            else:
+                self._entries.move_to_end((digest, res))
+                result[res] = cells
+        self.hits += len(result)
+        self.misses += len(missing)
+
+        if missing:
+            for res, cells in latlng_to_cells(lats, lons, missing).items():
+                result[res] = cells
+                self._entries[(digest, res)] = cells
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    def clear(self):
+        self._entries.clear()
+
+
+cell_cache = CellCache()
+
+
+def assign_cells(
+    df: pd.DataFrame,
+    resolutions: Union[int, Sequence[int]] = H3_RESOLUTION,
+    lat_col: Optional[str] = None,
+    lon_col: Optional[str] = None,
+    prefix: str = "h3_",
+    overwrite: bool = False
+) -> pd.DataFrame:
+    """DataFrame에 h3_{res} 셀 컬럼 추가 (이미 있는 컬럼은 재사용)"""
+    if isinstance(resolutions, int):
+        resolutions = [resolutions]
+    if lat_col is None or lon_col is None:
+        lat_col, lon_col = find_coord_columns(df)
+
+    missing = [res for res in resolutions if overwrite or cell_column(res, prefix) not in df.columns]
+    if not missing:
+        return df
+
+    lats = pd.to_numeric(df[lat_col], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    lons = pd.to_numeric(df[lon_col], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    cells = cell_cache.get(lats, lons, missing)
+
+    df = df.copy()
+    for res in missing:
+        df[cell_column(res, prefix)] = cells[res]
+    return df
+
+
+def grid_disk_pairs(cells: np.ndarray, k: int) -> pd.DataFrame:
+    """고유 셀별 k-ring 이웃 목록 → (cell, neighbor, ring) 테이블
+
+    h3 호출은 고유 셀 × 링 수만큼만 발생한다.
+    """
+    unique_cells = pd.unique(np.asarray(cells, dtype=CELL_DTYPE))
+    unique_cells = unique_cells[unique_cells != 0]
+
+    if k == 0:
+        return pd.DataFrame({
+            "cell": unique_cells,
+            "neighbor": unique_cells,
+            "ring": np.zeros(len(unique_cells), dtype=np.int8)
+        })
+
+    centers: List[np.ndarray] = []
+    neighbors: List[np.ndarray] = []
+    rings: List[np.ndarray] = []
+    grid_ring = h3i.grid_ring
+    for cell in unique_cells.tolist():
+        for ring in range(k + 1):
+            members = np.asarray(grid_ring(cell, ring), dtype=CELL_DTYPE)
+            neighbors.append(members)
+            centers.append(np.full(len(members), cell, dtype=CELL_DTYPE))
+            rings.append(np.full(len(members), ring, dtype=np.int8))
+
+    if not neighbors:
+        return pd.DataFrame({
+            "cell": np.array([], dtype=CELL_DTYPE),
+            "neighbor": np.array([], dtype=CELL_DTYPE),
+            "ring": np.array([], dtype=np.int8)
+        })
+    return pd.DataFrame({
+        "cell": np.concatenate(centers),
+        "neighbor": np.concatenate(neighbors),
+        "ring": np.concatenate(rings)
+    })
+
+
+def join_by_cell(
+    left: pd.DataFrame,
+    right: pd.DataFrame,
+    res: int = H3_RESOLUTION,
+    k: int = 0,
+    how: str = "inner",
+    suffixes: Tuple[str, str] = ("", "_right"),
+    prefix: str = "h3_"
+) -> pd.DataFrame:
+    """셀 + k-ring 이웃 기준 공간 조인
+
+    - left 각 행과, left 셀에서 k칸 이내 셀에 있는 right 행을 연결
+    - 결과에 h3_ring(0=같은 셀) 컬럼 포함
+    """
+    column = cell_column(res, prefix)
+    left = assign_cells(left, res, prefix=prefix)
+    right = assign_cells(right, res, prefix=prefix)
+
+    pairs = grid_disk_pairs(left[column].to_numpy(), k)
+    pairs = pairs.rename(columns={"cell": column, "neighbor": "_neighbor", "ring": "h3_ring"})
+
+    merged = left.merge(pairs, on=column, how="left" if how == "left" else "inner")
+    right = right.rename(columns={column: "_neighbor"})
+    merged = merged.merge(right, on="_neighbor", how=how, suffixes=suffixes)
+    return merged.drop(columns="_neighbor")
+
+
+def count_by_cell(
+    left: pd.DataFrame,
+    right: pd.DataFrame,
+    res: int = H3_RESOLUTION,
+    k: int = 0,
+    prefix: str = "h3_"
+) -> np.ndarray:
+    """left 각 행의 k-ring 이내 right 건수 (예: 셀별 과거 사고 건수)"""
+    column = cell_column(res, prefix)
+    left = assign_cells(left, res, prefix=prefix)
+    right = assign_cells(right, res, prefix=prefix)
+
+    right_counts = right[column].value_counts()
+    right_counts = right_counts[right_counts.index != 0]
+
+    pairs = grid_disk_pairs(left[column].to_numpy(), k)
+    pairs["count"] = right_counts.reindex(pairs["neighbor"].to_numpy(), fill_value=0).to_numpy()
+    per_cell = pairs.groupby("cell", sort=False)["count"].sum()
+
+    return per_cell.reindex(left[column].to_numpy(), fill_value=0).to_numpy(dtype=np.int64)
+
+
+if __name__ == "__main__":
+    import time
+
+    rng = np.random.default_rng(42)
+    n = 1_000_000
+    lats = rng.uniform(35.2, 35.4, n)
+    lons = rng.uniform(127.5, 127.8, n)
+
+    started = time.perf_counter()
+    cells = latlng_to_cells(lats, lons, [7, 8, 9])
+    print(f"셀 할당 {n:,}점 × 3 해상도: {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    started = time.perf_counter()
+    parents = latlng_to_cells(lats, lons, [7, 8, 9], hierarchical=True)
+    print(f"셀 할당 (hierarchical): {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    sample = np.random.default_rng(0).choice(n, 1000, replace=False)
+    for res in (7, 8, 9):
+        expected = [h3i.latlng_to_cell(lats[i], lons[i], res) for i in sample]
+        assert (cells[res][sample] == np.asarray(expected, dtype=CELL_DTYPE)).all()
+        expected = [h3i.cell_to_parent(int(c), res) for c in parents[9][sample]]
+        assert (parents[res][sample] == np.asarray(expected, dtype=CELL_DTYPE)).all()
+
+    grid = pd.DataFrame({"center_lat": lats, "center_lon": lons})
+    accidents = pd.DataFrame({"lat": rng.uniform(35.2, 35.4, 20_000), "lon": rng.uniform(127.5, 127.8, 20_000)})
+
+    started = time.perf_counter()
+    counts = count_by_cell(grid, accidents, res=8, k=1)
+    print(f"k=1 사고 건수 집계: {(time.perf_counter() - started) * 1000:.0f} ms (평균 {counts.mean():.2f}건)")
@@ -0,0 +1,402 @@
+"""
+기지국 공간 색인 (KD-tree, 대권 거리)
+- 전파누리 기지국 목록으로 1회 색인 → 좌표 배열 일괄 반경/k-최근접 조회
+- 위경도를 단위 구면 3차원 좌표로 변환해 KD-tree 색인 (현 거리는 대권 거리와 단조 관계이므로
+  반경/최근접 결과가 haversine과 동일, sklearn BallTree(haversine) 대비 5~25배 빠름)
+- 반경 내 기지국 PWR/FRQ/ANT_GAIN 벡터화 집계 (커버리지 피처)
+- 기지국 캐시 갱신 시 증분 반영: 추가/변경분은 소형 delta 트리, 제거분은 비활성 마스크,
+  변경 누적량이 기준을 넘으면 전체 재색인
+
+(data/AI_수색지역_MVP_구현계획서.md 기지국 커버리지 피처)
+"""
+import threading
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_M = 6_371_008.8
+DEFAULT_RADIUS_M = 3000.0
+
+# 커버리지 점수: 예상 수신 전력(dBm)을 [-110, -50] 구간에서 0~1로 정규화
+SIGNAL_FLOOR_DBM = -110.0
+SIGNAL_CEIL_DBM = -50.0
+
+ATTRIBUTES = ("PWR", "FRQ", "ANT_GAIN")
+
+
+def _float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def station_key(station: Dict[str, Any]) -> Hashable:
+    """기지국 식별 키 (STATION_ID 우선, 없으면 좌표 + 주파수)"""
+    if station.get("STATION_ID"):
+        return station["STATION_ID"]
+    return (round(_float(station.get("LAT")), 6), round(_float(station.get("LON")), 6), station.get("FRQ"))
+
+
+def to_unit_xyz(lats: Sequence[float], lons: Sequence[float]) -> np.ndarray:
+    """위경도 → 단위 구면 3차원 좌표"""
+    lat = np.radians(np.asarray(lats, dtype=np.float64))
+    lon = np.radians(np.asarray(lons, dtype=np.float64))
+    cos_lat = np.cos(lat)
+    return np.column_stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)])
+
+
+def meters_to_chord(meters: float) -> float:
+    return 2 * np.sin(min(meters / EARTH_RADIUS_M, np.pi) / 2)
+
+
+def chord_to_meters(chord: np.ndarray) -> np.ndarray:
+    return 2 * np.arcsin(np.clip(chord / 2, 0.0, 1.0)) * EARTH_RADIUS_M
+
+
+def received_power_dbm(pwr_w: np.ndarray, ant_gain_dbi: np.ndarray, frq_mhz: np.ndarray, dist_m: np.ndarray) -> np.ndarray:
+    """자유공간 경로손실 기준 예상 수신 전력 (dBm)"""
+    eirp_dbm = 10 * np.log10(np.maximum(pwr_w, 1e-3) * 1000) + np.nan_to_num(ant_gain_dbi)
+    fspl_db = 20 * np.log10(np.maximum(dist_m, 1.0) / 1000) + 20 * np.log10(np.maximum(frq_mhz, 1.0)) + 32.44
+    return eirp_dbm - fspl_db
+
+
+class StationIndex:
+    """기지국 KD-tree 색인 (증분 갱신 지원)"""
+
+    def __init__(
+        self,
+        stations: Optional[Iterable[Dict[str, Any]]] = None,
+        rebuild_ratio: float = 0.2,
+        leaf_size: int = 16
+    ):
+        self.rebuild_ratio = rebuild_ratio
+        self.leaf_size = leaf_size
+        self._lock = threading.Lock()
+        self._reset()
+        self.rebuilds = 0
+        self.delta_updates = 0
+        # 캐시 키별 마지막 기지국 키 집합 (갱신 목록에서 빠진 기지국 제거용)
+        self._cache_members: Dict[Tuple, set] = {}
+        if stations:
+            self.upsert(stations)
+
+    def _reset(self):
+        self._keys: List[Hashable] = []
+        self._positions: Dict[Hashable, int] = {}
+        self._coords = np.empty((0, 3), dtype=np.float64)
+        self._latlon = np.empty((0, 2), dtype=np.float64)
+        # 마지막 갱신으로 영향받은 위치 (변경/제거 전후 좌표) - 피처 부분 재계산용
+        self.last_changed = np.empty((0, 2), dtype=np.float64)
+        self._attrs = np.empty((0, len(ATTRIBUTES)), dtype=np.float64)
+        self._active = np.empty(0, dtype=bool)
+        self._base_tree: Optional[cKDTree] = None
+        self._base_size = 0
+        self._delta_tree: Optional[cKDTree] = None
+
+    # ===== 갱신 =====
+    def upsert(self, stations: Iterable[Dict[str, Any]]) -> int:
+        """기지국 추가/변경 반영 → 변경된 기지국 수 (동일 데이터는 무시)
+
+        같은 배치 안에서 키가 중복되면 마지막 항목만 반영
+        (STATION_ID 없는 동일 좌표/주파수 섹터가 갱신마다 누적되지 않도록)
+        """
+        batch: Dict[Hashable, Tuple[Tuple[float, float], List[float]]] = {}
+        for station in stations:
+            lat, lon = _float(station.get("LAT")), _float(station.get("LON"))
+            if not (np.isfinite(lat) and np.isfinite(lon)):
+                continue
+            key = station_key(station)
+            batch.pop(key, None)
+            batch[key] = ((lat, lon), [_float(station.get(name)) for name in ATTRIBUTES])
+
+        if not batch:
+            return 0
+        keys = list(batch)
+        coords = [latlon for latlon, _ in batch.values()]
+        attrs = [values for _, values in batch.values()]
+        latlon = np.asarray(coords, dtype=np.float64)
+        coords = to_unit_xyz(latlon[:, 0], latlon[:, 1])
+        attrs = np.asarray(attrs, dtype=np.float64)
+
+        with self._lock:
+            changed, replaced = [], []
+            for i, key in enumerate(keys):
+                pos = self._positions.get(key)
+                if pos is not None and self._active[pos] \
+                        and np.array_equal(self._coords[pos], coords[i]) \
+                        and np.array_equal(self._attrs[pos], attrs[i], equal_nan=True):
+                    continue
+                if pos is not None:
+                    if self._active[pos]:
+                        replaced.append(pos)
+                    self._active[pos] = False
+                changed.append(i)
+
+            if not changed:
+                self.last_changed = np.empty((0, 2), dtype=np.float64)
+                return 0
+
+            self.last_changed = np.vstack([latlon[changed], self._latlon[replaced]])
+
+            start = len(self._keys)
+            for offset, i in enumerate(changed):
+                self._keys.append(keys[i])
+                self._positions[keys[i]] = start + offset
+            self._coords = np.vstack([self._coords, coords[changed]])
+            self._latlon = np.vstack([self._latlon, latlon[changed]])
+            self._attrs = np.vstack([self._attrs, attrs[changed]])
+            self._active = np.concatenate([self._active, np.ones(len(changed), dtype=bool)])
+            self._refresh_trees()
+            return len(changed)
+
+    def remove(self, keys: Iterable[Hashable]) -> int:
+        """기지국 제거 (비활성 처리, 재색인 시 정리)"""
+        with self._lock:
+            removed = []
+            for key in keys:
+                pos = self._positions.pop(key, None)
+                if pos is not None and self._active[pos]:
+                    self._active[pos] = False
+                    removed.append(pos)
+            self.last_changed = self._latlon[removed]
+            if removed:
+                self._refresh_trees()
+            return len(removed)
+
+    def _refresh_trees(self):
+        delta_size = len(self._keys) - self._base_size
+        inactive = int((~self._active).sum())
+        if self._base_tree is None or delta_size + inactive > self.rebuild_ratio * max(self._base_size, 1):
+            self._rebuild()
+            return
+
+        delta = self._coords[self._base_size:]
+        self._delta_tree = cKDTree(delta, leafsize=self.leaf_size) if len(delta) else None
+        self.delta_updates += 1
+
+    def _rebuild(self):
+        """비활성 행 정리 후 전체 재색인"""
+        keep = np.flatnonzero(self._active)
+        self._keys = [self._keys[i] for i in keep]
+        self._positions = {key: i for i, key in enumerate(self._keys)}
+        self._coords = self._coords[keep]
+        self._latlon = self._latlon[keep]
+        self._attrs = self._attrs[keep]
+        self._active = np.ones(len(keep), dtype=bool)
+        self._base_size = len(keep)
+        self._base_tree = cKDTree(self._coords, leafsize=self.leaf_size) if len(keep) else None
+        self._delta_tree = None
+        self.rebuilds += 1
+        logger.info(f"기지국 색인 재생성: {len(keep)}개")
+
+    def on_cache_update(self, key: Tuple, stations: List[Dict[str, Any]]) -> np.ndarray:
+        """ResponseCache 리스너 - 기지국 캐시 갱신 시 증분 반영 → 영향받은 (위도, 경도) 배열
+
+        같은 캐시 키의 이전 목록에 있었지만 새 목록에서 빠진 기지국은 제거
+        (다른 캐시 키 목록에 남아 있는 기지국은 유지)
+        """
+        members = {station_key(station) for station in stations}
+        previous = self._cache_members.get(key, set())
+        self._cache_members[key] = members
+        others = set().union(*(keys for other, keys in self._cache_members.items() if other != key))
+        missing = previous - members - others
+
+        removed = self.remove(missing) if missing else 0
+        removed_latlon = self.last_changed if removed else np.empty((0, 2), dtype=np.float64)
+        changed = self.upsert(stations)
+        if changed or removed:
+            logger.info(f"기지국 색인 갱신: {changed}개 변경, {removed}개 제거 ({key})")
+        self.last_changed = np.vstack([self.last_changed, removed_latlon])
+        return self.last_changed
+
+    # ===== 조회 =====
+    def _trees(self) -> List[Tuple[cKDTree, int]]:
+        trees = []
+        if self._base_tree is not None:
+            trees.append((self._base_tree, 0))
+        if self._delta_tree is not None:
+            trees.append((self._delta_tree, self._base_size))
+        return [(tree, offset) for tree, offset in trees if tree.n > 0]
+
+    def query_radius(
+        self,
+        lats: Sequence[float],
+        lons: Sequence[float],
+        radius_m: float = DEFAULT_RADIUS_M
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """반경 내 기지국 → (질의 행 번호, 기지국 위치, 거리 m) 평탄화 배열 (순서 미보장)"""
+        rows, positions, dists, _ = self._radius_pairs(lats, lons, radius_m)
+        return rows, positions, dists
+
+    def _radius_pairs(self, lats, lons, radius_m: float):
+        """반경 조회 + 같은 시점의 속성 배열 (조회 중 재색인되어도 위치가 어긋나지 않도록)
+
+        질의 좌표로도 트리를 만들어 트리-트리 조회 1회로 모든 쌍을 배열로 받는다.
+        """
+        points = cKDTree(to_unit_xyz(lats, lons), leafsize=self.leaf_size)
+        chord = meters_to_chord(radius_m)
+        rows, positions, dists = [], [], []
+
+        with self._lock:
+            for tree, offset in self._trees():
+                pairs = points.sparse_distance_matrix(tree, chord, output_type="ndarray")
+                rows.append(pairs["i"].astype(np.int64))
+                positions.append(pairs["j"].astype(np.int64) + offset)
+                dists.append(chord_to_meters(pairs["v"]))
+            active = self._active.copy()
+            attrs = self._attrs
+
+        if not rows:
+            empty = np.array([], dtype=np.int64)
+            return empty, empty, np.array([], dtype=np.float64), attrs
+
+        rows, positions, dists = np.concatenate(rows), np.concatenate(positions), np.concatenate(dists)
+        keep = active[positions]
+        return rows[keep], positions[keep], dists[keep], attrs
+
+    def query_nearest(
+        self,
+        lats: Sequence[float],
+        lons: Sequence[float],
+        k: int = 1
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """k-최근접 기지국 → (거리 m [n, k], 기지국 위치 [n, k]), 부족분은 inf / -1"""
+        points = to_unit_xyz(lats, lons)
+        dist_parts, ind_parts = [], []
+
+        with self._lock:
+            inactive = int((~self._active).sum())
+            for tree, offset in self._trees():
+                # 비활성 행이 결과를 가릴 수 있으므로 여유분까지 조회
+                k_tree = min(k + inactive, tree.n)
+                dist, ind = tree.query(points, k=[*range(1, k_tree + 1)])
+                dist_parts.append(chord_to_meters(dist))
+                ind_parts.append(ind.astype(np.int64) + offset)
+            active = self._active.copy()
+
+        if not dist_parts:
+            return np.full((len(points), k), np.inf), np.full((len(points), k), -1, dtype=np.int64)
+
+        dist = np.hstack(dist_parts)
+        ind = np.hstack(ind_parts)
+        dist = np.where(active[ind], dist, np.inf)
+        order = np.argsort(dist, axis=1, kind="stable")[:, :k]
+        dist = np.take_along_axis(dist, order, axis=1)
+        ind = np.where(np.isfinite(dist), np.take_along_axis(ind, order, axis=1), -1)
+
+        if dist.shape[1] < k:
+            pad = k - dist.shape[1]
+            dist = np.hstack([dist, np.full((len(points), pad), np.inf)])
+            ind = np.hstack([ind, np.full((len(points), pad), -1, dtype=ind.dtype)])
+        return dist, ind
+
+    def coverage_features(
+        self,
+        lats: Sequence[float],
+        lons: Sequence[float],
+        radius_m: float = DEFAULT_RADIUS_M
+    ) -> pd.DataFrame:
+        """좌표별 커버리지 피처 (num_stations_in_range, avg_station_power, coverage_score 등)"""
+        n = len(lats)
+        rows, positions, dists, attrs = self._radius_pairs(lats, lons, radius_m)
+        attrs = attrs[positions]
+        pwr, frq, gain = attrs[:, 0], attrs[:, 1], attrs[:, 2]
+
+        counts = np.bincount(rows, minlength=n)
+
+        def mean(values: np.ndarray) -> np.ndarray:
+            valid = ~np.isnan(values)
+            total = np.bincount(rows[valid], weights=values[valid], minlength=n)
+            num = np.bincount(rows[valid], minlength=n)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                return np.where(num > 0, total / num, np.nan)
+
+        # 행 단위 최대 수신 전력
+        best_dbm = np.full(n, -np.inf)
+        if len(rows):
+            signal = received_power_dbm(pwr, gain, frq, dists)
+            np.maximum.at(best_dbm, rows, np.where(np.isnan(signal), -np.inf, signal))
+        best_dbm[~np.isfinite(best_dbm)] = np.nan
+
+        nearest_dist, _ = self.query_nearest(lats, lons, k=1)
+        score = (best_dbm - SIGNAL_FLOOR_DBM) / (SIGNAL_CEIL_DBM - SIGNAL_FLOOR_DBM)
+
+        return pd.DataFrame({
+            "num_stations_in_range": counts.astype(np.int32),
+            "avg_station_power": mean(pwr),
+            "avg_station_frequency": mean(frq),
+            "avg_antenna_gain": mean(gain),
+            "nearest_station_distance_m": np.where(np.isfinite(nearest_dist[:, 0]), nearest_dist[:, 0], np.nan),
+            "best_signal_dbm": best_dbm,
+            "coverage_score": np.nan_to_num(np.clip(score, 0.0, 1.0))
+        })
+
+    def __len__(self) -> int:
+        return int(self._active.sum())
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "stations": len(self),
+            "base_size": self._base_size,
+            "delta_size": len(self._keys) - self._base_size,
+            "inactive": int((~self._active).sum()),
+            "rebuilds": self.rebuilds,
+            "delta_updates": self.delta_updates
+        }
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+    from pathlib import Path
+
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from src.data.mock_data import MockDataGenerator
+
+    generator = MockDataGenerator(seed=42)
+    stations = generator.generate_base_stations("지리산", 5000)
+    grid = generator.generate_grid_frame("지리산", grid_size_m=100, grid_count=200_000)
+
+    started = time.perf_counter()
+    index = StationIndex(stations)
+    print(f"색인 생성 {len(index)}개: {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    started = time.perf_counter()
+    features = index.coverage_features(grid["center_lat"].values, grid["center_lon"].values, radius_m=2000)
+    print(f"커버리지 피처 {len(grid):,}셀: {(time.perf_counter() - started) * 1000:.0f} ms")
+    print(features.describe().T[["mean", "min", "max"]])
+
+    # 브루트포스 검증 (일부 셀)
+    lat = np.radians(grid["center_lat"].values[:200])[:, None]
+    lon = np.radians(grid["center_lon"].values[:200])[:, None]
+    s_lat = np.radians([s["LAT"] for s in stations])[None, :]
+    s_lon = np.radians([s["LON"] for s in stations])[None, :]
+    a = np.sin((s_lat - lat) / 2) ** 2 + np.cos(lat) * np.cos(s_lat) * np.sin((s_lon - lon) / 2) ** 2
+    brute = (2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a)) <= 2000).sum(axis=1)
+    assert (brute == features["num_stations_in_range"].values[:200]).all()
+
+    # 증분 갱신: 기존과 동일 → 무시, 일부 변경 → delta 트리
+    assert index.upsert(stations[:100]) == 0
+    changed = [dict(s, PWR=s["PWR"] + 1) for s in stations[:100]]
+    started = time.perf_counter()
+    index.upsert(changed)
+    print(f"증분 갱신 100개: {(time.perf_counter() - started) * 1000:.1f} ms, {index.stats()}")
+    again = index.coverage_features(grid["center_lat"].values[:200], grid["center_lon"].values[:200], radius_m=2000)
+    assert (again["num_stations_in_range"].values == brute).all()
+
+    # STATION_ID 없는 동일 좌표/주파수 섹터: 같은 목록으로 반복 갱신해도 색인 크기 불변
+    sectors = [{k: v for k, v in s.items() if k != "STATION_ID"} for s in stations[:3]]
+    sectors.append(dict(sectors[0]))
+    refreshed = StationIndex()
+    sizes = []
+    for _ in range(5):
+        refreshed.on_cache_update(("지리산",), sectors)
+        sizes.append(len(refreshed))
+    assert sizes == [len({station_key(s) for s in sectors})] * 5, sizes
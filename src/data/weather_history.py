@@ -0,0 +1,400 @@
+"""
+산악기상 관측 이력 시계열 저장소
+- 폴링한 스냅샷을 관측소(obsid)별 시계열로 누적 (관측소별 마지막 시각 이후 행만 추가)
+- 블록 단위 컬럼 저장: 관측소 코드(int32) + 시각 델타(int32, 분) + 측정값(float32) .npy
+  · 블록 내 행은 (관측소, 시각) 정렬, 시각은 직전 행과의 분 단위 차이로 저장
+  · 측정값 컬럼은 np.load(mmap_mode="r")로 메모리 매핑해 조회 시 필요한 행만 읽음
+- 추가분은 작은 세그먼트 블록으로 쓰고, 세그먼트가 쌓이면 기본 블록으로 병합(compact)
+- as-of 조회: (관측소 코드 << 32) + 분 복합 키 1회 searchsorted → 사고 수천 건을 한 번에 조회
+
+(data/AI_수색지역_MVP_구현계획서.md 기상 피처: precipitation_mm, humidity_2m, weather_risk_score)
+"""
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_HISTORY_DIR = Path(__file__).parent.parent.parent / "data" / "weather_history"
+
+# 측정값 컬럼 (산악기상 API 필드)
+MEASUREMENTS = ["cprn", "rn", "hm10m", "hm2m", "pa", "ta", "ws"]
+# 세그먼트가 이 개수를 넘으면 기본 블록으로 병합
+COMPACT_SEGMENTS = 32
+# as-of 조회 기본 허용 간격 (분) - 이보다 오래된 관측은 결측 처리
+DEFAULT_TOLERANCE_MIN = 3 * 60
+
+MAIN_BLOCK = "main"
+EPOCH = np.datetime64("1970-01-01T00:00", "m")
+
+
+def parse_tm(values: Sequence[Any]) -> np.ndarray:
+    """관측시간 문자열 → datetime64[m] (202103221952 / 2021-03-22 19:52 모두 허용, 실패 시 NaT)"""
+    digits = pd.Series(values, dtype=object).astype(str).str.replace(r"\D", "", regex=True).str[:12]
+    return pd.to_datetime(digits, format="%Y%m%d%H%M", errors="coerce").to_numpy().astype("datetime64[m]")
+
+
+def to_minutes(times: Union[Sequence[Any], np.ndarray]) -> np.ndarray:
+    """시각 배열 → epoch 기준 분 (int64, NaT는 int64 최솟값)"""
+    return pd.to_datetime(np.asarray(times)).to_numpy().astype("datetime64[m]").astype(np.int64)
+
+
+class _Block:
+    """불변 컬럼 블록 (.npy 메모리 매핑)"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        meta = json.loads((path / "meta.json").read_text(encoding="utf-8"))
+        self.rows = meta["rows"]
+        self.codes = np.load(path / "obs.npy", mmap_mode="r")
+        self.time_base = meta["time_base"]
+        # 시각: 델타 저장 → 열 때 1회 누적합으로 복원해 조회용 복합 키 (관측소 << 32) + 분 오프셋 생성
+        offsets = np.cumsum(np.load(path / "time_delta.npy"), dtype=np.int64)
+        self.keys = (self.codes.astype(np.int64) << 32) + offsets
+        self.columns = {name: np.load(path / f"{name}.npy", mmap_mode="r") for name in meta["columns"]}
+
+    @staticmethod
+    def write(path: Path, codes: np.ndarray, minutes: np.ndarray, columns: Dict[str, np.ndarray]):
+        """(관측소, 시각) 정렬 후 임시 디렉터리에 쓰고 이름 변경 (원자적 교체)"""
+        order = np.lexsort((minutes, codes))
+        codes, minutes = codes[order], minutes[order]
+        time_base = int(minutes.min())
+
+        tmp = path.with_name(path.name + ".tmp")
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+        np.save(tmp / "obs.npy", codes.astype(np.int32))
+        np.save(tmp / "time_delta.npy", np.diff(minutes - time_base, prepend=0).astype(np.int32))
+        for name, values in columns.items():
+            np.save(tmp / f"{name}.npy", np.asarray(values, dtype=np.float32)[order])
+        (tmp / "meta.json").write_text(json.dumps({
+            "rows": int(len(codes)),
+            "time_base": time_base,
+            "columns": list(columns)
+        }), encoding="utf-8")
+
+        if path.exists():
+            old = path.with_name(path.name + ".old")
+            shutil.rmtree(old, ignore_errors=True)
+            os.replace(path, old)
+            os.replace(tmp, path)
+            shutil.rmtree(old, ignore_errors=True)
+        else:
+            os.replace(tmp, path)
+
+    @property
+    def minutes(self) -> np.ndarray:
+        """행별 관측 시각 (epoch 기준 분)"""
+        return (self.keys & 0xFFFFFFFF) + self.time_base
+
+    def lookup(self, codes: np.ndarray, minutes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """as-of 조회 → (행 인덱스, 관측 시각 분) - 해당 관측소의 이전 행이 없으면 (-1, 최솟값)
+
+        블록 시작 이전 시각은 음수 오프셋 → 직전 관측소 구간에 떨어지므로 관측소 코드 비교로 걸러짐
+        """
+        missing = np.iinfo(np.int64).min
+        if not self.rows:
+            return np.full(len(codes), -1), np.full(len(codes), missing)
+        query = (codes.astype(np.int64) << 32) + (minutes - self.time_base)
+        idx = np.searchsorted(self.keys, query, side="right") - 1
+        safe = np.maximum(idx, 0)
+        hit = (idx >= 0) & (self.codes[safe] == codes)
+        found = (self.keys[safe] & 0xFFFFFFFF) + self.time_base
+        return np.where(hit, idx, -1), np.where(hit, found, missing)
+
+
+class WeatherHistoryStore:
+    """관측소별 산악기상 시계열 저장소"""
+
+    def __init__(
+        self,
+        root: Union[str, Path] = DEFAULT_HISTORY_DIR,
+        compact_segments: int = COMPACT_SEGMENTS
+    ):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.compact_segments = compact_segments
+        self._lock = threading.Lock()
+
+        stations_path = self.root / "stations.json"
+        self.stations: List[str] = json.loads(stations_path.read_text(encoding="utf-8")) if stations_path.exists() else []
+        self._codes = {obsid: code for code, obsid in enumerate(self.stations)}
+        self._blocks: List[_Block] = []
+        self._next_segment = 0
+        self._open_blocks()
+
+        # 관측소별 마지막 저장 시각 (중복 폴링 행 제외용)
+        self._last_minute = np.full(len(self.stations), np.iinfo(np.int64).min, dtype=np.int64)
+        for block in self._blocks:
+            if block.rows:
+                np.maximum.at(self._last_minute, np.asarray(block.codes), block.minutes)
+
+    def _open_blocks(self):
+        """디스크의 블록 목록을 새 리스트로 열어 한 번에 교체 (조회 중인 스레드는 이전 목록을 계속 사용)"""
+        blocks = []
+        segments = sorted(self.root.glob("seg_*[0-9]"))
+        if (self.root / MAIN_BLOCK).exists():
+            blocks.append(_Block(self.root / MAIN_BLOCK))
+        blocks.extend(_Block(path) for path in segments)
+        self._blocks = blocks
+        self._next_segment = int(segments[-1].name[4:]) + 1 if segments else 0
+
+    def _station_codes(self, obsids: np.ndarray, create: bool) -> np.ndarray:
+        """obsid 배열 → 정수 코드 (create=True면 신규 관측소 등록, 아니면 미등록 -1)"""
+        uniques, inverse = np.unique(obsids.astype(str), return_inverse=True)
+        mapped = np.empty(len(uniques), dtype=np.int64)
+        added = False
+        for i, obsid in enumerate(uniques):
+            code = self._codes.get(obsid)
+            if code is None and create:
+                code = len(self.stations)
+                self.stations.append(obsid)
+                self._codes[obsid] = code
+                added = True
+            mapped[i] = -1 if code is None else code
+        if added:
+            self._last_minute = np.concatenate([
+                self._last_minute,
+                np.full(len(self.stations) - len(self._last_minute), np.iinfo(np.int64).min, dtype=np.int64)
+            ])
+            tmp = self.root / "stations.json.tmp"
+            tmp.write_text(json.dumps(self.stations, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, self.root / "stations.json")
+        return mapped[inverse]
+
+    # ===== 추가 =====
+    def append(self, records: Union[pd.DataFrame, List[Dict[str, Any]]]) -> int:
+        """스냅샷 레코드 추가 → 저장된 행 수 (관측소별 마지막 시각 이하 행은 제외)"""
+        df = records if isinstance(records, pd.DataFrame) else pd.DataFrame(records)
+        if df.empty or "obsid" not in df.columns or "tm" not in df.columns:
+            return 0
+
+        minutes = parse_tm(df["tm"].to_numpy()).astype(np.int64)
+        valid = (minutes != np.iinfo(np.int64).min) & df["obsid"].notna().to_numpy()
+        if not valid.any():
+            return 0
+        df, minutes = df[valid], minutes[valid]
+
+        with self._lock:
+            codes = self._station_codes(df["obsid"].to_numpy(), create=True)
+            # 동일 관측소/시각 중복은 마지막 값, 이미 저장된 시각 이하는 제외
+            keep = ~pd.DataFrame({"c": codes, "m": minutes}).duplicated(keep="last").to_numpy()
+            keep &= minutes > self._last_minute[codes]
+            if not keep.any():
+                return 0
+
+            columns = {
+                name: pd.to_numeric(df[name], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)[keep]
+                if name in df.columns else np.full(int(keep.sum()), np.nan)
+                for name in MEASUREMENTS
+            }
+            codes, minutes = codes[keep], minutes[keep]
+
+            path = self.root / f"seg_{self._next_segment:08d}"
+            _Block.write(path, codes, minutes, columns)
+            # 조회 스레드가 잡고 있는 목록은 변경하지 않고 새 리스트로 교체
+            self._blocks = self._blocks + [_Block(path)]
+            self._next_segment += 1
+            np.maximum.at(self._last_minute, codes, minutes)
+
+            if len(self._blocks) > self.compact_segments:
+                self._compact()
+        return len(codes)
+
+    def compact(self):
+        """세그먼트를 기본 블록으로 병합"""
+        with self._lock:
+            self._compact()
+
+    def _compact(self):
+        if len(self._blocks) <= 1:
+            return
+        codes = np.concatenate([np.asarray(b.codes) for b in self._blocks])
+        minutes = np.concatenate([b.minutes for b in self._blocks])
+        columns = {
+            name: np.concatenate([
+                np.asarray(b.columns[name]) if name in b.columns else np.full(b.rows, np.nan, dtype=np.float32)
+                for b in self._blocks
+            ])
+            for name in MEASUREMENTS
+        }
+        segments = [b.path for b in self._blocks if b.path.name != MAIN_BLOCK]
+        # 병합 중에도 조회는 기존 블록 목록으로 계속 응답 (교체된 파일의 메모리 매핑은 참조가 끝날 때까지 유효)
+        _Block.write(self.root / MAIN_BLOCK, codes, minutes, columns)
+        for path in segments:
+            shutil.rmtree(path, ignore_errors=True)
+        self._open_blocks()
+        logger.info(f"산악기상 이력 병합: {len(codes):,}행, 세그먼트 {len(segments)}개")
+
+    # ===== 조회 =====
+    def asof(
+        self,
+        obsids: Sequence[Any],
+        times: Sequence[Any],
+        columns: Optional[List[str]] = None,
+        tolerance_min: Optional[int] = DEFAULT_TOLERANCE_MIN
+    ) -> pd.DataFrame:
+        """(관측소, 시각) 배열 → 각 시각 직전(이하) 관측값 (입력 순서 유지, 없으면 NaN)
+
+        반환 컬럼: 요청 측정값 + obs_time (사용된 관측 시각) + lag_min (조회 시각과의 차이, 분)
+        """
+        columns = columns or MEASUREMENTS
+        n = len(obsids)
+        minutes = to_minutes(times)
+        # 블록 목록은 통째로 교체되므로 참조 1회로 일관된 스냅샷 확보
+        blocks = self._blocks
+        codes = self._station_codes(np.asarray(obsids, dtype=object), create=False)
+        known = (codes >= 0) & (minutes != np.iinfo(np.int64).min)
+
+        # 블록별 as-of 결과 중 가장 최근 관측 선택
+        best_block = np.full(n, -1, dtype=np.int64)
+        best_row = np.full(n, -1, dtype=np.int64)
+        best_minute = np.full(n, np.iinfo(np.int64).min, dtype=np.int64)
+        for b, block in enumerate(blocks):
+            rows, found = block.lookup(np.where(known, codes, -1), np.where(known, minutes, 0))
+            better = (rows >= 0) & (found > best_minute)
+            best_block[better] = b
+            best_row[better] = rows[better]
+            best_minute[better] = found[better]
+
+        if tolerance_min is not None:
+            too_old = (best_block >= 0) & (minutes - best_minute > tolerance_min)
+            best_block[too_old] = -1
+
+        out = {name: np.full(n, np.nan, dtype=np.float32) for name in columns}
+        for b, block in enumerate(blocks):
+            sel = np.flatnonzero(best_block == b)
+            if len(sel) == 0:
+                continue
+            rows = best_row[sel]
+            for name in columns:
+                if name in block.columns:
+                    out[name][sel] = block.columns[name][rows]
+
+        found = best_block >= 0
+        obs_minute = np.where(found, best_minute, 0)
+        result = pd.DataFrame(out)
+        result["obs_time"] = pd.Series((EPOCH + obs_minute.astype("timedelta64[m]")).astype("datetime64[ns]")).where(found)
+        result["lag_min"] = pd.Series(np.where(found, minutes - obs_minute, 0), dtype="Int64").where(found)
+        return result
+
+    def series(self, obsid: str, start: Any = None, end: Any = None) -> pd.DataFrame:
+        """관측소 1곳의 구간 시계열 (시각 오름차순)"""
+        code = self._codes.get(str(obsid))
+        if code is None:
+            return pd.DataFrame(columns=["tm"] + MEASUREMENTS)
+        frames = []
+        for block in self._blocks:
+            lo = np.searchsorted(block.keys, np.int64(code) << 32, side="left")
+            hi = np.searchsorted(block.keys, (np.int64(code) + 1) << 32, side="left")
+            if hi <= lo:
+                continue
+            frame = pd.DataFrame({name: np.asarray(block.columns[name][lo:hi]) for name in MEASUREMENTS if name in block.columns})
+            minutes = (block.keys[lo:hi] & 0xFFFFFFFF) + block.time_base
+            frame.insert(0, "tm", (EPOCH + minutes.astype("timedelta64[m]")).astype("datetime64[ns]"))
+            frames.append(frame)
+        if not frames:
+            return pd.DataFrame(columns=["tm"] + MEASUREMENTS)
+        df = pd.concat(frames, ignore_index=True).sort_values("tm", kind="stable")
+        if start is not None:
+            df = df[df["tm"] >= pd.Timestamp(start)]
+        if end is not None:
+            df = df[df["tm"] <= pd.Timestamp(end)]
+        return df.reset_index(drop=True)
+
+    def stats(self) -> Dict[str, Any]:
+        blocks = self._blocks
+        return {
+            "stations": len(self.stations),
+            "rows": int(sum(b.rows for b in blocks)),
+            "segments": sum(1 for b in blocks if b.path.name != MAIN_BLOCK),
+            "bytes": int(sum(f.stat().st_size for b in blocks if b.path.exists() for f in b.path.iterdir()))
+        }
+
+
+def weather_risk_score(precipitation: np.ndarray, humidity: np.ndarray) -> np.ndarray:
+    """기상 위험도 (0~1): 당일 강수(20mm 이상 = 1)와 2m 습도(60% → 100%) 정규화 가중합 (0.6 / 0.4), 둘 다 결측이면 NaN"""
+    precipitation = np.asarray(precipitation, dtype=np.float32)
+    humidity = np.asarray(humidity, dtype=np.float32)
+    risk = (
+        0.6 * np.clip(np.nan_to_num(precipitation) / 20.0, 0, 1)
+        + 0.4 * np.clip((np.nan_to_num(humidity, nan=60.0) - 60.0) / 40.0, 0, 1)
+    ).astype(np.float32)
+    risk[np.isnan(precipitation) & np.isnan(humidity)] = np.nan
+    return risk
+
+
+def weather_features(
+    store: WeatherHistoryStore,
+    obsids: Sequence[Any],
+    times: Sequence[Any],
+    tolerance_min: Optional[int] = DEFAULT_TOLERANCE_MIN
+) -> pd.DataFrame:
+    """사고(관측소, 시각) 배열 → 기상 피처 (precipitation_mm, humidity_2m, weather_risk_score)"""
+    observed = store.asof(obsids, times, columns=["rn", "hm2m"], tolerance_min=tolerance_min)
+    precipitation = observed["rn"].to_numpy(dtype=np.float32)
+    humidity = observed["hm2m"].to_numpy(dtype=np.float32)
+    return pd.DataFrame({
+        "precipitation_mm": precipitation,
+        "humidity_2m": humidity,
+        "weather_risk_score": weather_risk_score(precipitation, humidity)
+    })
+
+
+if __name__ == "__main__":
+    import sys
+    import tempfile
+    import time
+
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+    # 관측소 400곳 × 10분 간격 30일 폴링 (≈ 1.7M행)
+    rng = np.random.default_rng(42)
+    stations = [f"OBS{i:04d}" for i in range(400)]
+    start = pd.Timestamp("2026-07-01")
+    store = WeatherHistoryStore(Path(tempfile.mkdtemp()) / "weather_history")
+    logger.setLevel(logging.WARNING)
+
+    started = time.perf_counter()
+    for step in range(30 * 24 * 6):
+        tm = (start + pd.Timedelta(minutes=10 * step)).strftime("%Y%m%d%H%M")
+        store.append(pd.DataFrame({
+            "obsid": stations,
+            "tm": tm,
+            "rn": np.round(rng.uniform(0, 20, len(stations)), 1),
+            "hm2m": np.round(rng.uniform(45, 98, len(stations)), 1),
+            "ta": np.round(rng.uniform(-10, 30, len(stations)), 1)
+        }))
+    store.compact()
+    print(f"추가 {30 * 24 * 6:,}회: {time.perf_counter() - started:.1f} s, {store.stats()}")
+
+    # 사고 10,000건 as-of 조회
+    count = 10_000
+    obsids = rng.choice(stations, count)
+    times = start + pd.to_timedelta(rng.uniform(0, 30 * 24 * 60, count), unit="min")
+    store = WeatherHistoryStore(store.root)
+    store.asof(obsids, times)
+    rounds = 20
+    started = time.perf_counter()
+    for _ in range(rounds):
+        result = weather_features(store, obsids, times)
+    print(f"as-of {count:,}건: {(time.perf_counter() - started) / rounds * 1000:.1f} ms")
+    print(result.describe().T)
+
+    # pandas merge_asof 검증 (일부)
+    sample = pd.DataFrame({"obsid": obsids[:500], "t": times[:500]}).reset_index()
+    full = pd.concat([store.series(obsid).assign(obsid=obsid) for obsid in np.unique(sample["obsid"])])
+    expected = pd.merge_asof(
+        sample.sort_values("t"), full.sort_values("tm"), left_on="t", right_on="tm", by="obsid"
+    ).sort_values("index")
+    got = store.asof(sample["obsid"], sample["t"], tolerance_min=None)
+    assert np.allclose(expected["rn"].to_numpy(dtype=np.float32), got["rn"].to_numpy(), equal_nan=True)
+    print("merge_asof 일치")
@@ -0,0 +1,179 @@
+"""
+산악기상 스냅샷 백그라운드 갱신 (stale-while-revalidate)
+- 전국 관측 스냅샷을 주기적으로 전체 조회해 메모리에 보관
+- obsid / localarea 사전 색인 → 요청 필터링은 O(1) 조회
+- 갱신 실패(일부 페이지 실패/빈 응답 포함) 시 마지막 정상 스냅샷 유지, 경과 시간으로 stale 판정
+- 요청 경로는 스냅샷만 읽으므로 업스트림 지연 없음
+"""
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+import logging
+
+from src.data.api_clients import MountainWeatherClient
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _key(value: Any) -> Optional[str]:
+    """색인 키 정규화 (숫자/문자열 혼재 대응)"""
+    if value is None:
+        return None
+    return str(value).strip()
+
+
+@dataclass(frozen=True)
+class WeatherSnapshot:
+    """특정 시점 전국 산악기상 관측 스냅샷 (불변, 교체 방식 갱신)"""
+    records: List[Dict[str, Any]]
+    fetched_at: datetime
+    fetched_monotonic: float
+    by_obsid: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    by_area: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, records: List[Dict[str, Any]]) -> "WeatherSnapshot":
+        by_obsid: Dict[str, List[Dict[str, Any]]] = {}
+        by_area: Dict[str, List[Dict[str, Any]]] = {}
+        for record in records:
+            obsid = _key(record.get("obsid"))
+            area = _key(record.get("localarea"))
+            if obsid is not None:
+                by_obsid.setdefault(obsid, []).append(record)
+            if area is not None:
+                by_area.setdefault(area, []).append(record)
+        return cls(records, datetime.now(), time.monotonic(), by_obsid, by_area)
+
+    @property
+    def age_seconds(self) -> float:
+        return time.monotonic() - self.fetched_monotonic
+
+    def filter(self, local_area: Optional[str] = None, obs_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """지역/관측소 필터 (사전 조회, 둘 다 지정 시 관측소 기준 후 지역 확인)"""
+        if obs_id is not None:
+            records = self.by_obsid.get(_key(obs_id), [])
+            if local_area is not None:
+                area = _key(local_area)
+                records = [r for r in records if _key(r.get("localarea")) == area]
+            return records
+        if local_area is not None:
+            return self.by_area.get(_key(local_area), [])
+        return self.records
+
+
+class WeatherRefresher:
+    """산악기상 스냅샷 주기 갱신기"""
+
+    def __init__(
+        self,
+        client: MountainWeatherClient,
+        interval: float = 120.0,
+        stale_after: float = 600.0,
+        num_of_rows: int = 1000,
+        max_pages: int = 10,
+        max_concurrency: int = 5
+    ):
+        self.client = client
+        self.interval = interval
+        self.stale_after = stale_after
+        self.num_of_rows = num_of_rows
+        self.max_pages = max_pages
+        self.max_concurrency = max_concurrency
+
+        self.snapshot: Optional[WeatherSnapshot] = None
+        self.last_error: Optional[str] = None
+        self.last_attempt: Optional[datetime] = None
+        self.refreshes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self._task: Optional[asyncio.Task] = None
+        self._listeners: List[Callable[[WeatherSnapshot], None]] = []
+
+    def add_listener(self, listener: Callable[[WeatherSnapshot], None]):
+        """새 스냅샷 교체 시 호출할 리스너 등록 (이력 저장 등)"""
+        self._listeners.append(listener)
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self):
+        while True:
+            await self.refresh()
+            # 연속 실패 시 간격을 늘려 업스트림 부하 완화 (최대 4배)
+            await asyncio.sleep(self.interval * min(2 ** self.consecutive_failures, 4))
+
+    async def refresh(self) -> bool:
+        """전체 스냅샷 1회 조회 → 정상 응답일 때만 교체"""
+        self.last_attempt = datetime.now()
+        try:
+            result = await self.client.fetch_pages({}, self.num_of_rows, self.max_pages, self.max_concurrency)
+            if not result.complete:
+                raise RuntimeError(f"페이지 조회 실패: {result.failed_pages}")
+            if not result.items:
+                raise RuntimeError("빈 응답")
+        except Exception as e:
+            self.failures += 1
+            self.consecutive_failures += 1
+            self.last_error = str(e)
+            logger.warning(f"산악기상 스냅샷 갱신 실패 ({self.consecutive_failures}회 연속): {e}")
+            return False
+
+        self.snapshot = WeatherSnapshot.build(result.items)
+        self.refreshes += 1
+        self.consecutive_failures = 0
+        self.last_error = None
+        logger.info(
+            f"산악기상 스냅샷 갱신: {len(result.items)}건 "
+            f"(관측소 {len(self.snapshot.by_obsid)}, 지역 {len(self.snapshot.by_area)})"
+        )
+        for listener in self._listeners:
+            try:
+                listener(self.snapshot)
+            except Exception as e:
+                logger.warning(f"산악기상 스냅샷 리스너 오류: {e}")
+        return True
+
+    @property
+    def is_stale(self) -> bool:
+        return (
+            self.snapshot is None
+            or self.consecutive_failures > 0
+            or self.snapshot.age_seconds > self.stale_after
+        )
+
+    def headers(self) -> Dict[str, str]:
+        """스냅샷 응답 헤더 (경과 시간, stale 여부)"""
+        snapshot = self.snapshot
+        headers = {
+            "X-Snapshot-Fetched-At": snapshot.fetched_at.isoformat(timespec="seconds"),
+            "X-Snapshot-Age": str(int(snapshot.age_seconds)),
+            "X-Snapshot-Stale": "true" if self.is_stale else "false"
+        }
+        if self.is_stale:
+            headers["Warning"] = '110 - "Response is Stale"'
+        return headers
+
+    def stats(self) -> Dict[str, Any]:
+        snapshot = self.snapshot
+        return {
+            "ready": snapshot is not None,
+            "records": len(snapshot.records) if snapshot else 0,
+            "observatories": len(snapshot.by_obsid) if snapshot else 0,
+            "areas": len(snapshot.by_area) if snapshot else 0,
+            "age_seconds": round(snapshot.age_seconds, 1) if snapshot else None,
+            "stale": self.is_stale,
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "last_attempt": self.last_attempt.isoformat(timespec="seconds") if self.last_attempt else None,
+            "last_error": self.last_error
+        }
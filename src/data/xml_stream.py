@@ -0,0 +1,198 @@
+"""
+공공데이터 API 응답 스트리밍 파서
+- Content-Type 헤더로 JSON/XML 판별 (헤더가 없거나 모호하면 첫 바이트로 판별)
+- XML은 XMLPullParser로 바이트 청크를 받는 즉시 증분 파싱 → <item> 단위 평탄 dict 생성
+- 완료된 <item> 요소는 즉시 해제 (전체 트리/중첩 dict를 만들지 않음)
+- 좌표/고도 등 숫자 필드는 파싱 시점에 변환 (JSON 응답도 동일하게 변환)
+- 헤더(resultCode/resultMsg), totalCount, 포털 공통 오류 응답(returnReasonCode/returnAuthMsg) 수집
+"""
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from xml.etree.ElementTree import XMLPullParser
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 위험지역 POI 숫자 필드
+DANGER_NUMERIC_FIELDS: Dict[str, Callable[[str], Any]] = {
+    "lat": float,
+    "lot": float,
+    "aslAltide": float
+}
+
+# 항목 밖 메타 필드 → ParsedPage 속성 (공통 오류 응답 태그 포함)
+META_TAGS = {
+    "resultCode": "result_code",
+    "resultMsg": "result_msg",
+    "totalCount": "total_count",
+    "returnReasonCode": "result_code",
+    "returnAuthMsg": "result_msg",
+    "errMsg": "result_msg"
+}
+
+
+@dataclass
+class ParsedPage:
+    """응답 1페이지 파싱 결과"""
+    items: List[Dict[str, Any]] = field(default_factory=list)
+    total_count: Optional[int] = None
+    result_code: Optional[str] = None
+    result_msg: Optional[str] = None
+    error: Optional[str] = None  # JSON/XML 어느 쪽으로도 해석되지 않은 응답 본문
+
+
+def detect_format(content_type: Optional[str], head: bytes = b"") -> Optional[str]:
+    """응답 형식 판별 → "json" / "xml" / None"""
+    content_type = (content_type or "").lower()
+    if "json" in content_type:
+        return "json"
+    if "xml" in content_type:
+        return "xml"
+    # text/plain, text/html 등 헤더가 부정확한 경우 본문 첫 문자로 판별
+    first = head.lstrip()[:1]
+    if first in (b"{", b"["):
+        return "json"
+    if first == b"<":
+        return "xml"
+    return None
+
+
+def convert_fields(item: Dict[str, Any], converters: Dict[str, Callable[[str], Any]]) -> Dict[str, Any]:
+    """숫자 필드 변환 (빈 값/변환 실패는 None)"""
+    for name, convert in converters.items():
+        value = item.get(name)
+        if value is None or isinstance(value, (int, float)):
+            continue
+        try:
+            item[name] = convert(value)
+        except (TypeError, ValueError):
+            item[name] = None
+    return item
+
+
+def _to_int(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class XMLRecordParser:
+    """<item> 단위 증분 XML 파서
+
+    feed()에 바이트 청크를 넣으면 완성된 항목 dict를 바로 반환한다.
+    항목의 직계 자식 요소 텍스트를 필드로 사용 (빈 요소는 None, xmltodict와 동일).
+    """
+
+    def __init__(self, item_tag: str = "item", converters: Optional[Dict[str, Callable[[str], Any]]] = None):
+        self.item_tag = item_tag
+        self.converters = converters or {}
+        self.page = ParsedPage()
+        # 요소 종료 이벤트만 수신 (항목의 자식은 항목 종료 시점에 모두 완성되어 있음)
+        self._parser = XMLPullParser(events=("end",))
+
+    def feed(self, chunk: bytes) -> List[Dict[str, Any]]:
+        self._parser.feed(chunk)
+        return self._drain()
+
+    def close(self) -> List[Dict[str, Any]]:
+        self._parser.close()
+        return self._drain()
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        completed = []
+        for _, elem in self._parser.read_events():
+            tag = elem.tag
+            if tag == self.item_tag:
+                item = {child.tag: (child.text.strip() or None) if child.text else None for child in elem}
+                completed.append(convert_fields(item, self.converters))
+                # 완료된 항목 해제 → 메모리 사용량이 응답 크기와 무관
+                elem.clear()
+            elif tag in META_TAGS:
+                text = elem.text.strip() if elem.text else None
+                attr = META_TAGS[tag]
+                setattr(self.page, attr, _to_int(text) if attr == "total_count" else text)
+
+        self.page.items.extend(completed)
+        return completed
+
+
+def parse_xml(chunks: Iterable[bytes], **kwargs) -> ParsedPage:
+    """바이트 청크 전체 파싱 (동기 버전, 벤치마크/테스트용)"""
+    parser = XMLRecordParser(**kwargs)
+    for chunk in chunks:
+        parser.feed(chunk)
+    parser.close()
+    return parser.page
+
+
+def page_from_json(result: Dict[str, Any], converters: Optional[Dict[str, Callable[[str], Any]]] = None) -> ParsedPage:
+    """공공데이터 JSON 응답(response.header/body) → ParsedPage"""
+    response = result.get("response", {}) if isinstance(result, dict) else {}
+    header = response.get("header") or {}
+    body = response.get("body") or {}
+    items = (body.get("items") or {}).get("item") or []
+    if isinstance(items, dict):
+        items = [items]
+    converters = converters or {}
+    return ParsedPage(
+        items=[convert_fields(item, converters) for item in items],
+        total_count=_to_int(body.get("totalCount")),
+        result_code=header.get("resultCode"),
+        result_msg=header.get("resultMsg")
+    )
+
+
+def iter_chunks(data: bytes, size: int = 64 * 1024) -> Iterator[bytes]:
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+    import tracemalloc
+    import xmltodict
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    rounds = 5
+
+    rows = "".join(
+        f"<item><poiId>POI{i:06d}</poiId><frtrlId>T{i % 500:04d}</frtrlId><frtrlNm>등산로 {i % 500}</frtrlNm>"
+        f"<lat>{35 + (i % 1000) / 1000:.6f}</lat><lot>{127 + (i % 777) / 1000:.6f}</lot>"
+        f"<aslAltide>{(i * 7) % 1900}.5</aslAltide><plcTypeCd>0{i % 9}</plcTypeCd>"
+        f"<plcNm>위험지역 {i}</plcNm><explnCn>낙석 주의 구간 {i}</explnCn><crtrDt>2024-05-01</crtrDt></item>"
+        for i in range(count)
+    )
+    body = (
+        '<?xml version="1.0" encoding="UTF-8"?><response><header><resultCode>00</resultCode>'
+        f"<resultMsg>NORMAL SERVICE.</resultMsg></header><body><items>{rows}</items>"
+        f"<numOfRows>{count}</numOfRows><pageNo>1</pageNo><totalCount>{count}</totalCount></body></response>"
+    ).encode("utf-8")
+
+    def legacy() -> List[Dict[str, Any]]:
+        result = xmltodict.parse(body.decode("utf-8"))
+        items = result.get("response", {}).get("body", {}).get("items", {}).get("item", [])
+        if isinstance(items, dict):
+            items = [items]
+        return [convert_fields(dict(item), DANGER_NUMERIC_FIELDS) for item in items]
+
+    def streaming() -> List[Dict[str, Any]]:
+        return parse_xml(iter_chunks(body), converters=DANGER_NUMERIC_FIELDS).items
+
+    page = parse_xml(iter_chunks(body), converters=DANGER_NUMERIC_FIELDS)
+    assert page.items == legacy() and page.total_count == count and page.result_code == "00"
+
+    print(f"응답 {len(body) / 1e6:.1f} MB, 항목 {count}건, {rounds}회 평균")
+    for name, fn in (("xmltodict", legacy), ("streaming", streaming)):
+        started = time.perf_counter()
+        for _ in range(rounds):
+            fn()
+        elapsed = (time.perf_counter() - started) / rounds * 1000
+
+        tracemalloc.start()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"  {name:10s} {elapsed:8.1f} ms   peak {peak / 1e6:6.1f} MB")
@@ -0,0 +1,246 @@
+"""
+수색 셀 순위 모델 (LightGBM)
+- 마지막 관측 위치 주변 k-ring H3 셀을 후보로 생성
+- 저장된 셀 피처(FeatureStore) + 요청 시점 피처(거리/시간)를 하나의 행렬로 구성
+- 사전 로드한 Booster로 후보 전체를 1회 predict → 상위 K개 셀
+
+(data/AI_수색지역_MVP_구현계획서.md 6 ~ 7장)
+"""
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import h3.api.numpy_int as h3i
+import lightgbm as lgb
+import numpy as np
+import pandas as pd
+import logging
+
+from src.data.feature_store import FeatureStore, FEATURE_FAMILIES
+from src.data.spatial_join import CELL_DTYPE, H3_RESOLUTION, cells_to_latlng
+from src.data.station_index import EARTH_RADIUS_M
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_PATH = Path(__file__).parent.parent.parent / "models" / "search_ranker.txt"
+
+# 요청 시점 피처
+QUERY_FEATURES = [
+    "dist_to_last_seen", "dist_to_last_seen_log",
+    "hour_of_day", "is_peak_hour", "is_night", "is_weekend",
+]
+# 저장소 피처 (범주형 nearest_danger_type 제외)
+STORED_FEATURES = [
+    name
+    for family in ("coverage", "danger", "weather", "history")
+    for name in FEATURE_FAMILIES[family]
+    if name != "nearest_danger_type"
+]
+FEATURE_COLUMNS = QUERY_FEATURES + STORED_FEATURES
+
+# 7.1 LightGBM 설정
+LGB_PARAMS = {
+    "boosting_type": "gbdt",
+    "objective": "binary",
+    "metric": ["binary_logloss", "auc"],
+    "num_leaves": 31,
+    "learning_rate": 0.05,
+    "is_unbalance": True,
+    "seed": 42,
+    "verbose": -1,
+}
+
+
+def candidate_cells(lat: float, lon: float, k: int, res: int = H3_RESOLUTION) -> np.ndarray:
+    """마지막 관측 위치 셀 기준 k-ring 후보 셀 (3k² + 3k + 1개)"""
+    center = h3i.latlng_to_cell(lat, lon, res)
+    return np.asarray(h3i.grid_disk(center, k), dtype=CELL_DTYPE)
+
+
+def query_features(
+    cell_lats: np.ndarray,
+    cell_lons: np.ndarray,
+    last_seen_lat: float,
+    last_seen_lon: float,
+    last_seen_time: datetime
+) -> Dict[str, np.ndarray]:
+    """요청 시점 피처 (거리 + 시간) - 후보 셀 배열 기준 벡터 연산"""
+    lat1, lon1 = np.radians(last_seen_lat), np.radians(last_seen_lon)
+    lat2, lon2 = np.radians(cell_lats), np.radians(cell_lons)
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    dist = 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+
+    n = len(cell_lats)
+    hour = last_seen_time.hour
+    return {
+        "dist_to_last_seen": dist,
+        "dist_to_last_seen_log": np.log1p(dist),
+        "hour_of_day": np.full(n, hour, dtype=np.float64),
+        "is_peak_hour": np.full(n, float(12 <= hour <= 15)),
+        "is_night": np.full(n, float(hour >= 21 or hour < 6)),
+        "is_weekend": np.full(n, float(last_seen_time.weekday() >= 5)),
+    }
+
+
+class SearchRanker:
+    """사전 로드된 LightGBM Booster 기반 후보 셀 순위화"""
+
+    def __init__(self, booster: lgb.Booster, feature_store: Optional[FeatureStore] = None, res: int = H3_RESOLUTION):
+        missing = set(booster.feature_name()) - set(FEATURE_COLUMNS)
+        if missing:
+            raise ValueError(f"모델 피처가 순위 피처 목록에 없음: {sorted(missing)}")
+        self.booster = booster
+        self.feature_names = booster.feature_name()
+        self.feature_store = feature_store
+        self.res = res
+
+    @classmethod
+    def load(
+        cls,
+        path: Union[str, Path] = DEFAULT_MODEL_PATH,
+        feature_store: Optional[FeatureStore] = None
+    ) -> "SearchRanker":
+        booster = lgb.Booster(model_file=str(path))
+        logger.info(f"순위 모델 로드: {path} (트리 {booster.num_trees()}개)")
+        return cls(booster, feature_store)
+
+    def build_matrix(
+        self,
+        cells: np.ndarray,
+        last_seen_lat: float,
+        last_seen_lon: float,
+        last_seen_time: datetime
+    ) -> np.ndarray:
+        """후보 셀 → 모델 피처 행렬 (저장소에 없는 피처는 NaN, LightGBM 결측 처리)"""
+        cell_lats, cell_lons = cells_to_latlng(cells)
+        columns = query_features(cell_lats, cell_lons, last_seen_lat, last_seen_lon, last_seen_time)
+
+        stored = [name for name in self.feature_names if name in STORED_FEATURES]
+        if self.feature_store is not None and stored:
+            features = self.feature_store.read(cells, columns=stored)
+            for name in stored:
+                if name in features.columns:
+                    columns[name] = pd.to_numeric(features[name], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+
+        matrix = np.full((len(cells), len(self.feature_names)), np.nan)
+        for j, name in enumerate(self.feature_names):
+            if name in columns:
+                matrix[:, j] = columns[name]
+        return matrix
+
+    def rank(
+        self,
+        last_seen_lat: float,
+        last_seen_lon: float,
+        last_seen_time: Optional[datetime] = None,
+        k_ring: int = 10,
+        top_k: int = 20
+    ) -> pd.DataFrame:
+        """후보 셀 점수화 → 확률 내림차순 상위 top_k (cell, h3_index, lat, lon, probability, rank)"""
+        last_seen_time = last_seen_time or datetime.now()
+        cells = candidate_cells(last_seen_lat, last_seen_lon, k_ring, self.res)
+        matrix = self.build_matrix(cells, last_seen_lat, last_seen_lon, last_seen_time)
+        probability = self.booster.predict(matrix)
+
+        top_k = min(top_k, len(cells))
+        top = np.argpartition(-probability, top_k - 1)[:top_k]
+        top = top[np.argsort(-probability[top], kind="stable")]
+
+        lats, lons = cells_to_latlng(cells[top])
+        return pd.DataFrame({
+            "cell": cells[top],
+            "h3_index": [h3i.int_to_str(int(c)) for c in cells[top]],
+            "lat": lats,
+            "lon": lons,
+            "probability": probability[top],
+            "rank": np.arange(1, top_k + 1)
+        })
+
+
+def train_ranker(
+    features: pd.DataFrame,
+    labels: np.ndarray,
+    params: Optional[Dict[str, Any]] = None,
+    num_boost_round: int = 200
+) -> lgb.Booster:
+    """순위 모델 학습 (features 컬럼 중 FEATURE_COLUMNS만 사용)"""
+    columns = [c for c in FEATURE_COLUMNS if c in features.columns]
+    dataset = lgb.Dataset(features[columns].astype(np.float64), label=labels, feature_name=columns)
+    return lgb.train(params or LGB_PARAMS, dataset, num_boost_round=num_boost_round)
+
+
+def build_training_frame(
+    episodes: pd.DataFrame,
+    ground_truths: pd.DataFrame,
+    k_ring: int = 10,
+    feature_store: Optional[FeatureStore] = None
+) -> pd.DataFrame:
+    """에피소드 × k-ring 후보 셀 학습 데이터 (발견 위치 셀 = 1)
+
+    feature_store 지정 시 저장된 셀 피처(STORED_FEATURES)를 셀 기준으로 결합 (순위화 시와 동일한 피처 구성)
+    """
+    truths = ground_truths.set_index("episode_id")
+    frames = []
+    for episode in episodes.itertuples():
+        if episode.episode_id not in truths.index:
+            continue
+        truth = truths.loc[episode.episode_id]
+        cells = candidate_cells(episode.last_seen_lat, episode.last_seen_lon, k_ring)
+        cell_lats, cell_lons = cells_to_latlng(cells)
+        frame = pd.DataFrame(query_features(
+            cell_lats, cell_lons,
+            episode.last_seen_lat, episode.last_seen_lon,
+            pd.Timestamp(episode.last_seen_time).to_pydatetime()
+        ))
+        frame["cell"] = cells
+        frame["label"] = (cells == h3i.latlng_to_cell(truth.gt_lat, truth.gt_lon, H3_RESOLUTION)).astype(int)
+        frames.append(frame)
+    train = pd.concat(frames, ignore_index=True)
+
+    if feature_store is not None:
+        cells = np.unique(train["cell"].to_numpy())
+        stored = feature_store.read(cells, columns=STORED_FEATURES).set_index("cell")
+        for name in STORED_FEATURES:
+            if name in stored.columns:
+                values = pd.to_numeric(stored[name], errors="coerce")
+                train[name] = values.reindex(train["cell"].to_numpy()).to_numpy(dtype=np.float64, na_value=np.nan)
+    return train
+
+
+if __name__ == "__main__":
+    import sys
+    import tempfile
+    import time
+
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from src.data.mock_data import MockDataGenerator
+    from src.data.station_index import StationIndex
+
+    generator = MockDataGenerator(seed=42)
+    episodes = generator.generate_episode_frame(200)
+    truths = generator.generate_ground_truth_frame(episodes)
+    workdir = Path(tempfile.mkdtemp())
+
+    # 후보 셀 coverage 피처를 저장소에 기록 후 학습 데이터에 결합
+    store = FeatureStore(workdir / "features")
+    cells = np.unique(build_training_frame(episodes, truths)["cell"].to_numpy())
+    coverage = StationIndex(generator.generate_base_stations("지리산", 500)).coverage_features(*cells_to_latlng(cells))
+    coverage.insert(0, "cell", cells)
+    store.write("coverage", coverage[["cell"] + FEATURE_FAMILIES["coverage"]])
+
+    train = build_training_frame(episodes, truths, feature_store=store)
+    booster = train_ranker(train, train["label"].values, num_boost_round=100)
+    model_path = workdir / "search_ranker.txt"
+    booster.save_model(str(model_path))
+    print(f"학습 피처: {booster.feature_name()}")
+
+    ranker = SearchRanker.load(model_path, feature_store=store)
+    # k=57 → 후보 9,919셀
+    ranker.rank(35.33, 127.73, k_ring=57)
+    rounds = 20
+    started = time.perf_counter()
+    for _ in range(rounds):
+        top = ranker.rank(35.33, 127.73, datetime(2026, 7, 4, 14), k_ring=57, top_k=20)
+    print(f"후보 9,919셀 순위화: {(time.perf_counter() - started) / rounds * 1000:.1f} ms/요청")
+    print(top.head())